@@ -1,6 +1,9 @@
 import yaml
 from pathlib import Path
 
+# Raiz do projeto: caminhos relativos do config.yaml são resolvidos a partir dela
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 class ConfigProject:
     _instance = None
     
@@ -8,7 +11,7 @@ class ConfigProject:
         # O new é chamado antes do INIT
         if cls._instance is None:
             cls._instance = super(ConfigProject, cls).__new__(cls)
-            base_path = Path(__file__).parent.parent.parent / config_path
+            base_path = PROJECT_ROOT / config_path
 
             cls._instance.__load_config(base_path)
         return cls._instance
@@ -61,8 +61,8 @@ class PreprocessingPage:
         self.type_database = st.selectbox("Tipo do Dataset", ("base", "complete"))
         self.type_strategy = st.selectbox(
             "Selecionar Estratégia de Balanceamento",
-            ("Smote", "RandomOverSampler", "RandomUnderSampler", "Combined Sampling", "Sem Balanceamento"),
-            index=4,
+            ("Smote", "Smote Rápido", "RandomOverSampler", "RandomUnderSampler", "Combined Sampling", "Pesos por Amostra", "Balanceamento com Orçamento", "Sem Balanceamento"),
+            index=7,
         )
         col1, col2, _ = st.columns(3)
         with col1:
@@ -126,9 +126,12 @@ class PreprocessingPage:
         
         strategies = {
             "Smote": 'smote',
+            "Smote Rápido": 'fast_smote',
             "RandomOverSampler": 'random_over',
             "RandomUnderSampler": 'random_under',
             "Combined Sampling": 'combined',
+            "Pesos por Amostra": 'sample_weight',
+            "Balanceamento com Orçamento": 'budgeted',
         }
         
         st.warning(f"ESTRATÉGIA: {self.type_strategy}")
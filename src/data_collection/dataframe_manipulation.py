@@ -1,5 +1,7 @@
 import pandas as pd
 
+from preprocessing.kernels import parse_br_numeric
+
 class DataFrameManipulation:
     
     @staticmethod
@@ -10,7 +12,4 @@ class DataFrameManipulation:
     
     @staticmethod
     def convert_numeric(series: pd.Series) -> pd.Series:
-        if series.dtype == 'object':
-            series = series.astype(str).str.strip()
-            series = series.str.replace(',','.')
-        return pd.to_numeric(series, errors='coerce')
\ No newline at end of file
+        return parse_br_numeric(series)
\ No newline at end of file
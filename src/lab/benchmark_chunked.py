@@ -0,0 +1,96 @@
+# Uso (a partir de src/): python -m lab.benchmark_chunked [n_linhas] [chunk_size]
+import logging
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from lab.synthetic_data import gerar_datatran
+from pipelines.chunked_execution import MERGED_CSV_OPTIONS, ChunkedPreprocessor
+from pipelines.memory_tracker import StageMemoryTracker
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def gravar_csv(n_rows: int, pasta: Path) -> Path:
+    """Grava o dataset sintético no formato do CSV unificado."""
+    caminho = pasta / f"datatran_sintetico_{n_rows}.csv"
+    gerar_datatran(n_rows).to_csv(caminho, index=False, **MERGED_CSV_OPTIONS)
+    return caminho
+
+
+def feature_engineering_sem_checkpoint() -> FeatureEngineering:
+    return FeatureEngineering(checkpoint_writer=CheckpointWriter(enabled=False))
+
+
+def executar_sequencial(caminho: Path) -> pd.DataFrame:
+    """Execução original: lê o CSV inteiro e aplica as etapas sobre o dataset completo."""
+    df = pd.read_csv(caminho, **MERGED_CSV_OPTIONS)
+    df = DataCleaning().apply(df)
+    df = DataStandardize().padronizar_dataset(df)
+    return feature_engineering_sem_checkpoint().criar_todas_features(df)
+
+
+def executar_em_blocos(caminho: Path, chunk_size: int) -> pd.DataFrame:
+    """Execução em blocos lidos diretamente do CSV."""
+    return ChunkedPreprocessor(feature_engineer=feature_engineering_sem_checkpoint(), chunk_size=chunk_size).run(caminho)
+
+
+def verificar_equivalencia(pasta: Path, n_rows: int = 50_000) -> None:
+    """Garante que a execução em blocos reproduz exatamente a execução sequencial."""
+    caminho = gravar_csv(n_rows, pasta)
+    esperado = executar_sequencial(caminho)
+    for chunk_size in (1_000, 7_777, n_rows * 2):
+        pd.testing.assert_frame_equal(executar_em_blocos(caminho, chunk_size), esperado)
+    logger.info(f"Equivalência verificada em {n_rows} linhas")
+
+
+def medir(modo: str, caminho: str, chunk_size: int) -> None:
+    """Executa um modo e registra tempo e pico de RSS (chamado em um processo separado)."""
+    logging.getLogger().setLevel(logging.WARNING)
+    tracker = StageMemoryTracker()
+    inicio = time.perf_counter()
+    with tracker.track(modo):
+        if modo == 'sequencial':
+            df = executar_sequencial(Path(caminho))
+        else:
+            df = executar_em_blocos(Path(caminho), chunk_size)
+    print(f"{modo}: {time.perf_counter() - inicio:.2f}s, pico de RSS {tracker.peak_mb():.0f} MB, shape {df.shape}")
+
+
+def benchmark(pasta: Path, n_rows: int, chunk_size: int) -> None:
+    """Compara tempo e pico de memória das duas execuções, cada uma em um processo novo."""
+    caminho = gravar_csv(n_rows, pasta)
+    logger.info(f"CSV sintético com {n_rows} linhas: {caminho.stat().st_size / 1024 ** 2:.0f} MB")
+    for modo in ('sequencial', 'blocos'):
+        subprocess.run(
+            [sys.executable, '-m', 'lab.benchmark_chunked', '--medir', modo, str(caminho), str(chunk_size)],
+            check=True
+        )
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+    
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    with tempfile.TemporaryDirectory() as pasta:
+        verificar_equivalencia(Path(pasta))
+        benchmark(Path(pasta), n_rows, chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Uso (a partir de src/): python -m lab.benchmark_column_parallel [n_linhas] [max_threads]
+import logging
+import os
+import sys
+import time
+
+import pandas as pd
+
+from lab.synthetic_data import gerar_datatran
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_encoding_04 import DataEncoding
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.rules_engine import RuleEngine
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+TARGET = 'gravidade_acidente'
+
+
+def medir(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def benchmark(n_rows: int, max_workers: int) -> pd.DataFrame:
+    """
+    Mede as etapas por coluna com 1 a max_workers threads e verifica que o resultado
+    (valores e ordem das colunas) é idêntico ao da execução com uma thread.
+    """
+    limpo = DataCleaning().apply(gerar_datatran(n_rows))
+    # Colunas numéricas como texto, como chegam dos CSVs da PRF
+    limpo_texto = limpo.astype({col: str for col in ['km', 'pessoas', 'mortos', 'feridos_leves', 'feridos_graves',
+                                                      'ilesos', 'ignorados', 'veiculos']})
+    features = FeatureEngineering(checkpoint_writer=CheckpointWriter(enabled=False)).criar_todas_features(
+        DataStandardize().padronizar_dataset(limpo)
+    )
+
+    resultados = []
+    esperado = {}
+    for workers in range(1, max_workers + 1):
+        padronizador = DataStandardize(rules=RuleEngine(workers=workers))
+        numericos, tempo_numericos = medir(padronizador.padronizar_valores_numericos, limpo_texto)
+
+        encoding = DataEncoding(workers=workers)
+        _, tempo_fit = medir(encoding.fit, features, TARGET)
+        codificado, tempo_transform = medir(encoding.transform, features, TARGET)
+
+        if workers == 1:
+            esperado = {'numericos': numericos, 'codificado': codificado}
+        else:
+            pd.testing.assert_frame_equal(numericos, esperado['numericos'])
+            pd.testing.assert_frame_equal(codificado, esperado['codificado'])
+
+        resultados.append({
+            'threads': workers,
+            'numericos_s': tempo_numericos,
+            'encoding_fit_s': tempo_fit,
+            'encoding_transform_s': tempo_transform
+        })
+
+    return pd.DataFrame(resultados)
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    tabela = benchmark(n_rows, max_workers)
+    logger.info(f"Paralelismo por coluna com {n_rows} linhas ({os.cpu_count()} CPUs):\n{tabela.to_string(index=False)}")
+
+
+if __name__ == "__main__":
+    main()
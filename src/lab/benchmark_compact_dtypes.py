@@ -0,0 +1,66 @@
+# Uso (a partir de src/): python -m lab.benchmark_compact_dtypes [n_linhas]
+import logging
+import sys
+import time
+
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from lab.synthetic_data import gerar_datatran
+from pipelines.preprocessing_pipeline import PreprocessingPipeline
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def medir_modelo(modelo, X_train, y_train, X_test) -> dict:
+    inicio = time.perf_counter()
+    modelo.fit(X_train, y_train)
+    tempo_fit = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    modelo.predict(X_test)
+    return {'fit_s': tempo_fit, 'predict_s': time.perf_counter() - inicio}
+
+
+def benchmark(n_rows: int) -> pd.DataFrame:
+    """Compara memória do treino balanceado (SMOTE) e tempo das árvores entre float64 e dtypes compactos."""
+    df = gerar_datatran(n_rows)
+
+    resultados = []
+    for compact in (False, True):
+        pipeline = PreprocessingPipeline(
+            collect_new_data=False, balance_strategy='smote', checkpoints=False, compact_dtypes=compact
+        )
+        X_train, _, X_test, y_train, _, _ = pipeline.process_data(df)
+
+        linha = {
+            'modo': 'compacto' if compact else 'float64',
+            'X_train_mb': X_train.memory_usage(deep=True).sum() / 1024 ** 2,
+            'linhas_treino': len(X_train)
+        }
+        for nome, modelo in (
+            ('dt', DecisionTreeClassifier(random_state=42)),
+            ('rf', RandomForestClassifier(n_estimators=50, random_state=42, n_jobs=-1))
+        ):
+            tempos = medir_modelo(modelo, X_train, y_train, X_test)
+            linha.update({f'{nome}_{chave}': valor for chave, valor in tempos.items()})
+        resultados.append(linha)
+
+    return pd.DataFrame(resultados)
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    logging.getLogger().setLevel(logging.WARNING)
+
+    tabela = benchmark(n_rows)
+    logger.warning(f"Dtypes compactos com {n_rows} linhas:\n{tabela.to_string(index=False)}")
+
+
+if __name__ == "__main__":
+    main()
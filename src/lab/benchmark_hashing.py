@@ -0,0 +1,86 @@
+# Uso (a partir de src/): python -m lab.benchmark_hashing [n_linhas]
+import logging
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from lab.synthetic_data import gerar_datatran
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_encoding_04 import DataEncoding
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.kernels import hash_buckets
+from preprocessing.sparse_features import SparseEncodedFrame
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+TARGET = 'gravidade_acidente'
+COLUMNS = ['municipio', 'uop']
+
+
+def memoria_mb(saida) -> float:
+    if isinstance(saida, SparseEncodedFrame):
+        return saida.memory_mb()
+    return saida.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def medir(train: pd.DataFrame, test: pd.DataFrame, n_buckets: int, sparse_onehot: bool) -> dict:
+    """Ajusta o DataEncoding no treino e codifica o teste (n_buckets=0: Target Encoding nas colunas)."""
+    hashing_columns = {col: n_buckets for col in COLUMNS} if n_buckets else {}
+    encoder = DataEncoding(sparse_onehot=sparse_onehot, hashing_columns=hashing_columns)
+
+    inicio = time.perf_counter()
+    encoder.fit_transform(train, TARGET)
+    tempo_fit = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    saida = encoder.transform(test, TARGET)
+    tempo_transform = time.perf_counter() - inicio
+
+    colisoes = 0
+    for col in encoder.hashing_features:
+        uniques = pd.Series(train[col].unique())
+        colisoes += len(uniques) - len(np.unique(hash_buckets(uniques, n_buckets)))
+
+    return {
+        'estrategia': f'hashing ({n_buckets} buckets)' if n_buckets else 'target encoding',
+        'esparso': sparse_onehot,
+        'fit_s': tempo_fit,
+        'transform_s': tempo_transform,
+        'colunas': saida.shape[1],
+        'memoria_teste_mb': memoria_mb(saida),
+        'valores_em_colisao': colisoes
+    }
+
+
+def benchmark(n_rows: int) -> pd.DataFrame:
+    """Compara Target Encoding e Feature Hashing nas colunas de alta cardinalidade."""
+    df = DataCleaning().apply(gerar_datatran(n_rows, completo=True), persist=False)
+    df = FeatureEngineering(checkpoint_writer=CheckpointWriter(enabled=False)).criar_todas_features(DataStandardize().padronizar_dataset(df))
+    df = df.sample(frac=1.0, random_state=0)
+    train, test = df.iloc[:int(len(df) * 0.8)], df.iloc[int(len(df) * 0.8):]
+
+    return pd.DataFrame([
+        medir(train, test, n_buckets, sparse_onehot)
+        for n_buckets in (0, 64, 256)
+        for sparse_onehot in (False, True)
+    ])
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    logging.getLogger().setLevel(logging.WARNING)
+
+    tabela = benchmark(n_rows)
+    logger.warning(f"Codificação de {COLUMNS} com {n_rows} linhas:\n{tabela.to_string(index=False)}")
+
+
+if __name__ == "__main__":
+    main()
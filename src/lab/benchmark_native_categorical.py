@@ -0,0 +1,76 @@
+# Uso (a partir de src/): python -m lab.benchmark_native_categorical [n_linhas]
+import logging
+import sys
+import time
+
+import pandas as pd
+from catboost import CatBoostClassifier
+from sklearn.metrics import f1_score
+
+from lab.synthetic_data import gerar_datatran
+from pipelines.memory_tracker import RssSampler, current_rss
+from pipelines.preprocessing_pipeline import PreprocessingPipeline
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+def medir(df: pd.DataFrame, native_categorical: bool, iterations: int) -> dict:
+    """Pré-processa (sem balanceamento) e treina o CatBoost na matriz codificada ou nativa."""
+    preprocessing = PreprocessingPipeline(
+        collect_new_data=False,
+        balance_strategy=None,
+        use_cache=False,
+        checkpoints=False,
+        native_categorical=native_categorical
+    )
+    inicio = time.perf_counter()
+    X_train, _, X_test, y_train, _, y_test = preprocessing.process_data(df)
+    tempo_preprocessamento = time.perf_counter() - inicio
+
+    cat_features = preprocessing.categorical_features or None
+    model = CatBoostClassifier(iterations=iterations, random_seed=42, verbose=False, thread_count=-1)
+
+    sampler = RssSampler()
+    rss_inicio = current_rss()
+    sampler.start()
+    inicio = time.perf_counter()
+    model.fit(X_train, y_train, cat_features=cat_features)
+    tempo_fit = time.perf_counter() - inicio
+    pico = sampler.stop()
+
+    return {
+        'modo': 'nativo (cat_features)' if native_categorical else 'codificado (OneHot + Target)',
+        'colunas': X_train.shape[1],
+        'X_train_mb': X_train.memory_usage(deep=True).sum() / _MB,
+        'preprocessamento_s': tempo_preprocessamento,
+        'fit_s': tempo_fit,
+        'pico_fit_mb': (pico - rss_inicio) / _MB if None not in (pico, rss_inicio) else None,
+        'f1_weighted_teste': f1_score(y_test, model.predict(X_test).ravel(), average='weighted')
+    }
+
+
+def benchmark(n_rows: int, iterations: int = 200) -> pd.DataFrame:
+    """Compara o CatBoost na matriz do DataEncoding com o CatBoost nas colunas categóricas nativas."""
+    df = gerar_datatran(n_rows, completo=True)
+    return pd.DataFrame([
+        medir(df, native_categorical, iterations)
+        for native_categorical in (False, True)
+    ])
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    logging.getLogger().setLevel(logging.WARNING)
+
+    tabela = benchmark(n_rows)
+    logger.warning(f"CatBoost com {n_rows} linhas:\n{tabela.to_string(index=False)}")
+
+
+if __name__ == "__main__":
+    main()
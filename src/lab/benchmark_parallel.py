@@ -0,0 +1,70 @@
+# Uso (a partir de src/): python -m lab.benchmark_parallel [n_linhas] [max_processos]
+import logging
+import os
+import sys
+import time
+
+import pandas as pd
+
+from lab.synthetic_data import gerar_datatran
+from pipelines.parallel_execution import ParallelPreprocessor
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def feature_engineering_sem_checkpoint() -> FeatureEngineering:
+    return FeatureEngineering(checkpoint_writer=CheckpointWriter(enabled=False))
+
+
+def executar_sequencial(df: pd.DataFrame) -> pd.DataFrame:
+    """Execução original, em um único processo sobre o dataset completo."""
+    df = DataCleaning().apply(df)
+    df = DataStandardize().padronizar_dataset(df)
+    return feature_engineering_sem_checkpoint().criar_todas_features(df)
+
+
+def executar_paralelo(df: pd.DataFrame, n_jobs: int) -> pd.DataFrame:
+    return ParallelPreprocessor(feature_engineer=feature_engineering_sem_checkpoint(), n_jobs=n_jobs).run(df)
+
+
+def benchmark(n_rows: int, max_jobs: int) -> pd.DataFrame:
+    """
+    Mede o tempo de 1 a max_jobs processos e verifica que todas as execuções
+    reproduzem exatamente a execução sequencial.
+    """
+    df = gerar_datatran(n_rows)
+
+    inicio = time.perf_counter()
+    esperado = executar_sequencial(df)
+    tempo_sequencial = time.perf_counter() - inicio
+
+    resultados = [{'processos': 'sequencial', 'tempo_s': tempo_sequencial, 'speedup': 1.0}]
+    for n_jobs in range(1, max_jobs + 1):
+        inicio = time.perf_counter()
+        obtido = executar_paralelo(df, n_jobs)
+        tempo = time.perf_counter() - inicio
+
+        pd.testing.assert_frame_equal(obtido, esperado)
+        resultados.append({'processos': n_jobs, 'tempo_s': tempo, 'speedup': tempo_sequencial / tempo})
+
+    return pd.DataFrame(resultados)
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    tabela = benchmark(n_rows, max_jobs)
+    logger.info(f"Escalabilidade com {n_rows} linhas ({os.cpu_count()} CPUs):\n{tabela.to_string(index=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Uso (a partir de src/): python -m lab.benchmark_severity
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from preprocessing.kernels import classify_severity
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def classificar_gravidade_linha(row) -> str:
+    """Implementação original (linha a linha), usada como base de comparação do tempo."""
+    if row['mortos'] > 0:
+        return 'fatal'
+    elif row['feridos_graves'] > 1 or row['feridos_leves']>= 3:
+        return 'grave'
+    elif row['feridos_leves'] > 0 or row['feridos_graves'] == 1:
+        return 'moderado'
+    else:
+        return 'leve'
+
+
+def gerar_vitimas(n_rows: int, random_state: int = 42) -> pd.DataFrame:
+    """Gera colunas de vítimas com distribuição próxima à dos dados da PRF."""
+    rng = np.random.default_rng(random_state)
+    return pd.DataFrame({
+        'ilesos': rng.integers(0, 5, n_rows),
+        'feridos_leves': rng.choice([0, 0, 0, 1, 1, 2, 3, 4], n_rows),
+        'feridos_graves': rng.choice([0, 0, 0, 0, 1, 2], n_rows),
+        'mortos': rng.choice([0] * 9 + [1, 2], n_rows),
+    })
+
+
+def benchmark(n_rows: int = 1_000_000) -> dict:
+    """Mede o tempo das duas implementações para n_rows linhas."""
+    df = gerar_vitimas(n_rows)
+    
+    inicio = time.perf_counter()
+    df.apply(classificar_gravidade_linha, axis=1)
+    tempo_linha = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    classify_severity(df)
+    tempo_vetorizado = time.perf_counter() - inicio
+    
+    resultado = {
+        'linhas': n_rows,
+        'apply_s': tempo_linha,
+        'vetorizado_s': tempo_vetorizado,
+        'speedup': tempo_linha / tempo_vetorizado
+    }
+    logger.info(
+        f"{n_rows} linhas: apply={tempo_linha:.2f}s, vetorizado={tempo_vetorizado:.4f}s "
+        f"({resultado['speedup']:.0f}x)"
+    )
+    return resultado
+
+
+def main():
+    # A equivalência com a regra original é verificada em tests/test_severity.py
+    benchmark(1_000_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# Uso (a partir de src/): python -m lab.benchmark_sparse_onehot [n_linhas]
+import logging
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from lab.synthetic_data import gerar_datatran
+from pipelines.preprocessing_pipeline import PreprocessingPipeline
+from preprocessing.sparse_features import sparse_memory_mb
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Limites de categorias para OneHot: o padrão do DataEncoding e um limite alto,
+# que leva municipio e uop para o OneHot (cardinalidade alta)
+ONEHOT_LIMITS = (5, 250)
+
+
+def tamanho_mb(X) -> float:
+    if isinstance(X, pd.DataFrame):
+        return X.memory_usage(deep=True).sum() / 1024 ** 2
+    return sparse_memory_mb(X)
+
+
+def medir_modelo(modelo, X_train, y_train, X_test, y_test) -> dict:
+    inicio = time.perf_counter()
+    modelo.fit(X_train, y_train)
+    tempo_fit = time.perf_counter() - inicio
+    acuracia = float(np.mean(modelo.predict(X_test) == y_test.to_numpy()))
+    return {'fit_s': tempo_fit, 'acc': acuracia}
+
+
+def benchmark(n_rows: int) -> pd.DataFrame:
+    """Compara o caminho denso (float64) e o esparso (CSR) do encoding até o fit das árvores, no dataset 'complete'."""
+    df = gerar_datatran(n_rows, completo=True)
+
+    resultados = []
+    for limite in ONEHOT_LIMITS:
+        for sparse_onehot in (False, True):
+            pipeline = PreprocessingPipeline(
+                collect_new_data=False, dataset_type='complete', checkpoints=False,
+                track_memory=True, sparse_onehot=sparse_onehot
+            )
+            pipeline.pipeline.set_params(encoding__max_categories_onehot=limite)
+
+            inicio = time.perf_counter()
+            X_train, _, X_test, y_train, _, y_test = pipeline.process_data(df)
+            tempo = time.perf_counter() - inicio
+            pico = {r['stage']: r['peak_delta_mb'] for r in pipeline.memory_tracker.records}
+
+            linha = {
+                'onehot_max': limite,
+                'modo': 'csr' if sparse_onehot else 'denso',
+                'features': len(pipeline.feature_names),
+                'pre_s': tempo,
+                'encoding_pico_mb': pico['encoding'],
+                'split_pico_mb': pico['split'],
+                'X_train_mb': tamanho_mb(X_train)
+            }
+            for nome, modelo in (
+                ('dt', DecisionTreeClassifier(random_state=42)),
+                ('rf', RandomForestClassifier(n_estimators=50, random_state=42, n_jobs=-1))
+            ):
+                metricas = medir_modelo(modelo, X_train, y_train, X_test, y_test)
+                linha.update({f'{nome}_{chave}': valor for chave, valor in metricas.items()})
+            resultados.append(linha)
+
+    return pd.DataFrame(resultados)
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    logging.getLogger().setLevel(logging.WARNING)
+
+    tabela = benchmark(n_rows)
+    logger.warning(f"OneHot denso x CSR com {n_rows} linhas (dataset complete):\n{tabela.to_string(index=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Uso (a partir de src/): python -m lab.benchmark_target_encoding [n_linhas]
+import logging
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import TargetEncoder
+
+from lab.synthetic_data import gerar_datatran
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.target_encoding import BatchedTargetEncoder
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+TARGET = 'gravidade_acidente'
+COLUMNS = ['municipio', 'tipo_acidente', 'causa_acidente_grupo', 'latitude', 'longitude', 'uop']
+
+
+def codificacao_por_coluna(train: pd.DataFrame, test: pd.DataFrame) -> dict:
+    """Referência: um TargetEncoder do scikit-learn por coluna e média das saídas por classe."""
+    inicio = time.perf_counter()
+    encoders = {col: TargetEncoder().fit(train[[col]], train[TARGET]) for col in COLUMNS}
+    tempo_fit = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    saida = {col: encoders[col].transform(test[[col]]).mean(axis=1) for col in COLUMNS}
+    tempo_transform = time.perf_counter() - inicio
+
+    return {
+        'fit_s': tempo_fit,
+        'transform_s': tempo_transform,
+        'colunas': len(saida),
+        'desvio_medio': float(np.mean([values.std() for values in saida.values()]))
+    }
+
+
+def codificacao_em_lote(train: pd.DataFrame, test: pd.DataFrame) -> dict:
+    """BatchedTargetEncoder: ajuste em uma passada (com cross-fitting) e busca vetorizada."""
+    encoder = BatchedTargetEncoder()
+    inicio = time.perf_counter()
+    encoder.fit_transform(train, COLUMNS, train[TARGET])
+    tempo_fit = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    saida = {col: encoder.transform_column(test[col], col) for col in COLUMNS}
+    tempo_transform = time.perf_counter() - inicio
+
+    return {
+        'fit_s': tempo_fit,
+        'transform_s': tempo_transform,
+        'colunas': sum(values.shape[1] for values in saida.values()),
+        'desvio_medio': float(np.mean([values.std(axis=0).mean() for values in saida.values()]))
+    }
+
+
+def benchmark(n_rows: int) -> pd.DataFrame:
+    """Compara o Target Encoding por coluna (scikit-learn, média das classes) com o encoder em lote."""
+    df = DataCleaning().apply(gerar_datatran(n_rows, completo=True), persist=False)
+    df = FeatureEngineering(checkpoint_writer=CheckpointWriter(enabled=False)).criar_todas_features(DataStandardize().padronizar_dataset(df))
+    df = df.sample(frac=1.0, random_state=0)
+    train, test = df.iloc[:int(len(df) * 0.8)], df.iloc[int(len(df) * 0.8):]
+
+    return pd.DataFrame([
+        {'engine': 'sklearn por coluna (média)', **codificacao_por_coluna(train, test)},
+        {'engine': 'lote por classe (cross-fit)', **codificacao_em_lote(train, test)}
+    ])
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    logging.getLogger().setLevel(logging.WARNING)
+
+    tabela = benchmark(n_rows)
+    logger.warning(f"Target Encoding com {n_rows} linhas ({len(COLUMNS)} colunas):\n{tabela.to_string(index=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,17 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional
+
+import numpy as np
 
 import optuna
 import pandas as pd
-from sklearn.model_selection import cross_val_score
 from catboost import CatBoostClassifier
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.tree import DecisionTreeClassifier
+from model.cv_folds import CVFolds, FoldStore, cross_val_score_folds
+from model.model_trainer import categorical_fit_params, sample_weight_fit_params
 from pipelines.preprocessing_pipeline import PreprocessingPipeline
 
 class ModelOptimizer:
@@ -31,10 +34,19 @@ class ModelOptimizer:
         self.studies = {}
         
     def optimize_decision_tree(self, X: pd.DataFrame, y: pd.Series, 
-                             n_trials: int = 100) -> Dict:
+                             n_trials: int = 100,
+                             folds: Optional[CVFolds] = None,
+                             sample_weight: Optional[np.ndarray] = None) -> Dict:
         """
         Otimiza hiperparâmetros para Decision Tree
+        
+        Args:
+            folds: Dobras compartilhadas entre os trials (padrão: FoldStore do config.yaml)
+            sample_weight: Pesos das amostras de X (balance_strategy='sample_weight')
         """
+        if folds is None:
+            folds = FoldStore.from_config().prepare(X, y)
+
         def objective(trial):
             params = {
                 'max_depth': trial.suggest_int('max_depth', 3, 30),
@@ -45,7 +57,8 @@ class ModelOptimizer:
             }
             
             model = DecisionTreeClassifier(**params, random_state=42)
-            score = cross_val_score(model, X, y, cv=5, scoring='f1_weighted')
+            score = cross_val_score_folds(model, X, y, folds, scoring='f1_weighted',
+                                          params=sample_weight_fit_params(model, sample_weight) or None)
             return score.mean()
         
         study = optuna.create_study(direction='maximize')
@@ -55,10 +68,19 @@ class ModelOptimizer:
         return study.best_params
         
     def optimize_random_forest(self, X: pd.DataFrame, y: pd.Series, 
-                             n_trials: int = 100) -> Dict:
+                             n_trials: int = 100,
+                             folds: Optional[CVFolds] = None,
+                             sample_weight: Optional[np.ndarray] = None) -> Dict:
         """
         Otimiza hiperparâmetros para Random Forest
+        
+        Args:
+            folds: Dobras compartilhadas entre os trials (padrão: FoldStore do config.yaml)
+            sample_weight: Pesos das amostras de X (balance_strategy='sample_weight')
         """
+        if folds is None:
+            folds = FoldStore.from_config().prepare(X, y)
+
         def objective(trial):
             params = {
                 'n_estimators': trial.suggest_int('n_estimators', 50, 300),
@@ -72,7 +94,8 @@ class ModelOptimizer:
             }
             
             model = RandomForestClassifier(**params, random_state=42)
-            score = cross_val_score(model, X, y, cv=5, scoring='f1_weighted')
+            score = cross_val_score_folds(model, X, y, folds, scoring='f1_weighted',
+                                          params=sample_weight_fit_params(model, sample_weight) or None)
             return score.mean()
         
         study = optuna.create_study(direction='maximize')
@@ -82,10 +105,21 @@ class ModelOptimizer:
         return study.best_params
     
     def optimize_catboost(self, X: pd.DataFrame, y: pd.Series, 
-                         n_trials: int = 100) -> Dict:
+                         n_trials: int = 100,
+                         cat_features: Optional[List[str]] = None,
+                         folds: Optional[CVFolds] = None,
+                         sample_weight: Optional[np.ndarray] = None) -> Dict:
         """
         Otimiza hiperparâmetros para CatBoost
+        
+        Args:
+            cat_features: Colunas categóricas nativas de X (PreprocessingPipeline com native_categorical)
+            folds: Dobras compartilhadas entre os trials (padrão: FoldStore do config.yaml)
+            sample_weight: Pesos das amostras de X (balance_strategy='sample_weight')
         """
+        if folds is None:
+            folds = FoldStore.from_config().prepare(X, y, materialize=not cat_features)
+
         def objective(trial):
             params = {
                 'iterations': trial.suggest_int('iterations', 50, 300),
@@ -98,7 +132,9 @@ class ModelOptimizer:
             }
             
             model = CatBoostClassifier(**params, random_state=42)
-            score = cross_val_score(model, X, y, cv=5, scoring='f1_weighted')
+            score = cross_val_score_folds(model, X, y, folds, scoring='f1_weighted',
+                                          params={**categorical_fit_params(model, cat_features),
+                                                  **sample_weight_fit_params(model, sample_weight)} or None)
             return score.mean()
         
         study = optuna.create_study(direction='maximize')
@@ -138,26 +174,45 @@ class ModelOptimizer:
         self.logger.info(f"Resultados da otimização salvos em: {model_dir}")
     
     def optimize_all_models(self, X: pd.DataFrame, y: pd.Series, 
-                          n_trials: int = 100) -> Dict[str, Dict]:
+                          n_trials: int = 100,
+                          cat_features: Optional[List[str]] = None,
+                          sample_weight: Optional[np.ndarray] = None) -> Dict[str, Dict]:
         """
         Otimiza todos os modelos baseados em árvore
+        
+        Args:
+            cat_features: Colunas categóricas nativas de X. Com elas, só os modelos com
+                suporte nativo a categorias (CatBoost) são otimizados
+            sample_weight: Pesos das amostras de X (PreprocessingPipeline.sample_weight),
+                usados no fit dos modelos sem class_weight próprio
         """
         optimization_results = {}
         
+        # Dobras calculadas (e materializadas) uma vez para todos os modelos e trials
+        folds = FoldStore.from_config().prepare(X, y, materialize=not cat_features)
+        
+        if cat_features:
+            self.logger.info("Otimizando CatBoost (categorias nativas)...")
+            cb_params = self.optimize_catboost(X, y, n_trials, cat_features, folds, sample_weight)
+            self.save_optimization_results('CatBoost', cb_params, self.studies['CatBoost'])
+            optimization_results['CatBoost'] = cb_params
+            self.save_comparison_summary(optimization_results)
+            return optimization_results
+        
         self.logger.info("Otimizando Decision Tree...")
-        dt_params = self.optimize_decision_tree(X, y, n_trials)
+        dt_params = self.optimize_decision_tree(X, y, n_trials, folds, sample_weight)
         self.save_optimization_results('Decision Tree', dt_params, 
                                      self.studies['Decision Tree'])
         optimization_results['Decision Tree'] = dt_params
         
         self.logger.info("Otimizando Random Forest...")
-        rf_params = self.optimize_random_forest(X, y, n_trials)
+        rf_params = self.optimize_random_forest(X, y, n_trials, folds, sample_weight)
         self.save_optimization_results('Random Forest', rf_params, 
                                      self.studies['Random Forest'])
         optimization_results['Random Forest'] = rf_params
         
         self.logger.info("Otimizando CatBoost...")
-        cb_params = self.optimize_catboost(X, y, n_trials)
+        cb_params = self.optimize_catboost(X, y, n_trials, folds=folds, sample_weight=sample_weight)
         self.save_optimization_results('CatBoost', cb_params, 
                                      self.studies['CatBoost'])
         optimization_results['CatBoost'] = cb_params
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+DIAS_SEMANA = [
+    'Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado', 'Domingo', 'domingo',
+    'segunda-feira', 'terça-feira', 'quarta-feira', 'quinta-feira', 'sexta-feira', 'sábado'
+]
+
+# Causas e pesos aproximados; inclui uma causa rara para exercitar o agrupamento em 'outros'
+CAUSAS = {
+    'Falta de atenção': 30, 'Velocidade incompatível': 20, 'Animais na Pista': 10,
+    'Defeito na via': 8, 'Ingestão de álcool': 8, 'Dormindo': 5, 'Chuva': 5, 'Outras': 10,
+    'Desobediência à sinalização': 1, 'Causa não catalogada': 3, 'Causa rara': 0.001
+}
+
+
+def gerar_datatran(n_rows: int, random_state: int = 0, duplicadas: float = 0.02, completo: bool = False) -> pd.DataFrame:
+    """
+    Gera um dataset sintético com o layout do dataset unificado da PRF (DatasetMerger).
+
+    Usado pelos benchmarks do lab para medir o pré-processamento sem depender dos
+    arquivos baixados. Inclui linhas duplicadas e valores nulos no formato dos dados reais.
+
+    Args:
+        n_rows: Número de linhas (antes das duplicatas)
+        random_state: Semente do gerador
+        duplicadas: Fração de linhas repetidas ao final do dataset
+        completo: Inclui as colunas extras do dataset 'complete' (coordenadas, regional,
+            delegacia e UOP)
+
+    Returns:
+        DataFrame no formato do dataset 'base' (ou 'complete')
+    """
+    rng = np.random.default_rng(random_state)
+    pesos = np.array(list(CAUSAS.values()))
+
+    def contagem(valores):
+        return pd.array(rng.choice(valores, n_rows), dtype='Int64')
+
+    horas = rng.integers(0, 24, n_rows)
+    minutos = rng.integers(0, 60, n_rows)
+
+    df = pd.DataFrame({
+        'id': np.arange(n_rows),
+        'data_inversa': pd.Timestamp('2007-01-01') + pd.to_timedelta(rng.integers(0, 6500, n_rows), unit='D'),
+        'dia_semana': rng.choice(DIAS_SEMANA, n_rows),
+        'horario': [f'{h:02d}:{m:02d}:00' for h, m in zip(horas, minutos)],
+        'uf': 'MA',
+        'br': contagem([10, 135, 222, 316, 230, 226]),
+        'km': np.round(rng.uniform(0, 600, n_rows), 1),
+        'municipio': rng.choice([f'MUNICIPIO {i}' for i in range(200)], n_rows),
+        'causa_acidente': rng.choice(list(CAUSAS), n_rows, p=pesos / pesos.sum()),
+        'tipo_acidente': rng.choice(['Colisão traseira', 'Saída de pista', 'Capotamento', 'Atropelamento',
+                                     'Colisão frontal', 'Tombamento', 'Queda'], n_rows),
+        'classificacao_acidente': rng.choice(['Sem Vítimas', 'Com Vítimas Feridas', 'Com Vítimas Fatais'], n_rows),
+        'fase_dia': rng.choice(['Pleno dia', 'Plena noite', 'Anoitecer', 'Amanhecer'], n_rows),
+        'sentido_via': rng.choice(['Crescente', 'Decrescente'], n_rows),
+        'condicao_metereologica': rng.choice(['Céu Claro', 'Chuva', 'Nublado', 'Sol', 'Garoa/Chuvisco'], n_rows),
+        'tipo_pista': rng.choice(['Simples', 'Dupla', 'Múltipla'], n_rows),
+        'tracado_via': rng.choice(['Reta', 'Curva'], n_rows),
+        'uso_solo': rng.choice(['Rural', 'Urbano', 'Sim', 'Não'], n_rows),
+        'pessoas': contagem(range(1, 6)),
+        'mortos': contagem([0] * 9 + [1, 2]),
+        'feridos_leves': contagem([0, 0, 0, 1, 1, 2, 3, 4]),
+        'feridos_graves': contagem([0, 0, 0, 0, 1, 2]),
+        'ilesos': contagem(range(0, 4)),
+        'ignorados': contagem([0, 1]),
+        'feridos': contagem(range(0, 5)),
+        'veiculos': contagem(range(1, 4)),
+    })
+
+    if completo:
+        # Coordenadas no formato dos arquivos da PRF (texto com vírgula decimal)
+        delegacias = rng.integers(1, 6, n_rows)
+        df = df.assign(
+            latitude=[f'{v:.6f}'.replace('.', ',') for v in rng.uniform(-10.0, -1.0, n_rows)],
+            longitude=[f'{v:.6f}'.replace('.', ',') for v in rng.uniform(-48.5, -41.5, n_rows)],
+            regional='SPRF-MA',
+            delegacia=[f'DEL{d:02d}-MA' for d in delegacias],
+            uop=[f'UOP{u:02d}-DEL{d:02d}-MA' for u, d in zip(rng.integers(1, 4, n_rows), delegacias)]
+        )
+
+    df = pd.concat([df, df.iloc[:int(n_rows * duplicadas)]], ignore_index=True)
+    df.loc[df.index[::997], 'municipio'] = '(null)'
+    return df
@@ -0,0 +1,207 @@
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import BaseEstimator, clone
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import StratifiedKFold, cross_val_score
+
+from config.config_project import PROJECT_ROOT, ConfigProject
+from config.inject_logger import inject_logger
+from preprocessing.split_indices import target_fingerprint
+
+
+@dataclass
+class FoldArrays:
+    """Treino e validação de uma dobra, já separados (X memory-mapped)."""
+    X_train: np.ndarray
+    y_train: np.ndarray
+    X_valid: np.ndarray
+    y_valid: np.ndarray
+
+
+@inject_logger
+class CVFolds:
+    """
+    Dobras estratificadas de um conjunto de treino, compartilhadas entre a validação
+    cruzada dos modelos e os trials da otimização.
+
+    As dobras são as mesmas do cross_val_score(cv=n_splits) de classificadores
+    (StratifiedKFold sem embaralhar), então os scores não mudam. Com materialize,
+    o treino e a validação de cada dobra são gravados uma única vez em arquivos
+    .npy contíguos e lidos com memory-map, sem uma nova cópia de X a cada modelo
+    ou trial (inclusive em processos de trabalho do joblib, que recebem o mapa).
+    """
+
+    def __init__(self, fold_ids: np.ndarray, n_splits: int):
+        """
+        Args:
+            fold_ids: Dobra de validação de cada linha
+            n_splits: Número de dobras
+        """
+        self.fold_ids = fold_ids
+        self.n_splits = n_splits
+        self.arrays: Optional[List[FoldArrays]] = None
+        self._splits = None
+        self._tmp_dir = None
+
+    def __len__(self) -> int:
+        return self.n_splits
+
+    @property
+    def splits(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Posições (treino, validação) de cada dobra, no formato aceito por cv do scikit-learn."""
+        if self._splits is None:
+            self._splits = [
+                (np.flatnonzero(self.fold_ids != fold), np.flatnonzero(self.fold_ids == fold))
+                for fold in range(self.n_splits)
+            ]
+        return self._splits
+
+    def materialize(self, X: pd.DataFrame, y: pd.Series, directory: Union[str, Path]) -> None:
+        """
+        Grava X de treino e validação de cada dobra em .npy e os abre com memory-map.
+
+        Os arquivos ficam em um diretório temporário dentro de directory, removido
+        quando as dobras são descartadas.
+        """
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self._tmp_dir = tempfile.TemporaryDirectory(dir=directory, prefix='folds_')
+        values = X.to_numpy(dtype=np.result_type(*X.dtypes))
+        targets = np.asarray(y)
+
+        arrays = []
+        for fold, (train, valid) in enumerate(self.splits):
+            mapped = {}
+            for name, positions in (('train', train), ('valid', valid)):
+                path = os.path.join(self._tmp_dir.name, f"X_{name}_{fold}.npy")
+                np.save(path, values[positions])
+                mapped[name] = np.load(path, mmap_mode='r')
+            arrays.append(FoldArrays(mapped['train'], targets[train], mapped['valid'], targets[valid]))
+        del values
+
+        self.arrays = arrays
+        size_mb = sum(a.X_train.nbytes + a.X_valid.nbytes for a in arrays) / 1024 ** 2
+        self.logger.info(f"Dobras da validação cruzada gravadas em {self._tmp_dir.name} ({size_mb:.1f} MB, memory-map)")
+
+
+@inject_logger
+class FoldStore:
+    """
+    Atribuição das linhas às dobras, persistida por fingerprint do target.
+
+    Cada arquivo (.npy) guarda a dobra de cada linha do conjunto de treino; execuções
+    e sessões de otimização seguintes sobre o mesmo conjunto reaproveitam a divisão.
+    """
+
+    def __init__(self, fold_dir: Union[str, Path], materialize: bool = False):
+        """
+        Args:
+            fold_dir: Diretório das dobras salvas (e dos arquivos temporários de materialize)
+            materialize: Grava treino e validação de cada dobra (ver CVFolds.materialize)
+        """
+        self.fold_dir = Path(fold_dir)
+        self.fold_dir.mkdir(parents=True, exist_ok=True)
+        self.materialize = materialize
+
+    @classmethod
+    def from_config(cls) -> 'FoldStore':
+        """Cria o store com cv.fold_dir e cv.materialize do config.yaml."""
+        config = ConfigProject()
+        return cls(
+            PROJECT_ROOT / config.get("cv.fold_dir", "./files/cache/folds/"),
+            materialize=bool(config.get("cv.materialize", False))
+        )
+
+    def get_folds(self, y: pd.Series, n_splits: int = 5) -> CVFolds:
+        """Carrega ou calcula as dobras estratificadas de y."""
+        fingerprint = target_fingerprint(y)
+        key = hashlib.sha256(repr((fingerprint, n_splits)).encode()).hexdigest()
+        path = self.fold_dir / f"{key}.npy"
+
+        if path.exists():
+            fold_ids = np.load(path)
+            self.logger.info(f"Dobras da validação cruzada carregadas de {path}")
+            return CVFolds(fold_ids, n_splits)
+
+        fold_ids = np.empty(len(y), dtype=np.int8)
+        splitter = StratifiedKFold(n_splits=n_splits)
+        for fold, (_, valid) in enumerate(splitter.split(np.zeros(len(y)), y)):
+            fold_ids[valid] = fold
+
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            np.save(f, fold_ids)
+        os.replace(tmp_path, path)
+        self.logger.info(f"Dobras da validação cruzada salvas em {path}")
+        return CVFolds(fold_ids, n_splits)
+
+    def prepare(self, X, y: pd.Series, n_splits: Optional[int] = None, materialize: bool = True) -> CVFolds:
+        """
+        Dobras de (X, y) prontas para cross_val_score_folds.
+
+        As dobras só são materializadas para X denso e numérico (DataFrame), e se
+        materialize for True aqui e no store; nos outros casos (CSR, colunas
+        categóricas nativas) a validação cruzada usa as posições das dobras.
+
+        Args:
+            n_splits: Número de dobras (padrão: cv.n_splits do config.yaml)
+            materialize: Permite materializar as dobras (ex.: False com cat_features,
+                que precisam das colunas do DataFrame)
+        """
+        if n_splits is None:
+            n_splits = ConfigProject().get("cv.n_splits", 5)
+        folds = self.get_folds(y, n_splits)
+
+        numeric = isinstance(X, pd.DataFrame) and all(pd.api.types.is_numeric_dtype(dtype) for dtype in X.dtypes)
+        if self.materialize and materialize and numeric:
+            folds.materialize(X, y, self.fold_dir)
+        return folds
+
+
+def cross_val_score_folds(
+    estimator: BaseEstimator,
+    X,
+    y: pd.Series,
+    folds: CVFolds,
+    scoring: str = 'f1_weighted',
+    params: Optional[Dict] = None,
+    n_jobs: Optional[int] = None
+) -> np.ndarray:
+    """
+    Equivalente a cross_val_score sobre dobras compartilhadas.
+
+    Com dobras materializadas, cada dobra é ajustada e avaliada diretamente nos
+    arrays memory-mapped; sem elas, cross_val_score recebe as posições das dobras.
+    Parâmetros de fit alinhados às amostras (ex.: sample_weight) são recortados
+    pelas posições de treino de cada dobra, como no cross_val_score.
+
+    Returns:
+        Score de cada dobra
+    """
+    if folds.arrays is None:
+        return cross_val_score(estimator, X, y, cv=folds.splits, scoring=scoring, params=params, n_jobs=n_jobs)
+
+    scorer = check_scoring(estimator, scoring)
+
+    def fit_and_score(arrays: FoldArrays, train: np.ndarray) -> float:
+        fold_params = {
+            key: np.asarray(value)[train] if _is_sample_aligned(value, len(y)) else value
+            for key, value in (params or {}).items()
+        }
+        model = clone(estimator).fit(arrays.X_train, arrays.y_train, **fold_params)
+        return scorer(model, arrays.X_valid, arrays.y_valid)
+
+    return np.array(Parallel(n_jobs=n_jobs)(
+        delayed(fit_and_score)(arrays, train) for arrays, (train, _) in zip(folds.arrays, folds.splits)
+    ))
+
+
+def _is_sample_aligned(value, n_samples: int) -> bool:
+    return isinstance(value, (np.ndarray, pd.Series)) and len(value) == n_samples
@@ -2,7 +2,7 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -51,9 +51,13 @@ class ModelResultsSaver:
   def save_plots(self, model: BaseEstimator, model_name: str, 
                   y_test: pd.Series, y_pred: np.ndarray,
                   classes: List[str], X_test: pd.DataFrame,
-                  confusion_matrix_func, feature_importance_func) -> None:
+                  confusion_matrix_func, feature_importance_func,
+                  feature_names: Optional[List[str]] = None) -> None:
         """
         Salva visualizações do modelo
+        
+        Args:
+            feature_names: Nomes das features, quando X_test não é um DataFrame (ex.: matriz CSR)
         """
         model_dir = self.get_model_dir(model_name)
         
@@ -70,7 +74,7 @@ class ModelResultsSaver:
         if hasattr(model, 'feature_importances_') and feature_importance_func:
             plt.figure(figsize=(12, 8))
             importances = pd.DataFrame({
-                'feature': X_test.columns,
+                'feature': X_test.columns if feature_names is None else feature_names,
                 'importance': model.feature_importances_
             })
             importances = importances.sort_values('importance', ascending=False).head(20)
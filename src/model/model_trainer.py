@@ -1,25 +1,73 @@
+import inspect
 import logging
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import cross_val_score
 from sklearn.base import BaseEstimator
+from model.cv_folds import CVFolds, cross_val_score_folds
 from model.model_evaluator import ModelEvaluator
 from model.tree_model_evaluator import TreeModelEvaluator  # Changed import
 from config.inject_logger import inject_logger
 
+def categorical_fit_params(model: BaseEstimator, cat_features: Optional[List[str]]) -> Dict:
+    """
+    Parâmetros de fit com as colunas categóricas nativas, para modelos cujo fit
+    aceita cat_features (CatBoost); vazio para os demais.
+    """
+    if cat_features and 'cat_features' in inspect.signature(model.fit).parameters:
+        return {'cat_features': list(cat_features)}
+    return {}
+
+def sample_weight_fit_params(model: BaseEstimator, sample_weight: Optional[np.ndarray]) -> Dict:
+    """
+    Parâmetros de fit com os pesos por amostra (balance_strategy='sample_weight').
+
+    Modelos que já balanceiam as classes com class_weight (ex.: Decision Tree e Random
+    Forest com class_weight='balanced') não recebem os pesos, que seriam aplicados
+    em dobro; o mesmo para modelos cujo fit não aceita sample_weight.
+    """
+    if sample_weight is None or 'sample_weight' not in inspect.signature(model.fit).parameters:
+        return {}
+    if model.get_params().get('class_weight') is not None:
+        return {}
+    return {'sample_weight': sample_weight}
+
 @inject_logger
 class ModelTrainer:
     """Classe responsável pelo treinamento dos modelos"""
     
-    def __init__(self, model: BaseEstimator, name: str):
+    def __init__(
+        self,
+        model: BaseEstimator,
+        name: str,
+        cat_features: Optional[List[str]] = None,
+        sample_weight: Optional[np.ndarray] = None
+    ):
+        """
+        Args:
+            model: Modelo a ser treinado
+            name: Nome do modelo
+            cat_features: Colunas de códigos categóricos (PreprocessingPipeline com
+                native_categorical), passadas ao fit dos modelos que as aceitam
+            sample_weight: Pesos das amostras de treino (PreprocessingPipeline com
+                balance_strategy='sample_weight'), passados ao fit e à validação cruzada
+        """
         self.model = model
         self.name = name
         self.evaluator = ModelEvaluator()
         self.tree_evaluator = TreeModelEvaluator()  # Adiciona o avaliador de árvores
+        self.fit_params = categorical_fit_params(model, cat_features)
+        if cat_features and not self.fit_params:
+            self.logger.warning(f"{name} não aceita cat_features; os códigos categóricos serão tratados como ordinais")
+        weight_params = sample_weight_fit_params(model, sample_weight)
+        if sample_weight is not None and not weight_params:
+            self.logger.info(f"{name} não recebe sample_weight (class_weight próprio ou fit sem sample_weight)")
+        self.fit_params.update(weight_params)
     
     def train(self, X_train: pd.DataFrame, y_train: pd.Series) -> BaseEstimator:
         self.logger.info(f"Iniciando treinamento do modelo {self.name}...")
-        self.model.fit(X_train, y_train)
+        self.model.fit(X_train, y_train, **self.fit_params)
         self.logger.info(f"Treinamento do modelo {self.name} finalizado")
         return self.model
     
@@ -51,11 +99,20 @@ class ModelTrainer:
         X: pd.DataFrame,
         y: pd.Series,
         cv: int = 5,
-        scoring: str = 'f1_weighted'
+        scoring: str = 'f1_weighted',
+        folds: Optional[CVFolds] = None
     ) -> Tuple[float, float]:
+        """
+        Args:
+            folds: Dobras compartilhadas (FoldStore.prepare); substituem cv
+        """
         self.logger.info(f"Realizando validação cruzada do modelo {self.name}...")
         
-        scores = cross_val_score(self.model, X, y, cv=cv, scoring=scoring)
+        if folds is not None:
+            cv = len(folds)
+            scores = cross_val_score_folds(self.model, X, y, folds, scoring=scoring, params=self.fit_params or None)
+        else:
+            scores = cross_val_score(self.model, X, y, cv=cv, scoring=scoring, params=self.fit_params or None)
         
         self.logger.info(f"Resultados da validação cruzada ({cv} folds):")
         self.logger.info(f"- Média {scoring}: {scores.mean():.4f} (+/- {scores.std() * 2:.4f})")
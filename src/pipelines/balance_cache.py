@@ -0,0 +1,66 @@
+import hashlib
+from pathlib import Path
+from typing import Any, Tuple
+
+import pandas as pd
+
+from config.inject_logger import inject_logger
+from pipelines.stage_cache import DATA_FILE, StageCache, code_version
+from preprocessing.kernels import compute_frame_fingerprint
+from preprocessing.split_indices import target_fingerprint
+
+TARGET_FILE = "target.parquet"
+# Nome da coluna do target no Parquet quando y não tem nome
+UNNAMED_TARGET = "__target__"
+
+
+@inject_logger
+class BalanceCache(StageCache):
+    """
+    Cache em disco dos treinos balanceados (DataBalance.balance_data).
+
+    A chave combina o fingerprint de X e de y, o nome e os parâmetros da estratégia,
+    o random_state e a versão do código do pré-processamento. X e y são gravados em
+    Parquet; o tamanho total é limitado por max_size_mb com remoção LRU, como no
+    StageCache.
+    """
+
+    def balance_key(self, X: pd.DataFrame, y: pd.Series, strategy: str, balancing_strategy: Any, random_state: int) -> str:
+        """
+        Calcula a chave do treino balanceado.
+
+        Os parâmetros da estratégia são os atributos públicos da instância (inclusive
+        os lidos do config.yaml, ex.: balancing.fast_smote e balancing.budget).
+        """
+        params = sorted(
+            (name, repr(value)) for name, value in vars(balancing_strategy).items()
+            if not name.startswith('_') and name != 'logger'
+        )
+        payload = repr((
+            compute_frame_fingerprint(X), target_fingerprint(y), y.name,
+            strategy, type(balancing_strategy).__name__, params, random_state, code_version()
+        ))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def load_balanced(self, key: str) -> Tuple[pd.DataFrame, pd.Series]:
+        """Carrega X e y balanceados."""
+        entry = self.cache_dir / key
+        X = pd.read_parquet(entry / DATA_FILE)
+        y = pd.read_parquet(entry / TARGET_FILE).iloc[:, 0]
+        if y.name == UNNAMED_TARGET:
+            y.name = None
+        return X, y
+
+    def save_balanced(self, key: str, X: pd.DataFrame, y: pd.Series) -> None:
+        """Grava X e y balanceados e aplica o limite de tamanho."""
+        def write(tmp_entry: Path) -> None:
+            X.to_parquet(tmp_entry / DATA_FILE)
+            y.to_frame(name=y.name if y.name is not None else UNNAMED_TARGET).to_parquet(tmp_entry / TARGET_FILE)
+
+        self._write_entry(key, write)
+
+    def log_stats(self) -> None:
+        self.logger.info(
+            f"Cache de balanceamento: {self.stats['hits']} hits, {self.stats['misses']} misses, "
+            f"{self.stats['evictions']} remoções, {self.size_mb():.1f} MB em {self.cache_dir}"
+        )
@@ -0,0 +1,213 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config.inject_logger import inject_logger
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.kernels import FingerprintIndex
+from preprocessing.rules_engine import RuleEngine
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Opções de leitura do CSV unificado (ver DatasetMerger.save_merged_dataset)
+MERGED_CSV_OPTIONS = {'sep': ';', 'encoding': 'utf-8-sig'}
+
+# Fonte de blocos: chamada a cada passada, devolve um novo iterador de DataFrames
+ChunkSource = Callable[[], Iterator[pd.DataFrame]]
+
+# Parâmetros calculados sobre o dataset inteiro, por etapa e regra (ver RuleEngine.run)
+Statistics = Dict[str, Dict[str, Dict]]
+
+
+def iter_frame_chunks(df: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Divide um DataFrame em blocos consecutivos de até chunk_size linhas."""
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def iter_csv_chunks(
+    path: Union[str, Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **read_options
+) -> Iterator[pd.DataFrame]:
+    """Lê um CSV (por padrão no formato do dataset unificado) em blocos de chunk_size linhas."""
+    with pd.read_csv(path, chunksize=chunk_size, **{**MERGED_CSV_OPTIONS, **read_options}) as reader:
+        yield from reader
+
+
+def concat_chunks(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatena blocos processados mantendo as colunas categóricas.
+
+    Cada bloco tem suas próprias categorias (na ordem de aparição dentro do bloco).
+    As categorias são unidas na ordem de primeira aparição entre os blocos, o que
+    reproduz exatamente as categorias da execução sobre o dataset inteiro.
+    """
+    frames = list(chunks)
+    if not frames:
+        return pd.DataFrame()
+
+    for col in frames[0].columns:
+        dtypes = [frame[col].dtype for frame in frames]
+        if not isinstance(dtypes[0], pd.CategoricalDtype) or all(d == dtypes[0] for d in dtypes):
+            continue
+
+        categories = pd.unique(np.concatenate([np.asarray(d.categories, dtype=object) for d in dtypes]))
+        dtype = pd.CategoricalDtype(categories, ordered=dtypes[0].ordered)
+        for frame in frames:
+            frame[col] = frame[col].astype(dtype)
+
+    return pd.concat(frames)
+
+
+@inject_logger
+class ChunkedPreprocessor:
+    """
+    Executa limpeza, padronização e feature engineering em blocos de linhas.
+
+    As três etapas são locais a cada linha, exceto por dois estados globais,
+    resolvidos sem materializar o dataset inteiro:
+    - duplicatas: um índice de fingerprints em memória (8 bytes por linha mantida)
+      remove as linhas já vistas em blocos anteriores;
+    - regras com frequência mínima (ex.: causas raras): uma pré-passada sobre os
+      dados limpos conta os valores das colunas de origem, e as contagens globais
+      substituem as de cada bloco.
+
+    O resultado é idêntico ao da execução sequencial sobre o dataset inteiro. As
+    colunas de origem das regras com frequência mínima devem vir dos dados brutos
+    (as contagens são feitas após a limpeza, antes da padronização).
+    """
+
+    def __init__(
+        self,
+        cleaner: Optional[DataCleaning] = None,
+        standardizer: Optional[DataStandardize] = None,
+        feature_engineer: Optional[FeatureEngineering] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        self.cleaner = cleaner or DataCleaning()
+        self.standardizer = standardizer or DataStandardize()
+        self.feature_engineer = feature_engineer or FeatureEngineering()
+        self.chunk_size = chunk_size
+        # Estatísticas globais usadas na última execução (ver collect_statistics)
+        self.statistics: Statistics = {}
+
+    def _stages(self) -> List[Tuple[str, RuleEngine]]:
+        return [
+            (DataStandardize.STAGE, self.standardizer.rules),
+            (FeatureEngineering.STAGE, self.feature_engineer.rules)
+        ]
+
+    def frequency_rules(self) -> Dict[str, Dict[str, str]]:
+        """Regras com frequência mínima por etapa: {etapa: {nome da regra: coluna de origem}}."""
+        return {stage: rules.frequency_rules(stage) for stage, rules in self._stages()}
+
+    def build_statistics(self, counts: Dict[str, pd.Series]) -> Statistics:
+        """Monta os overrides do RuleEngine a partir das contagens globais por coluna de origem."""
+        return {
+            stage: {
+                name: {'frequencies': counts.get(column, pd.Series(dtype='int64')).astype('int64').to_dict()}
+                for name, column in rules.items()
+            }
+            for stage, rules in self.frequency_rules().items()
+        }
+
+    def collect_statistics(self, source: ChunkSource) -> Statistics:
+        """
+        Pré-passada: limpa cada bloco e conta os valores das colunas usadas por
+        regras com frequência mínima.
+
+        Args:
+            source: Fonte de blocos
+
+        Returns:
+            Parâmetros por etapa e regra, no formato de overrides do RuleEngine
+        """
+        columns = {column for rules in self.frequency_rules().values() for column in rules.values()}
+        if not columns:
+            return {}
+
+        self.logger.info(f"Pré-passada de estatísticas globais: {sorted(columns)}")
+        seen = FingerprintIndex()
+        counts: Dict[str, pd.Series] = {column: pd.Series(dtype='int64') for column in columns}
+        for chunk in source():
+            chunk = self.cleaner.apply(chunk, seen=seen, persist=False)
+            for column in columns:
+                if column in chunk.columns:
+                    counts[column] = counts[column].add(chunk[column].value_counts(), fill_value=0)
+
+        return self.build_statistics(counts)
+
+    def stream(self, source: ChunkSource, statistics: Optional[Statistics] = None) -> Iterator[pd.DataFrame]:
+        """
+        Processa os blocos da fonte um a um, como um gerador.
+
+        Args:
+            source: Fonte de blocos
+            statistics: Resultado de collect_statistics (calculado se não informado)
+
+        Yields:
+            Blocos limpos, padronizados e com as novas features
+        """
+        if statistics is None:
+            statistics = self.collect_statistics(source)
+        self.statistics = statistics
+
+        seen = FingerprintIndex()
+        for chunk in source():
+            chunk = self.cleaner.apply(chunk, seen=seen, persist=False)
+            yield self.apply_rules(chunk, statistics)
+
+        self.persist_fingerprints(seen.fingerprints)
+
+    def apply_rules(self, chunk: pd.DataFrame, statistics: Statistics) -> pd.DataFrame:
+        """Aplica as regras de padronização e feature engineering a um bloco já limpo."""
+        for stage, rules in self._stages():
+            chunk = rules.run(chunk, stage, overrides=statistics.get(stage))
+        return chunk
+
+    def persist_fingerprints(self, fingerprints: np.ndarray) -> None:
+        """
+        Registra as linhas mantidas como pendentes do índice persistido (carga incremental).
+
+        O índice é gravado por run ao final (commit=True) ou por quem controla a execução
+        completa (ex.: PreprocessingPipeline), com cleaner.commit_fingerprints.
+        """
+        if self.cleaner.fingerprint_index is not None:
+            self.cleaner.pending_fingerprints.update(fingerprints)
+
+    def run(self, source: Union[ChunkSource, pd.DataFrame, str, Path], commit: bool = True) -> pd.DataFrame:
+        """
+        Processa a fonte inteira em blocos e concatena o resultado.
+
+        Args:
+            source: Fonte de blocos, DataFrame ou caminho do CSV unificado
+            commit: Grava o índice de fingerprints ao final. False quando há etapas
+                posteriores (o chamador grava após concluí-las, ver persist_fingerprints)
+
+        Returns:
+            DataFrame equivalente a limpeza + padronização + feature engineering sequenciais
+        """
+        try:
+            df = concat_chunks(self.stream(self.as_source(source)))
+        except Exception:
+            self.cleaner.rollback_fingerprints()
+            raise
+        self.logger.info(f"Execução em blocos de {self.chunk_size} linhas concluída. Shape: {df.shape}")
+
+        self.feature_engineer.salvar_dataset(df, FeatureEngineering.CHECKPOINT_NAME)
+        if commit:
+            self.cleaner.commit_fingerprints()
+        return df
+
+    def as_source(self, source: Union[ChunkSource, pd.DataFrame, str, Path]) -> ChunkSource:
+        """Converte um DataFrame ou caminho de CSV em uma fonte de blocos."""
+        if isinstance(source, pd.DataFrame):
+            return lambda: iter_frame_chunks(source, self.chunk_size)
+        if isinstance(source, (str, Path)):
+            return lambda: iter_csv_chunks(source, self.chunk_size)
+        return source
@@ -0,0 +1,108 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from config.inject_logger import inject_logger
+
+try:
+    import psutil
+except ImportError:  # psutil é opcional; em Linux o RSS é lido de /proc
+    psutil = None
+
+_MB = 1024 * 1024
+
+
+def current_rss() -> Optional[int]:
+    """Retorna o RSS atual do processo em bytes (None se não for possível medir)."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class RssSampler:
+    """
+    Amostra o RSS do processo em uma thread de fundo e guarda o maior valor observado.
+
+    O pico de memória do processo (ru_maxrss) não pode ser reiniciado entre etapas,
+    por isso o pico de cada etapa é obtido por amostragem periódica.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self.peak = None
+        self._stop.clear()
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[int]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+        return self.peak
+
+
+@inject_logger
+class StageMemoryTracker:
+    """
+    Registra o RSS inicial, final e de pico de cada etapa do pipeline.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.records: List[Dict] = []
+
+    @contextmanager
+    def track(self, stage: str) -> Iterator[Dict]:
+        """
+        Mede o uso de memória do bloco executado dentro do contexto.
+
+        O registro da etapa é devolvido pelo contexto e preenchido ao final do bloco.
+        """
+        sampler = RssSampler(self.interval)
+        record = {'stage': stage}
+        rss_start = current_rss()
+        sampler.start()
+        try:
+            yield record
+        finally:
+            peak = sampler.stop()
+            rss_end = current_rss()
+            record.update({
+                'rss_start_mb': rss_start / _MB if rss_start is not None else None,
+                'rss_end_mb': rss_end / _MB if rss_end is not None else None,
+                'rss_peak_mb': peak / _MB if peak is not None else None,
+                'peak_delta_mb': (peak - rss_start) / _MB if None not in (peak, rss_start) else None
+            })
+            self.records.append(record)
+
+            if record['rss_peak_mb'] is not None:
+                self.logger.info(
+                    f"Memória [{stage}]: pico {record['rss_peak_mb']:.1f} MB "
+                    f"(+{record['peak_delta_mb']:.1f} MB), final {record['rss_end_mb']:.1f} MB"
+                )
+
+    def peak_mb(self) -> Optional[float]:
+        """Maior pico de RSS entre as etapas registradas."""
+        peaks = [r['rss_peak_mb'] for r in self.records if r['rss_peak_mb'] is not None]
+        return max(peaks) if peaks else None
@@ -3,9 +3,11 @@ import logging
 from typing import Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator
 
+from model.cv_folds import FoldStore
 from model.model_comparison_helper import ModelComparisonHelper
 from model.model_result_saver import ModelResultsSaver
 from model.model_trainer import ModelTrainer
@@ -21,15 +23,22 @@ class ModelingPipeline:
     """Classe principal para gerenciar o pipeline de modelagem"""
     
     def __init__(self, models: List[Tuple[str, BaseEstimator]], 
-                 output_dir: str = "model_results"):
+                 output_dir: str = "model_results",
+                 cat_features: Optional[List[str]] = None,
+                 sample_weight: Optional[np.ndarray] = None):
         """
         Inicializa o pipeline de modelagem
         
         Args:
             models: Lista de tuplas (nome_modelo, modelo)
             output_dir: Diretório para salvar os resultados
+            cat_features: Colunas categóricas nativas das matrizes X
+                (PreprocessingPipeline.categorical_features), passadas ao fit do CatBoost
+            sample_weight: Pesos das amostras de X_train (PreprocessingPipeline.sample_weight),
+                passados ao fit dos modelos sem class_weight próprio
         """
-        self.trainers = [ModelTrainer(model, name) for name, model in models]
+        self.trainers = [ModelTrainer(model, name, cat_features, sample_weight) for name, model in models]
+        self.cat_features = cat_features
         self.results = {}
         self.results_saver = ModelResultsSaver(output_dir)
         self.comparison_helper = ModelComparisonHelper()
@@ -46,11 +55,20 @@ class ModelingPipeline:
         y_train: pd.Series,
         y_valid: pd.Series,
         y_test: pd.Series,
-        classes: List[str]
+        classes: List[str],
+        feature_names: Optional[List[str]] = None
     ) -> Dict:
         """
         Executa o pipeline completo de modelagem e salva resultados
+        
+        Args:
+            feature_names: Nomes das features, quando X não é um DataFrame
+                (ex.: matrizes CSR de PreprocessingPipeline com sparse_onehot)
         """
+        # Dobras da validação cruzada calculadas uma vez para todos os modelos
+        # (materializadas só se os modelos não precisam das colunas categóricas no fit)
+        folds = FoldStore.from_config().prepare(X_train, y_train, materialize=not self.cat_features)
+        
         for trainer in self.trainers:
             logger.info(f"\nProcessando modelo: {trainer.name}")
             
@@ -63,7 +81,7 @@ class ModelingPipeline:
             test_metrics = trainer.evaluate(X_test, y_test, "teste")
             
             # Realiza validação cruzada
-            cv_mean, cv_std = trainer.cross_validate(X_train, y_train)
+            cv_mean, cv_std = trainer.cross_validate(X_train, y_train, folds=folds)
             
             # Gera predições para plots
             y_pred = model.predict(X_test)
@@ -125,7 +143,8 @@ class ModelingPipeline:
                     classes,
                     X_test,
                     trainer.evaluator.plot_confusion_matrix,
-                    feature_importance_func
+                    feature_importance_func,
+                    feature_names
                 )
             
             # Salva resumo do modelo
@@ -201,6 +220,32 @@ def create_tree_based_models(
     if rf_params:
         rf_default_params.update(rf_params)
     
+    # Create and return the list of models
+    models = [
+        ('Decision Tree', DecisionTreeClassifier(**dt_default_params)),
+        ('Random Forest', RandomForestClassifier(**rf_default_params)),
+        ('CatBoost', CatBoostClassifier(**_catboost_params(random_state, n_estimators, cb_params)))
+    ]
+    
+    return models
+
+def create_categorical_models(
+    random_state: int = 42,
+    n_estimators: int = 100,
+    cb_params: Optional[Dict] = None
+) -> List[Tuple[str, BaseEstimator]]:
+    """
+    Cria os modelos com suporte nativo a variáveis categóricas, para as matrizes do
+    PreprocessingPipeline com native_categorical (códigos inteiros, sem OneHot nem
+    Target Encoding). As colunas categóricas são passadas pelo ModelingPipeline (cat_features)
+    """
+    from catboost import CatBoostClassifier
+
+    return [
+        ('CatBoost', CatBoostClassifier(**_catboost_params(random_state, n_estimators, cb_params)))
+    ]
+
+def _catboost_params(random_state: int, n_estimators: int, cb_params: Optional[Dict]) -> Dict:
     cb_default_params = {
         'iterations': n_estimators,
         'random_seed': random_state,
@@ -214,15 +259,7 @@ def create_tree_based_models(
         if 'random_state' in cb_params:
             cb_params['random_seed'] = cb_params.pop('random_state')
         cb_default_params.update(cb_params)
-    
-    # Create and return the list of models
-    models = [
-        ('Decision Tree', DecisionTreeClassifier(**dt_default_params)),
-        ('Random Forest', RandomForestClassifier(**rf_default_params)),
-        ('CatBoost', CatBoostClassifier(**cb_default_params))
-    ]
-    
-    return models
+    return cb_default_params
 
 def main():
     """Exemplo de como usar o pipeline de modelagem com todos os modelos"""
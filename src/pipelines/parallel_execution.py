@@ -0,0 +1,258 @@
+import copy
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config.inject_logger import inject_logger
+from pipelines.chunked_execution import MERGED_CSV_OPTIONS, ChunkedPreprocessor, Statistics, concat_chunks
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.kernels import FingerprintIndex, compute_row_fingerprints
+
+# Partições por processo: mais partições que processos equilibram a carga
+PARTITIONS_PER_JOB = 4
+
+Bounds = Tuple[int, int]
+
+# Estado de cada processo do pool (preprocessador e DataFrame de entrada). Com o
+# método 'fork' o DataFrame é herdado do processo pai: as páginas de memória são
+# compartilhadas e a entrada não é serializada para os processos. Com 'spawn' ou
+# 'forkserver', o preprocessador e o DataFrame empacotado são serializados uma vez
+# por processo (ver _init_spawned_worker).
+_worker_state: Dict = {}
+
+START_METHODS = ['fork', 'forkserver', 'spawn']
+
+# Partição empacotada para transferência: DataFrame com as colunas texto codificadas
+# como dicionário (códigos + valores distintos) e a lista dessas colunas
+PackedFrame = Tuple[pd.DataFrame, List[str]]
+
+
+def pack_frame(df: pd.DataFrame) -> PackedFrame:
+    """
+    Codifica as colunas texto (object) como dicionário para enviar a partição entre processos.
+
+    Serializar milhões de strings Python é a parte mais cara da transferência; com a
+    codificação, só os códigos inteiros e os valores distintos são serializados.
+    Colunas com ausentes são enviadas sem codificação, para preservar None/NaN.
+    """
+    packed = {}
+    for column in df.columns:
+        if df[column].dtype == object:
+            codes, uniques = pd.factorize(df[column])
+            if len(codes) and codes.min() >= 0:
+                packed[column] = pd.Categorical.from_codes(codes, categories=uniques)
+    return (df.assign(**packed) if packed else df), list(packed)
+
+
+def unpack_frame(packed: PackedFrame) -> pd.DataFrame:
+    """Reverte pack_frame, restaurando as colunas texto originais."""
+    df, columns = packed
+    for column in columns:
+        df[column] = df[column].astype(object)
+    return df
+
+
+def _init_worker(processor: 'ParallelPreprocessor', df: pd.DataFrame, pack: bool = True) -> None:
+    _worker_state['processor'] = processor
+    _worker_state['df'] = df
+    _worker_state['pack'] = pack
+
+
+def _init_spawned_worker(processor: 'ParallelPreprocessor', packed: 'PackedFrame') -> None:
+    _init_worker(processor, unpack_frame(packed))
+
+
+def _partition(bounds: Bounds) -> pd.DataFrame:
+    start, stop = bounds
+    return _worker_state['df'].iloc[start:stop]
+
+
+def _scan_partition(bounds: Bounds, columns: List[str]) -> Tuple[np.ndarray, np.ndarray, Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Primeira passada: remove colunas irrelevantes e linhas com valores ausentes e
+    devolve as posições das linhas restantes, seus fingerprints e os valores
+    (códigos + valores distintos) das colunas usadas por regras com frequência mínima.
+    """
+    cleaner = _worker_state['processor'].cleaner
+    partition = _partition(bounds)
+
+    # Índice posicional para recuperar quais linhas da partição sobreviveram
+    partition = partition.set_axis(np.arange(len(partition)), axis=0, copy=False)
+    cleaned = cleaner.handle_missing_values(cleaner.remove_irrelevant_columns(partition))
+    fingerprints = compute_row_fingerprints(cleaned).to_numpy()
+
+    values = {}
+    for column in columns:
+        if column in cleaned.columns:
+            codes, uniques = pd.factorize(cleaned[column])
+            values[column] = (codes, np.asarray(uniques, dtype=object))
+    return cleaned.index.to_numpy(), fingerprints, values
+
+
+def _process_partition(bounds: Bounds, positions: np.ndarray, statistics: Statistics) -> PackedFrame:
+    """Segunda passada: mantém as linhas selecionadas e aplica as regras com estatísticas globais."""
+    processor = _worker_state['processor']
+    partition = processor.cleaner.remove_irrelevant_columns(_partition(bounds).iloc[positions])
+    result = processor.apply_rules(partition, statistics)
+    return pack_frame(result) if _worker_state['pack'] else (result, [])
+
+
+@inject_logger
+class ParallelPreprocessor(ChunkedPreprocessor):
+    """
+    Executa limpeza, padronização e feature engineering em partições de linhas,
+    em um pool de processos.
+
+    A execução tem duas passadas paralelas sobre as partições:
+    1. remoção de valores ausentes, devolvendo as linhas restantes, seus fingerprints
+       e os valores das colunas das regras com frequência mínima;
+    2. seleção das linhas mantidas e regras de padronização e feature engineering,
+       já com as duplicatas e as contagens globais resolvidas.
+
+    Entre as passadas, o processo pai resolve as duplicatas (primeira ocorrência de
+    cada fingerprint, na ordem das partições, e o índice de cargas anteriores) e soma
+    as contagens, de modo que o resultado é idêntico ao da execução sequencial,
+    independentemente do número de processos ou do tamanho das partições.
+    """
+
+    def __init__(
+        self,
+        cleaner: Optional[DataCleaning] = None,
+        standardizer: Optional[DataStandardize] = None,
+        feature_engineer: Optional[FeatureEngineering] = None,
+        n_jobs: Optional[int] = None,
+        partition_size: Optional[int] = None,
+        start_method: Optional[str] = None
+    ):
+        """
+        Args:
+            n_jobs: Número de processos (padrão: número de CPUs). Com 1, executa no próprio processo
+            partition_size: Linhas por partição (padrão: dataset dividido em PARTITIONS_PER_JOB * n_jobs)
+            start_method: Método de criação dos processos ('fork', 'forkserver' ou 'spawn').
+                Padrão: 'fork' quando disponível e o processo não tem outras threads ativas
+        """
+        super().__init__(cleaner, standardizer, feature_engineer)
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.partition_size = partition_size
+        if start_method is not None and start_method not in START_METHODS:
+            raise ValueError(f"Método de criação de processos inválido: {start_method}. "
+                             f"Use um dos seguintes: {START_METHODS}")
+        self.start_method = start_method
+
+    def _start_method(self) -> str:
+        """
+        Escolhe o método de criação dos processos.
+
+        O 'fork' compartilha o DataFrame sem serialização, mas só é seguro sem outras
+        threads ativas (ex.: a gravação de checkpoints em segundo plano ou pools de
+        threads do numpy/pandas), cujos locks seriam copiados para os processos filhos.
+        """
+        if self.start_method is not None:
+            return self.start_method
+        methods = multiprocessing.get_all_start_methods()
+        if 'fork' in methods and threading.active_count() == 1:
+            return 'fork'
+        return 'forkserver' if 'forkserver' in methods else 'spawn'
+
+    def _worker_copy(self) -> 'ParallelPreprocessor':
+        """Cópia enviada aos processos sem 'fork': sem os índices de fingerprints, usados só no pai."""
+        processor = copy.copy(self)
+        processor.cleaner = copy.copy(self.cleaner)
+        processor.cleaner.fingerprint_index = None
+        processor.cleaner.pending_fingerprints = FingerprintIndex()
+        return processor
+
+    def _partitions(self, n_rows: int) -> List[Bounds]:
+        size = self.partition_size or max(1, math.ceil(n_rows / (self.n_jobs * PARTITIONS_PER_JOB)))
+        return [(start, min(start + size, n_rows)) for start in range(0, n_rows, size)]
+
+    def _merge_scans(self, scans: List[Tuple]) -> Tuple[List[np.ndarray], np.ndarray, Statistics]:
+        """
+        Combina as primeiras passadas na ordem das partições.
+
+        Returns:
+            Posições das linhas mantidas por partição, fingerprints mantidos e estatísticas globais
+        """
+        fingerprints = np.concatenate([fp for _, fp, _ in scans]) if scans else np.empty(0, dtype=np.uint64)
+        keep = ~pd.Series(fingerprints).duplicated().to_numpy()
+        self.logger.info(f"Removidos {int((~keep).sum())} registros duplicados.")
+
+        index = self.cleaner.fingerprint_index
+        if index is not None:
+            already_seen = index.contains(fingerprints) & keep
+            keep &= ~already_seen
+            self.logger.info(f"Removidos {int(already_seen.sum())} registros já processados em cargas anteriores.")
+
+        keeps = np.split(keep, np.cumsum([len(fp) for _, fp, _ in scans])[:-1])
+
+        counts: Dict[str, pd.Series] = {}
+        for (_, _, values), partition_keep in zip(scans, keeps):
+            for column, (codes, uniques) in values.items():
+                kept = codes[partition_keep]
+                partition_counts = pd.Series(np.bincount(kept[kept >= 0], minlength=len(uniques)), index=uniques)
+                counts[column] = counts[column].add(partition_counts, fill_value=0) if column in counts else partition_counts
+
+        positions = [rows[partition_keep] for (rows, _, _), partition_keep in zip(scans, keeps)]
+        return positions, fingerprints[keep], self.build_statistics(counts)
+
+    def run(self, source: Union[pd.DataFrame, str, Path], commit: bool = True) -> pd.DataFrame:
+        """
+        Processa o dataset em partições paralelas.
+
+        Args:
+            source: DataFrame ou caminho do CSV unificado
+            commit: Grava o índice de fingerprints ao final (ver ChunkedPreprocessor.run)
+
+        Returns:
+            DataFrame equivalente a limpeza + padronização + feature engineering sequenciais
+        """
+        df = pd.read_csv(source, **MERGED_CSV_OPTIONS) if isinstance(source, (str, Path)) else source
+
+        partitions = self._partitions(len(df))
+        columns = sorted({column for rules in self.frequency_rules().values() for column in rules.values()})
+        self.logger.info(f"Execução paralela: {len(partitions)} partições em {self.n_jobs} processos")
+
+        if self.n_jobs == 1:
+            # No próprio processo não há transferência, então as partições não são empacotadas
+            _init_worker(self, df, pack=False)
+            try:
+                scans = list(map(_scan_partition, partitions, repeat(columns)))
+                positions, fingerprints, self.statistics = self._merge_scans(scans)
+                parts = list(map(_process_partition, partitions, positions, repeat(self.statistics)))
+            finally:
+                _worker_state.clear()
+        else:
+            # Gravações de checkpoint pendentes terminam antes da criação dos processos
+            self.feature_engineer.checkpoint_writer.flush()
+            start_method = self._start_method()
+            if start_method == 'fork':
+                initializer, initargs = _init_worker, (self, df)
+            else:
+                initializer, initargs = _init_spawned_worker, (self._worker_copy(), pack_frame(df))
+            self.logger.info(f"Processos criados com o método '{start_method}'")
+
+            context = multiprocessing.get_context(start_method)
+            with ProcessPoolExecutor(self.n_jobs, mp_context=context,
+                                     initializer=initializer, initargs=initargs) as pool:
+                scans = list(pool.map(_scan_partition, partitions, repeat(columns)))
+                positions, fingerprints, self.statistics = self._merge_scans(scans)
+                parts = list(pool.map(_process_partition, partitions, positions, repeat(self.statistics)))
+
+        result = concat_chunks(unpack_frame(part) for part in parts)
+        self.logger.info(f"Execução paralela concluída. Shape: {result.shape}")
+
+        self.feature_engineer.salvar_dataset(result, FeatureEngineering.CHECKPOINT_NAME)
+        self.persist_fingerprints(fingerprints)
+        if commit:
+            self.cleaner.commit_fingerprints()
+        return result
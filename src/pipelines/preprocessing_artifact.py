@@ -0,0 +1,177 @@
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import joblib
+import pandas as pd
+from scipy import sparse
+
+from config.config_project import PROJECT_ROOT, ConfigProject
+from config.inject_logger import inject_logger
+from pipelines.stage_cache import code_version
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.data_encoding_04 import DataEncoding
+from preprocessing.data_standardize_02 import DataStandardize
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.sparse_features import SparseEncodedFrame
+
+# Versão do formato do artefato; incrementada quando o conteúdo salvo muda de forma incompatível
+ARTIFACT_VERSION = 1
+
+TARGET_COLUMN = 'gravidade_acidente'
+
+
+def default_artifact_path() -> Path:
+    """Caminho padrão do artefato (artifact.path do config.yaml, relativo à raiz do projeto)."""
+    return PROJECT_ROOT / ConfigProject().get("artifact.path", "./files/artifacts/preprocessing.joblib")
+
+
+@inject_logger
+class PreprocessingArtifact:
+    """
+    Estado ajustado do pré-processamento, versionado e serializável, para scoring.
+
+    Reúne tudo o que o PreprocessingPipeline aprende com o dataset histórico:
+    - o DataEncoding ajustado (Label, OneHot e Target Encoding, colunas removidas);
+    - as frequências das regras com frequência mínima do feature engineering
+      (de onde saem as causas raras agrupadas por tratar_causas_acidente);
+    - a ordem e os dtypes finais das colunas das matrizes X.
+
+    Carregado com load, transforma novos registros brutos sem reajustar nada sobre
+    o dataset histórico. Limpeza e padronização não têm estado e são refeitas a
+    partir do código e do arquivo de regras; code_version registra a versão deles
+    no momento do ajuste.
+    """
+
+    def __init__(
+        self,
+        encoder: DataEncoding,
+        feature_statistics: Dict[str, Dict],
+        feature_names: List[str],
+        dtypes: Optional[Dict[str, str]] = None,
+        sparse_onehot: bool = False
+    ):
+        """
+        Args:
+            encoder: DataEncoding ajustado
+            feature_statistics: Frequências do feature engineering (FeatureEngineering.frequency_statistics)
+            feature_names: Colunas das matrizes X, na ordem final
+            dtypes: dtype de cada coluna de X (modo denso)
+            sparse_onehot: Gera matrizes CSR (ver DataEncoding.sparse_onehot)
+        """
+        self.version = ARTIFACT_VERSION
+        self.code_version = code_version()
+        self.created_at = datetime.now().isoformat(timespec='seconds')
+        self.encoder = encoder
+        self.feature_statistics = feature_statistics
+        self.feature_names = list(feature_names)
+        self.dtypes = dtypes
+        self.sparse_onehot = sparse_onehot
+        self._stages = None
+
+    def __getstate__(self):
+        # As etapas sem estado (regras compiladas) são recriadas após a leitura
+        state = self.__dict__.copy()
+        state['_stages'] = None
+        return state
+
+    def rare_values(self) -> Dict[str, List]:
+        """Valores agrupados como raros por regra (ex.: causas raras), segundo as frequências ajustadas."""
+        rules = {rule['name']: rule for rule in self._get_stages()[2].rules.spec.get(FeatureEngineering.STAGE, [])}
+        rare = {}
+        for name, params in self.feature_statistics.items():
+            min_frequency = rules.get(name, {}).get('min_frequency', 0)
+            rare[name] = sorted(str(v) for v, count in params['frequencies'].items() if count < min_frequency)
+        return rare
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Grava o artefato (joblib). A escrita é feita em um arquivo temporário renomeado
+        ao final, então um artefato existente nunca fica pela metade.
+
+        Returns:
+            Caminho do arquivo gravado
+        """
+        path = Path(path) if path is not None else default_artifact_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        joblib.dump(self, tmp_path)
+        os.replace(tmp_path, path)
+
+        self.logger.info(
+            f"Artefato de pré-processamento v{self.version} salvo em {path} "
+            f"({path.stat().st_size / 1024:.1f} KB, {len(self.feature_names)} features)"
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Optional[Union[str, Path]] = None) -> 'PreprocessingArtifact':
+        """
+        Carrega um artefato salvo com save.
+
+        Raises:
+            ValueError: Se o arquivo não é um artefato ou tem versão de formato incompatível
+        """
+        path = Path(path) if path is not None else default_artifact_path()
+        start = time.perf_counter()
+        artifact = joblib.load(path)
+
+        if not isinstance(artifact, cls):
+            raise ValueError(f"{path} não contém um artefato de pré-processamento")
+        if artifact.version != ARTIFACT_VERSION:
+            raise ValueError(
+                f"Artefato {path} na versão {artifact.version}; esta versão do código lê a versão {ARTIFACT_VERSION}"
+            )
+        if artifact.code_version != code_version():
+            cls.logger.warning(
+                "O código de pré-processamento (ou o arquivo de regras) mudou desde que o artefato foi gerado "
+                f"({artifact.created_at}); limpeza e padronização usam a versão atual"
+            )
+
+        cls.logger.info(f"Artefato de pré-processamento carregado de {path} em {(time.perf_counter() - start) * 1000:.1f} ms")
+        return artifact
+
+    def _get_stages(self):
+        if self._stages is None:
+            self._stages = (
+                # Scoring não usa o índice de cargas incrementais
+                DataCleaning(fingerprint_index_path=''),
+                DataStandardize(),
+                FeatureEngineering(checkpoint_writer=CheckpointWriter(enabled=False))
+            )
+        return self._stages
+
+    def _select_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            self.logger.warning(f"Colunas ausentes nos registros, preenchidas com 0: {missing}")
+        return df.reindex(columns=columns, fill_value=0)
+
+    def transform(self, df: pd.DataFrame) -> Union[pd.DataFrame, sparse.csr_matrix]:
+        """
+        Transforma registros brutos (layout do dataset unificado) na matriz de features.
+
+        Linhas com valores ausentes são descartadas, como no treino; o índice das
+        linhas restantes é preservado no DataFrame retornado (modo denso). O target
+        e as colunas de vítimas não são necessários.
+
+        Returns:
+            X com as colunas em feature_names (DataFrame ou CSR em modo esparso)
+        """
+        cleaner, standardizer, feature_engineer = self._get_stages()
+
+        df = cleaner.handle_missing_values(cleaner.remove_irrelevant_columns(df))
+        df = standardizer.padronizar_dataset(df)
+        df = feature_engineer.criar_todas_features(df, statistics=self.feature_statistics, salvar=False)
+        encoded = self.encoder.transform(df, TARGET_COLUMN)
+
+        if isinstance(encoded, SparseEncodedFrame):
+            dense_columns = self.feature_names[:len(self.feature_names) - len(encoded.onehot_names)]
+            return encoded.with_frame(self._select_columns(encoded.frame, dense_columns)).to_matrix()
+
+        X = self._select_columns(encoded, self.feature_names)
+        return X.astype(self.dtypes) if self.dtypes else X
@@ -1,14 +1,32 @@
-from typing import Dict, Literal, Optional, Tuple
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Tuple, Union
+from config.config_project import PROJECT_ROOT, ConfigProject
 from config.inject_logger import inject_logger
 from sklearn.pipeline import Pipeline
+from pipelines.balance_cache import BalanceCache
+from pipelines.chunked_execution import MERGED_CSV_OPTIONS, ChunkedPreprocessor
+from pipelines.memory_tracker import StageMemoryTracker
+from pipelines.parallel_execution import ParallelPreprocessor
+from pipelines.preprocessing_artifact import PreprocessingArtifact
+from pipelines.stage_cache import StageCache
+from pipelines.stage_profiler import StageProfiler
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.kernels import compact_frames, compute_frame_fingerprint
 from preprocessing.data_balancing_06 import DataBalance
 from preprocessing.data_split_05 import DataSplit
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.split_indices import SplitIndexStore
 from preprocessing.transformers import (
     DataCleaningTransformer, DataCollectionTransformer, DataEncodingTransformer,
     DataStandardizeTransformer, DatasetMergerTransformer, FeatureEngineeringTransformer
 )
+import numpy as np
 import pandas as pd
 
+# Etapas locais a cada linha, executadas em blocos (chunk_size) ou em paralelo (n_jobs)
+CHUNKED_STEPS = ('cleaning', 'standardize', 'feature_engineering')
+
 @inject_logger
 class PreprocessingPipeline:
     """
@@ -22,10 +40,58 @@ class PreprocessingPipeline:
         test_size: float = 0.2,
         valid_size: float = 0.2,
         balance_strategy: Optional[str] = None,
-        random_state: int = 42
+        random_state: int = 42,
+        copy_free: bool = False,
+        track_memory: bool = False,
+        use_cache: Optional[bool] = None,
+        checkpoints: Optional[bool] = None,
+        chunk_size: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        compact_dtypes: bool = False,
+        sparse_onehot: bool = False,
+        native_categorical: bool = False,
+        profile: bool = False,
+        index_split: Optional[bool] = None,
+        balance_cache: Optional[bool] = None
     ):
         """
         Inicializa o pipeline de pré-processamento
+        
+        Args:
+            copy_free: Executa com copy-on-write do pandas. Cada etapa passa a ser dona
+                do DataFrame que recebe e as etapas seguintes compartilham os buffers
+                das colunas não modificadas, em vez de manter cópias completas
+            track_memory: Registra o RSS de pico de cada etapa (ver memory_tracker)
+            use_cache: Reaproveita as saídas das etapas já calculadas para os mesmos dados,
+                parâmetros e código (ver stage_cache). Padrão: cache.enabled do config.yaml
+            checkpoints: Grava os checkpoints intermediários (ex.: após o feature engineering)
+                em segundo plano. Padrão: checkpoints.enabled do config.yaml
+            chunk_size: Executa limpeza, padronização e feature engineering em blocos
+                com esse número de linhas (ver chunked_execution). Com um CSV como
+                entrada, o dataset bruto nunca é carregado inteiro em memória
+            n_jobs: Executa limpeza, padronização e feature engineering em partições de
+                linhas em um pool de n_jobs processos (ver parallel_execution). Com
+                chunk_size, ele define o tamanho das partições
+            compact_dtypes: Gera as matrizes de treino, validação e teste com dtypes
+                compactos (uint8/int16 para flags, códigos e contagens; float32 para
+                valores contínuos) em vez de converter tudo para float64
+            sparse_onehot: Mantém as colunas OneHot em CSR do encoding até os modelos. As
+                matrizes X retornadas são scipy.sparse.csr_matrix (float32) e os nomes
+                das colunas ficam em feature_names. A etapa de encoding não é cacheada
+            native_categorical: Mantém as colunas categóricas como códigos inteiros, sem
+                OneHot nem Target Encoding, para modelos com suporte nativo a categorias
+                (CatBoost). Os nomes dessas colunas ficam em categorical_features, e o
+                SMOTE passa a usar SMOTENC nelas
+            profile: Registra o perfil de cada etapa (tempo de parede e de CPU, RSS,
+                linhas/colunas e memória de entrada e saída; ver stage_profiler), que
+                pode ser gravado com save_profile. Inclui a medição de track_memory
+            index_split: Separa treino, validação e teste pelas posições das linhas,
+                persistidas por fingerprint do target em split.index_dir; os conjuntos
+                são fatias de uma única cópia do dataset (ver DataSplit.split_by_index).
+                Padrão: split.index_mode do config.yaml
+            balance_cache: Reaproveita treinos balanceados já calculados para o mesmo
+                X_train, estratégia, parâmetros e random_state (ver balance_cache).
+                Padrão: balancing.cache.enabled do config.yaml
         """
         self.collect_new_data = collect_new_data
         self.dataset_type = dataset_type
@@ -33,7 +99,27 @@ class PreprocessingPipeline:
         self.valid_size = valid_size
         self.balance_strategy = balance_strategy
         self.random_state = random_state
+        self.copy_free = copy_free
+        if profile:
+            self.memory_tracker = StageProfiler()
+        else:
+            self.memory_tracker = StageMemoryTracker() if track_memory else None
+        self.stage_cache = self._create_stage_cache(use_cache)
+        self.checkpoint_writer = CheckpointWriter(enabled=checkpoints)
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        self.compact_dtypes = compact_dtypes
+        self.sparse_onehot = sparse_onehot
+        self.native_categorical = native_categorical
+        # Colunas de códigos categóricos das matrizes X (modo native_categorical)
+        self.categorical_features: List[str] = []
+        # Pesos por amostra de y_train (balance_strategy='sample_weight'), para o fit dos modelos
+        self.sample_weight: Optional[np.ndarray] = None
+        # Nomes e dtypes das colunas das matrizes X, na ordem das colunas (preenchidos por process_data)
+        self.feature_names: Optional[List[str]] = None
+        self.feature_dtypes: Optional[Dict[str, str]] = None
         
+        config = ConfigProject()
         steps = []
         
         self.logger.info(f"COLLECT NEW DATA: {self.collect_new_data}")
@@ -47,62 +133,308 @@ class PreprocessingPipeline:
         steps.extend([
             ('cleaning', DataCleaningTransformer()),
             ('standardize', DataStandardizeTransformer()),
-            ('feature_engineering', FeatureEngineeringTransformer()),
-            ('encoding', DataEncodingTransformer())
+            ('feature_engineering', FeatureEngineeringTransformer(checkpoint_writer=self.checkpoint_writer)),
+            # As colunas de hashing e a configuração do Target Encoding vêm do config.yaml
+            # explicitamente para entrar na chave do cache de etapas
+            ('encoding', DataEncodingTransformer(
+                sparse_onehot=self.sparse_onehot,
+                hashing_columns=config.get("encoding.hashing.columns", {}) or {},
+                native_categorical=self.native_categorical,
+                target_smooth=config.get("encoding.target_encoding.smooth", "auto"),
+                target_cv=config.get("encoding.target_encoding.cv", 5),
+                random_state=self.random_state
+            ))
         ])
         
         self.pipeline = Pipeline(steps)
         
-        self.data_splitter = DataSplit()
-        self.data_balancer = DataBalance() if balance_strategy else None
+        self.index_split = self._resolve_index_split(index_split)
+        self.data_splitter = DataSplit(index_store=self._create_split_index_store())
+        self.data_balancer = DataBalance(cache=self._create_balance_cache(balance_cache)) if balance_strategy else None
 
     def process_data(
         self,
-        input_data: Optional[pd.DataFrame] = None
+        input_data: Optional[Union[pd.DataFrame, str, Path]] = None
     ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, pd.Series]:
         """
         Processa os dados através do pipeline completo
+        
+        Args:
+            input_data: DataFrame ou caminho do CSV unificado (ignorado ao coletar novos dados)
         """
         self.logger.info(f"Iniciando pipeline completo de pré-processamento (usando dataset {self.dataset_type})...")
         
-        df_processed = self.pipeline.fit_transform(input_data if input_data is not None else pd.DataFrame())
+        cleaner = self.pipeline.named_steps['cleaning'].cleaner
+        try:
+            with pd.option_context('mode.copy_on_write', True) if self.copy_free else nullcontext():
+                result = self._process(input_data if input_data is not None else pd.DataFrame())
+            # As linhas novas só entram no índice de fingerprints após a execução completa
+            cleaner.commit_fingerprints()
+        finally:
+            # Descarta as linhas pendentes se alguma etapa falhou (no-op após o commit)
+            cleaner.rollback_fingerprints()
+            # Aguarda os checkpoints gravados em segundo plano
+            self.checkpoint_writer.flush()
+        
+        if self.memory_tracker is not None:
+            self.logger.info(f"Pico de memória do pré-processamento: {self.memory_tracker.peak_mb():.1f} MB")
+        
+        return result
+
+    def _create_stage_cache(self, use_cache: Optional[bool]) -> Optional[StageCache]:
+        config = ConfigProject()
+        if use_cache is None:
+            use_cache = bool(config.get("cache.enabled", False))
+        if not use_cache:
+            return None
+        
+        cache_dir = PROJECT_ROOT / config.get("cache.dir", "./files/cache/stages/")
+        return StageCache(cache_dir, max_size_mb=config.get("cache.max_size_mb", 2048))
+
+    def _create_balance_cache(self, balance_cache: Optional[bool]) -> Optional[BalanceCache]:
+        config = ConfigProject()
+        if balance_cache is None:
+            balance_cache = bool(config.get("balancing.cache.enabled", False))
+        if not balance_cache:
+            return None
+        
+        cache_dir = PROJECT_ROOT / config.get("balancing.cache.dir", "./files/cache/balanced/")
+        return BalanceCache(cache_dir, max_size_mb=config.get("balancing.cache.max_size_mb", 4096))
+
+    @staticmethod
+    def _resolve_index_split(index_split: Optional[bool]) -> bool:
+        if index_split is None:
+            return bool(ConfigProject().get("split.index_mode", False))
+        return index_split
+    
+    def _create_split_index_store(self) -> Optional[SplitIndexStore]:
+        if not self.index_split:
+            return None
+        index_dir = ConfigProject().get("split.index_dir", "./files/cache/splits/")
+        return SplitIndexStore(PROJECT_ROOT / index_dir)
+    
+    def _load_pending(self, key: Optional[str], df: pd.DataFrame) -> pd.DataFrame:
+        """Lê do cache a saída pendente, se houver."""
+        return self.stage_cache.load_data(key) if key is not None else df
+
+    def _partitioned(self) -> bool:
+        return bool(self.chunk_size) or (self.n_jobs is not None and self.n_jobs > 1)
+
+    def _run_chunked(self, data: Union[pd.DataFrame, str, Path]) -> pd.DataFrame:
+        """Executa as etapas locais a cada linha em blocos ou em partições paralelas."""
+        steps = self.pipeline.named_steps
+        stages = {
+            'cleaner': steps['cleaning'].cleaner,
+            'standardizer': steps['standardize'].standardizer,
+            'feature_engineer': steps['feature_engineering'].feature_engineer
+        }
+        if self.n_jobs is not None and self.n_jobs > 1:
+            processor = ParallelPreprocessor(**stages, n_jobs=self.n_jobs, partition_size=self.chunk_size)
+        else:
+            processor = ChunkedPreprocessor(**stages, chunk_size=self.chunk_size)
+        # O índice de fingerprints é gravado por process_data, após as etapas seguintes
+        df = processor.run(data, commit=False)
+        
+        # Frequências globais (causas raras) como estado ajustado do feature engineering
+        steps['feature_engineering'].statistics = processor.statistics.get(FeatureEngineering.STAGE, {})
+        return df
+
+    def _stage(self, name: str, data=None):
+        """
+        Contexto de medição da etapa (no-op se desativado). O contexto devolve o
+        registro da etapa, que recebe a saída em _record_output.
+        
+        Args:
+            data: Entrada da etapa (descrita no perfil)
+        """
+        if isinstance(self.memory_tracker, StageProfiler):
+            return self.memory_tracker.track(name, data)
+        if self.memory_tracker is not None:
+            return self.memory_tracker.track(name)
+        return nullcontext({})
+    
+    def _record_output(self, record: Dict, data) -> None:
+        """Registra a saída da etapa no perfil (fora do tempo medido)."""
+        if isinstance(self.memory_tracker, StageProfiler):
+            self.memory_tracker.record_output(record, data)
+
+    def _process(
+        self,
+        df_processed: Union[pd.DataFrame, str, Path]
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, pd.Series]:
+        if isinstance(df_processed, (str, Path)) and not self._partitioned():
+            df_processed = pd.read_csv(df_processed, **MERGED_CSV_OPTIONS)
+        
+        # Executa as etapas uma a uma (equivalente a Pipeline.fit_transform) para medir
+        # e cachear cada uma. Saídas em cache só são lidas do disco quando uma etapa
+        # seguinte precisa ser recalculada (ou ao final), então um prefixo inteiro em
+        # cache custa uma única leitura.
+        input_key = None
+        pending_key = None
+        for i, (name, step) in enumerate(self.pipeline.steps):
+            if self._partitioned() and name in CHUNKED_STEPS:
+                if name == CHUNKED_STEPS[0]:
+                    df_processed = self._load_pending(pending_key, df_processed)
+                    pending_key = None
+                    with self._stage('+'.join(CHUNKED_STEPS), df_processed) as record:
+                        df_processed = self._run_chunked(df_processed)
+                    self._record_output(record, df_processed)
+                    input_key = None
+                continue
+            
+            # Enquanto a saída da etapa anterior está só no cache, não há o que descrever
+            with self._stage(name, df_processed if pending_key is None else None) as record:
+                if self.stage_cache is None or not self.stage_cache.is_cacheable(step):
+                    df_processed = self._load_pending(pending_key, df_processed)
+                    pending_key = None
+                    df_processed = step.fit_transform(df_processed)
+                    input_key = None
+                else:
+                    if input_key is None:
+                        input_key = compute_frame_fingerprint(df_processed)
+                    key = self.stage_cache.stage_key(input_key, name, step)
+                    
+                    if self.stage_cache.lookup(key, name):
+                        fitted_step = self.stage_cache.load_state(key)
+                        if fitted_step is not None:
+                            # Mantém os parâmetros da etapa original (ex.: o checkpoint_writer do pipeline)
+                            fitted_step.set_params(**step.get_params(deep=False))
+                            self.pipeline.steps[i] = (name, fitted_step)
+                        pending_key = key
+                        record['cache_hit'] = True
+                        
+                        if getattr(step, 'writes_checkpoint', False):
+                            # O checkpoint da etapa é gravado também quando a saída vem do cache
+                            df_processed = self._load_pending(pending_key, df_processed)
+                            pending_key = None
+                            step.write_checkpoint(df_processed)
+                    else:
+                        df_processed = self._load_pending(pending_key, df_processed)
+                        pending_key = None
+                        df_processed = step.fit_transform(df_processed)
+                        self.stage_cache.save(key, df_processed, step)
+                    input_key = key
+            self._record_output(record, df_processed if pending_key is None else None)
+        
+        df_processed = self._load_pending(pending_key, df_processed)
+        if self.stage_cache is not None:
+            self.stage_cache.log_stats()
         self.logger.info(f"Dimensões após pré-processamento: {df_processed.shape}")
         
-        X_train, X_valid, X_test, y_train, y_valid, y_test = self.data_splitter.prepare_data(
-            df_processed,
-            test_size=self.test_size,
-            valid_size=self.valid_size,
-            random_state=self.random_state
-        )
+        with self._stage('split', df_processed) as record:
+            X_train, X_valid, X_test, y_train, y_valid, y_test = self.data_splitter.prepare_data(
+                df_processed,
+                test_size=self.test_size,
+                valid_size=self.valid_size,
+                random_state=self.random_state,
+                index_split=self.index_split
+            )
+            del df_processed
         
-        # Garantir que todos os tipos numéricos sejam float64 antes do balanceamento
-        numeric_columns = X_train.select_dtypes(include=['int64', 'float64']).columns
-        X_train[numeric_columns] = X_train[numeric_columns].astype('float64')
-        X_valid[numeric_columns] = X_valid[numeric_columns].astype('float64')
-        X_test[numeric_columns] = X_test[numeric_columns].astype('float64')
+            if self.sparse_onehot:
+                # Matrizes CSR já em float32; os nomes das colunas vêm do split
+                self.feature_names = self.data_splitter.feature_names
+            elif self.compact_dtypes:
+                X_train, X_valid, X_test = compact_frames(X_train, X_valid, X_test)
+            else:
+                # Garantir que todos os tipos numéricos sejam float64 antes do balanceamento
+                # (só as colunas convertidas são copiadas; as demais seguem compartilhadas
+                # com a cópia do split em index_split)
+                numeric_dtypes = {col: 'float64' for col in X_train.select_dtypes(include=['int64', 'float64']).columns}
+                X_train = X_train.astype(numeric_dtypes, copy=False)
+                X_valid = X_valid.astype(numeric_dtypes, copy=False)
+                X_test = X_test.astype(numeric_dtypes, copy=False)
+        self._record_output(record, (X_train, X_valid, X_test))
         
-        self.logger.info("Tipos de dados após conversão:")
-        for col in X_train.columns:
-            self.logger.info(f"- {col}: {X_train[col].dtype}")
+        if not self.sparse_onehot:
+            self.feature_names = list(X_train.columns)
+            self.feature_dtypes = X_train.dtypes.astype(str).to_dict()
+            encoder = self.pipeline.named_steps['encoding'].encoder
+            self.categorical_features = [col for col in encoder.native_features if col in X_train.columns]
+            self.logger.info("Tipos de dados após conversão:")
+            for col in X_train.columns:
+                self.logger.info(f"- {col}: {X_train[col].dtype}")
         
         if self.balance_strategy:
             self.logger.info(f"Aplicando estratégia de balanceamento {self.balance_strategy}...")
             try:
-                X_train, y_train = self.data_balancer.balance_data(
-                    X_train,
-                    y_train,
-                    strategy=self.balance_strategy,
-                    random_state=self.random_state
-                )
+                with self._stage('balance', X_train) as record:
+                    X_train, y_train = self.data_balancer.balance_data(
+                        X_train,
+                        y_train,
+                        strategy=self.balance_strategy,
+                        random_state=self.random_state,
+                        categorical_features=self.categorical_features or None
+                    )
+                    if self.data_balancer.cache_hit:
+                        record['cache_hit'] = True
+                self._record_output(record, X_train)
+                self.sample_weight = self.data_balancer.sample_weight
+                if self.data_balancer.cache is not None:
+                    self.data_balancer.cache.log_stats()
             except Exception as e:
                 self.logger.error(f"Erro durante o balanceamento: {str(e)}")
-                self.logger.error("Tipos de dados após tentativa de balanceamento:")
-                for col in X_train.columns:
-                    self.logger.error(f"- {col}: {X_train[col].dtype}")
+                if not self.sparse_onehot:
+                    self.logger.error("Tipos de dados após tentativa de balanceamento:")
+                    for col in X_train.columns:
+                        self.logger.error(f"- {col}: {X_train[col].dtype}")
                 raise
         
         return X_train, X_valid, X_test, y_train, y_valid, y_test
 
+    def build_artifact(self) -> PreprocessingArtifact:
+        """
+        Reúne o estado ajustado pelo último process_data (encoders, causas raras e colunas finais)
+        em um artefato para scoring (ver preprocessing_artifact).
+        """
+        if self.feature_names is None:
+            raise RuntimeError("Execute process_data antes de gerar o artefato de pré-processamento")
+        
+        steps = self.pipeline.named_steps
+        return PreprocessingArtifact(
+            encoder=steps['encoding'].encoder,
+            feature_statistics=steps['feature_engineering'].statistics or {},
+            feature_names=self.feature_names,
+            dtypes=self.feature_dtypes,
+            sparse_onehot=self.sparse_onehot
+        )
+    
+    def save_artifact(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Salva o artefato do pré-processamento ajustado.
+        
+        Args:
+            path: Arquivo de destino (padrão: artifact.path do config.yaml)
+        """
+        return self.build_artifact().save(path)
+    
+    def save_profile(self, path: Union[str, Path]) -> Path:
+        """
+        Grava o relatório JSON do perfil das etapas e loga a tabela resumida.
+        
+        Raises:
+            RuntimeError: Se o pipeline não foi criado com profile=True
+        """
+        if not isinstance(self.memory_tracker, StageProfiler):
+            raise RuntimeError("Crie o PreprocessingPipeline com profile=True para gerar o relatório de perfil")
+        
+        metadata = {
+            'dataset_type': self.dataset_type,
+            'balance_strategy': self.balance_strategy,
+            'chunk_size': self.chunk_size,
+            'n_jobs': self.n_jobs,
+            'copy_free': self.copy_free,
+            'compact_dtypes': self.compact_dtypes,
+            'sparse_onehot': self.sparse_onehot,
+            'native_categorical': self.native_categorical,
+            'stage_cache': self.stage_cache is not None
+        }
+        self.logger.info(
+            "Perfil do pré-processamento por etapa:\n"
+            + self.memory_tracker.summary_table().to_string(index=False, float_format=lambda v: f"{v:.2f}", na_rep='-')
+        )
+        return self.memory_tracker.write_report(path, metadata)
+    
     def get_feature_names(self) -> Dict[str, list]:
         """
         Obtém os nomes das features após pré-processamento
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import joblib
+import pandas as pd
+
+from config.config_project import PROJECT_ROOT
+from config.inject_logger import inject_logger
+
+# Arquivos cujo conteúdo define a "versão do código" das etapas de pré-processamento
+CODE_VERSION_SOURCES = [
+    PROJECT_ROOT / "src" / "preprocessing",
+    PROJECT_ROOT / "standardization_rules.yaml"
+]
+
+DATA_FILE = "data.parquet"
+STATE_FILE = "state.joblib"
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Hash do código-fonte do pré-processamento e do arquivo de regras."""
+    digest = hashlib.sha256()
+    for source in CODE_VERSION_SOURCES:
+        files = sorted(source.rglob("*.py")) if source.is_dir() else [source]
+        for file in files:
+            digest.update(str(file.relative_to(PROJECT_ROOT)).encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+@inject_logger
+class StageCache:
+    """
+    Cache endereçado por conteúdo das saídas de cada etapa do PreprocessingPipeline.
+
+    A chave de uma etapa combina o fingerprint dos dados de entrada, o nome e os
+    parâmetros da etapa e a versão do código. As saídas são gravadas em Parquet
+    (colunar) e, para etapas com estado ajustado (ex.: encoders), o transformador
+    é salvo junto. O tamanho total é limitado por max_size_mb, com remoção das
+    entradas usadas há mais tempo (LRU).
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 2048):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @staticmethod
+    def is_cacheable(step: Any) -> bool:
+        """Etapas com efeitos externos (coleta, merge, índice incremental) não são cacheadas."""
+        return getattr(step, 'cacheable', True)
+
+    def stage_key(self, input_key: str, name: str, step: Any) -> str:
+        """Calcula a chave da saída de uma etapa a partir da chave de sua entrada."""
+        params = sorted((k, repr(v)) for k, v in step.get_params(deep=False).items())
+        payload = repr((input_key, name, type(step).__name__, params, code_version()))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, key: str, name: str = "") -> bool:
+        """Verifica se a saída de uma etapa está no cache, registrando hit ou miss."""
+        entry = self.cache_dir / key
+
+        if not (entry / DATA_FILE).exists():
+            self.stats['misses'] += 1
+            self.logger.info(f"Cache miss [{name}]: {key[:12]}")
+            return False
+
+        # Marca a entrada como usada recentemente (LRU)
+        os.utime(entry)
+        self.stats['hits'] += 1
+        self.logger.info(f"Cache hit [{name}]: {key[:12]}")
+        return True
+
+    def load_data(self, key: str) -> pd.DataFrame:
+        """Carrega o DataFrame de saída de uma etapa."""
+        return pd.read_parquet(self.cache_dir / key / DATA_FILE)
+
+    def load_state(self, key: str) -> Optional[Any]:
+        """Carrega o transformador ajustado de uma etapa (None se a etapa não tem estado)."""
+        state_path = self.cache_dir / key / STATE_FILE
+        return joblib.load(state_path) if state_path.exists() else None
+
+    def save(self, key: str, df: pd.DataFrame, step: Optional[Any] = None) -> None:
+        """Grava a saída de uma etapa (e o transformador, se tiver estado) e aplica o limite de tamanho."""
+        def write(tmp_entry: Path) -> None:
+            df.to_parquet(tmp_entry / DATA_FILE)
+            if step is not None and getattr(step, 'cache_state', False):
+                joblib.dump(step, tmp_entry / STATE_FILE)
+
+        self._write_entry(key, write)
+
+    def _write_entry(self, key: str, write: Callable[[Path], None]) -> None:
+        """Grava uma entrada em um diretório temporário, renomeado ao final, e aplica o limite de tamanho."""
+        entry = self.cache_dir / key
+        tmp_entry = self.cache_dir / f".{key}.tmp"
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+        tmp_entry.mkdir(parents=True)
+
+        try:
+            write(tmp_entry)
+        except Exception as e:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            self.logger.warning(f"Não foi possível gravar a entrada no cache: {str(e)}")
+            return
+
+        shutil.rmtree(entry, ignore_errors=True)
+        tmp_entry.rename(entry)
+        self._evict()
+
+    def _entry_size(self, entry: Path) -> int:
+        return sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+
+    def _evict(self) -> None:
+        """Remove as entradas menos usadas recentemente até respeitar max_size_mb."""
+        entries = [e for e in self.cache_dir.iterdir() if e.is_dir() and not e.name.startswith('.')]
+        entries.sort(key=lambda e: e.stat().st_mtime)
+
+        total = sum(self._entry_size(e) for e in entries)
+        while entries and total > self.max_bytes:
+            oldest = entries.pop(0)
+            total -= self._entry_size(oldest)
+            shutil.rmtree(oldest, ignore_errors=True)
+            self.stats['evictions'] += 1
+            self.logger.info(f"Entrada removida do cache (LRU): {oldest.name[:12]}")
+
+    def size_mb(self) -> float:
+        """Tamanho total atual do cache em MB."""
+        entries = [e for e in self.cache_dir.iterdir() if e.is_dir() and not e.name.startswith('.')]
+        return sum(self._entry_size(e) for e in entries) / (1024 * 1024)
+
+    def log_stats(self) -> None:
+        self.logger.info(
+            f"Cache de etapas: {self.stats['hits']} hits, {self.stats['misses']} misses, "
+            f"{self.stats['evictions']} remoções, {self.size_mb():.1f} MB em {self.cache_dir}"
+        )
@@ -0,0 +1,140 @@
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from config.inject_logger import inject_logger
+from pipelines.memory_tracker import StageMemoryTracker
+from preprocessing.sparse_features import SparseEncodedFrame, sparse_memory_mb
+
+_MB = 1024 * 1024
+
+# Colunas da tabela resumida (summary_table), na ordem de exibição
+SUMMARY_COLUMNS = [
+    'stage', 'wall_s', 'cpu_s', 'peak_delta_mb',
+    'rows_in', 'cols_in', 'rows_out', 'cols_out', 'memory_out_mb'
+]
+
+
+def data_profile(data: Any) -> Optional[Dict]:
+    """
+    Linhas, colunas e memória de uma entrada ou saída de etapa.
+
+    Aceita DataFrame, Series, SparseEncodedFrame, matrizes (numpy/CSR) e tuplas
+    delas (ex.: os conjuntos do split, somados por linha). A memória de DataFrames
+    inclui o conteúdo das colunas de texto (memory_usage(deep=True)).
+
+    Returns:
+        {'rows', 'cols', 'memory_mb'} ou None para outros tipos (ex.: caminho do CSV)
+    """
+    if isinstance(data, (tuple, list)):
+        parts = [data_profile(part) for part in data]
+        if not parts or any(part is None for part in parts):
+            return None
+        return {
+            'rows': sum(part['rows'] for part in parts),
+            'cols': parts[0]['cols'],
+            'memory_mb': sum(part['memory_mb'] for part in parts)
+        }
+    if isinstance(data, pd.DataFrame):
+        return {'rows': len(data), 'cols': data.shape[1], 'memory_mb': data.memory_usage(deep=True).sum() / _MB}
+    if isinstance(data, pd.Series):
+        return {'rows': len(data), 'cols': 1, 'memory_mb': data.memory_usage(deep=True) / _MB}
+    if isinstance(data, SparseEncodedFrame):
+        rows, cols = data.shape
+        return {'rows': rows, 'cols': cols, 'memory_mb': data.memory_mb()}
+    if sparse.issparse(data):
+        return {'rows': data.shape[0], 'cols': data.shape[1], 'memory_mb': sparse_memory_mb(data.tocsr())}
+    if isinstance(data, np.ndarray):
+        return {'rows': data.shape[0], 'cols': data.shape[1] if data.ndim > 1 else 1, 'memory_mb': data.nbytes / _MB}
+    return None
+
+
+@inject_logger
+class StageProfiler(StageMemoryTracker):
+    """
+    Perfil de cada etapa do pipeline: tempo de parede, tempo de CPU, RSS (inicial,
+    final e pico, como no StageMemoryTracker) e linhas, colunas e memória da entrada
+    e da saída.
+
+    Os registros podem ser gravados em um relatório JSON (write_report) e resumidos
+    em uma tabela (summary_table) para comparar execuções.
+    """
+
+    @contextmanager
+    def track(self, stage: str, data: Any = None) -> Iterator[Dict]:
+        """
+        Mede o bloco executado dentro do contexto.
+
+        A entrada é descrita antes de iniciar as medições. A saída é registrada com
+        record_output, de preferência após o bloco, para que o cálculo da memória
+        não entre no tempo da etapa.
+
+        Args:
+            stage: Nome da etapa
+            data: Entrada da etapa
+        """
+        inputs = data_profile(data) or {}
+        with super().track(stage) as record:
+            record.update({
+                'rows_in': inputs.get('rows'),
+                'cols_in': inputs.get('cols'),
+                'memory_in_mb': inputs.get('memory_mb')
+            })
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            try:
+                yield record
+            finally:
+                record['wall_s'] = time.perf_counter() - wall_start
+                record['cpu_s'] = time.process_time() - cpu_start
+
+    @staticmethod
+    def record_output(record: Dict, data: Any) -> None:
+        """Registra linhas, colunas e memória da saída da etapa."""
+        outputs = data_profile(data) or {}
+        record.update({
+            'rows_out': outputs.get('rows'),
+            'cols_out': outputs.get('cols'),
+            'memory_out_mb': outputs.get('memory_mb')
+        })
+
+    def summary_table(self) -> pd.DataFrame:
+        """Tabela com uma linha por etapa e o total de tempo ao final."""
+        table = pd.DataFrame(self.records).reindex(columns=SUMMARY_COLUMNS)
+        total = {
+            'stage': 'total',
+            'wall_s': table['wall_s'].sum(),
+            'cpu_s': table['cpu_s'].sum(),
+            'peak_delta_mb': table['peak_delta_mb'].max()
+        }
+        table = pd.concat([table, pd.DataFrame([total])], ignore_index=True)
+        return table.astype({col: 'Int64' for col in ('rows_in', 'cols_in', 'rows_out', 'cols_out')})
+
+    def write_report(self, path: Union[str, Path], metadata: Optional[Dict] = None) -> Path:
+        """
+        Grava o relatório JSON com os registros de todas as etapas.
+
+        Args:
+            path: Arquivo de destino
+            metadata: Informações da execução incluídas no relatório (ex.: parâmetros)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'metadata': metadata or {},
+            'peak_rss_mb': self.peak_mb(),
+            'total_wall_s': sum(r.get('wall_s') or 0 for r in self.records),
+            'total_cpu_s': sum(r.get('cpu_s') or 0 for r in self.records),
+            'stages': self.records
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=4, default=float)
+        self.logger.info(f"Relatório de perfil do pré-processamento salvo em {path}")
+        return path
@@ -2,4 +2,7 @@ from .data_balancing_strategy import DataBalancingStrategy
 from .smote_balancing import SmoteBalancing
 from .random_oversampling_balancing import RandomOversamplingBalancing
 from .random_undersampling_balanding import RandomUndersamplingBalancing
-from .combined_sampling_balancing import CombinedSamplingBalancing
\ No newline at end of file
+from .combined_sampling_balancing import CombinedSamplingBalancing
+from .sample_weight_balancing import SampleWeightBalancing
+from .fast_smote_balancing import FastSmoteBalancing
+from .budgeted_balancing import BudgetedBalancing
\ No newline at end of file
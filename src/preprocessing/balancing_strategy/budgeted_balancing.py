@@ -0,0 +1,166 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from config.config_project import ConfigProject
+from preprocessing.sparse_features import SparseEncodedFrame, sparse_memory_mb
+from .data_balancing_strategy import DataBalancingStrategy
+from .fast_smote_balancing import FastSmoteBalancing
+from .random_oversampling_balancing import RandomOversamplingBalancing
+from .random_undersampling_balanding import RandomUndersamplingBalancing
+from .smote_balancing import SmoteBalancing
+
+_MB = 1024 * 1024
+
+OVERSAMPLERS = ['smote', 'fast_smote', 'random_over']
+
+
+def bytes_per_row(X) -> float:
+    """Memória média de uma linha de X (DataFrame, SparseEncodedFrame, matriz CSR ou numpy)."""
+    if isinstance(X, pd.DataFrame):
+        total = X.memory_usage(deep=True).sum()
+    elif isinstance(X, SparseEncodedFrame):
+        total = X.memory_mb() * _MB
+    elif sparse.issparse(X):
+        total = sparse_memory_mb(X.tocsr()) * _MB
+    else:
+        total = np.asarray(X).nbytes
+    return total / max(X.shape[0], 1)
+
+
+def water_fill(targets: Dict, max_rows: int) -> Dict:
+    """
+    Reduz as contagens alvo para somarem no máximo max_rows, limitando todas as
+    classes a um mesmo teto (as classes abaixo do teto mantêm o alvo).
+    """
+    if sum(targets.values()) <= max_rows:
+        return dict(targets)
+
+    ordered = sorted(targets.values())
+    remaining = max_rows
+    level = 0
+    for position, target in enumerate(ordered):
+        level = remaining // (len(ordered) - position)
+        if target > level:
+            break
+        remaining -= target
+    return {classe: min(target, level) for classe, target in targets.items()}
+
+
+class BudgetedBalancing(DataBalancingStrategy):
+    def __init__(
+        self,
+        categorical_features: Optional[List[str]] = None,
+        max_rows: Optional[int] = None,
+        max_memory_mb: Optional[float] = None,
+        class_targets: Optional[Dict] = None,
+        oversampler: Optional[str] = None
+    ):
+        """
+        Balanceamento com orçamento de linhas/memória. Os parâmetros não informados
+        vêm de balancing.budget no config.yaml.
+
+        Args:
+            categorical_features: Colunas de códigos categóricos (SMOTENC)
+            max_rows: Máximo de linhas do treino balanceado
+            max_memory_mb: Máximo de memória do treino balanceado (convertido em linhas
+                pela memória média por linha de X)
+            class_targets: Contagem alvo por classe ({classe: linhas}); as classes sem
+                alvo seguem a majoritária
+            oversampler: Estratégia das classes abaixo do alvo: 'smote', 'fast_smote'
+                ou 'random_over'
+        """
+        config = ConfigProject()
+        self.categorical_features = categorical_features
+        self.max_rows = max_rows or config.get("balancing.budget.max_rows", None)
+        self.max_memory_mb = max_memory_mb or config.get("balancing.budget.max_memory_mb", None)
+        self.class_targets = class_targets if class_targets is not None else (config.get("balancing.budget.class_targets", {}) or {})
+        self.oversampler = oversampler or config.get("balancing.budget.oversampler", "smote")
+        if self.oversampler not in OVERSAMPLERS:
+            raise ValueError(f"Oversampler {self.oversampler} inválido. Use um dos seguintes: {OVERSAMPLERS}")
+
+    def plan(self, X, y) -> Dict:
+        """
+        Calcula a contagem final de cada classe e o tamanho previsto do resultado.
+
+        Cada classe vai para o alvo de class_targets (ou para a contagem da majoritária)
+        e, se o total passar do orçamento, todas são limitadas a um mesmo teto
+        (water_fill): as majoritárias acima do teto são subamostradas e as demais,
+        sobreamostradas até o alvo.
+
+        Returns:
+            {'targets', 'budget_rows', 'expected_rows', 'expected_mb', 'bytes_per_row'}
+        """
+        counts = pd.Series(y).value_counts()
+        row_bytes = bytes_per_row(X)
+        class_targets = {str(classe): int(target) for classe, target in self.class_targets.items()}
+        targets = {classe: class_targets.get(str(classe), int(counts.max())) for classe in counts.index}
+
+        budgets = []
+        if self.max_rows:
+            budgets.append(int(self.max_rows))
+        if self.max_memory_mb:
+            budgets.append(int(self.max_memory_mb * _MB // row_bytes))
+        budget_rows = min(budgets) if budgets else None
+        if budget_rows is not None:
+            targets = water_fill(targets, budget_rows)
+
+        expected_rows = sum(targets.values())
+        return {
+            'targets': targets,
+            'budget_rows': budget_rows,
+            'expected_rows': expected_rows,
+            'expected_mb': expected_rows * row_bytes / _MB,
+            'bytes_per_row': row_bytes
+        }
+
+    def apply(self, X, y, random_state = 42):
+        """
+        Aplica undersampling nas classes acima do alvo e oversampling nas classes
+        abaixo, nessa ordem (o oversampling roda sobre o treino já reduzido).
+
+        Args:
+            X: Features
+            y: Target
+            random_state: Seed para reprodutibilidade
+
+        Returns:
+            Tuple com X e y balanceados
+        """
+        self.logger.info("Aplicando balanceamento com orçamento...")
+        self.log_class_distribution(y, "original")
+
+        plan = self.plan(X, y)
+        counts = pd.Series(y).value_counts()
+        budget = f"{plan['budget_rows']} linhas" if plan['budget_rows'] is not None else "sem limite"
+        self.logger.info(
+            f"Previsto: {plan['expected_rows']} linhas, {plan['expected_mb']:.1f} MB "
+            f"(orçamento: {budget}; {plan['bytes_per_row']:.0f} bytes/linha)"
+        )
+
+        under = {classe: target for classe, target in plan['targets'].items() if target < counts[classe]}
+        if under:
+            X, y = RandomUndersamplingBalancing(under).apply(X, y, random_state)
+
+        over = {classe: target for classe, target in plan['targets'].items() if target > counts[classe]}
+        if over:
+            if self.oversampler == 'random_over':
+                oversampler = RandomOversamplingBalancing(over)
+            elif self.oversampler == 'fast_smote':
+                oversampler = FastSmoteBalancing(self.categorical_features, sampling_strategy=over)
+            else:
+                oversampler = SmoteBalancing(self.categorical_features, over)
+            X, y = oversampler.apply(X, y, random_state)
+
+        actual_mb = len(y) * bytes_per_row(X) / _MB
+        self.logger.info(
+            f"Resultado: {len(y)} linhas, {actual_mb:.1f} MB "
+            f"(previsto: {plan['expected_rows']} linhas, {plan['expected_mb']:.1f} MB)"
+        )
+        if plan['budget_rows'] is not None and len(y) > plan['budget_rows']:
+            self.logger.warning(f"Treino balanceado acima do orçamento de {plan['budget_rows']} linhas")
+
+        self.log_class_distribution(y, "final")
+        return X, y
@@ -1,8 +1,13 @@
+from typing import List, Optional
+
 from .data_balancing_strategy import DataBalancingStrategy 
 from .smote_balancing import SmoteBalancing
 from .random_oversampling_balancing import RandomOversamplingBalancing
 
 class CombinedSamplingBalancing(DataBalancingStrategy):
+    def __init__(self, categorical_features: Optional[List[str]] = None):
+        self.categorical_features = categorical_features
+    
     def apply(self, X, y, random_state = 42):
         self.logger.info("Aplicando estratégia combinada de sampling...")
         # `DataBalance` is a class that provides methods for balancing data in a dataset of accidents using different strategies such as oversampling and undersampling. It implements the following functionalities:
@@ -13,7 +18,7 @@ class CombinedSamplingBalancing(DataBalancingStrategy):
         X_under, y_under = random_undersampling.apply(X, y, random_state)
         
         # Depois aplica SMOTE para balancear todas as classes
-        smote: SmoteBalancing = SmoteBalancing()
+        smote: SmoteBalancing = SmoteBalancing(self.categorical_features)
         X_balanced, y_balanced = smote.apply(X_under, y_under, random_state)
         
         return X_balanced, y_balanced
\ No newline at end of file
@@ -4,13 +4,18 @@ import numpy as np
 from abc import ABC, abstractmethod
 from collections import Counter
 from collections import Counter
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 from config.inject_logger import inject_logger
 
 
 @inject_logger
 class DataBalancingStrategy(ABC):
     
+    # Pesos por amostra calculados pela estratégia (None quando as linhas são reamostradas)
+    sample_weight: Optional[np.ndarray] = None
+    # Resultado pode ser guardado no cache de balanceamento (BalanceCache)
+    cacheable: bool = True
+    
     @abstractmethod
     def apply(self, X: pd.DataFrame, y: pd.Series, random_state: int = 42) -> Tuple[pd.DataFrame, pd.Series]:
         pass
@@ -0,0 +1,125 @@
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from config.config_project import ConfigProject
+from preprocessing.kernels import bucketed_kneighbors, exact_kneighbors, restore_integer_dtypes
+from .data_balancing_strategy import DataBalancingStrategy
+from .smote_balancing import SmoteBalancing
+
+NEIGHBOR_MODES = ['exact', 'bucketed']
+
+class FastSmoteBalancing(DataBalancingStrategy):
+    def __init__(
+        self,
+        categorical_features: Optional[List[str]] = None,
+        k_neighbors: Optional[int] = None,
+        neighbors: Optional[str] = None,
+        bucket_size: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        sampling_strategy: Union[str, Dict] = 'auto'
+    ):
+        """
+        SMOTE para conjuntos de treino grandes. Os parâmetros não informados vêm de
+        balancing.fast_smote no config.yaml.
+
+        Args:
+            categorical_features: Colunas de códigos categóricos; com elas (ou com X
+                esparso) a estratégia delega ao SmoteBalancing (SMOTENC)
+            k_neighbors: Vizinhos da mesma classe usados na interpolação
+            neighbors: Busca dos vizinhos: 'exact' (multi-thread) ou 'bucketed'
+                (aproximada, buckets de uma grade Z-order; ver kernels.neighbors)
+            bucket_size: Linhas por bucket no modo 'bucketed'
+            n_jobs: Threads da busca de vizinhos
+            chunk_size: Amostras sintéticas geradas por bloco
+            sampling_strategy: Contagem final de cada classe ({classe: linhas}) ou
+                'auto' (todas as classes igualadas à majoritária)
+        """
+        config = ConfigProject()
+        self.categorical_features = categorical_features
+        self.k_neighbors = k_neighbors or config.get("balancing.fast_smote.k_neighbors", 5)
+        self.neighbors = neighbors or config.get("balancing.fast_smote.neighbors", "exact")
+        self.bucket_size = bucket_size or config.get("balancing.fast_smote.bucket_size", 4096)
+        self.n_jobs = n_jobs or config.get("balancing.fast_smote.n_jobs", -1)
+        self.chunk_size = chunk_size or config.get("balancing.fast_smote.chunk_size", 100_000)
+        self.sampling_strategy = sampling_strategy
+        if self.neighbors not in NEIGHBOR_MODES:
+            raise ValueError(f"Busca de vizinhos {self.neighbors} inválida. Use uma das seguintes: {NEIGHBOR_MODES}")
+
+    def apply(self, X, y, random_state = 42):
+        """
+        Aplica SMOTE (com sampling_strategy='auto', todas as classes igualadas à
+        majoritária, como o SMOTE padrão).
+
+        Diferenças em relação ao SmoteBalancing: a busca de vizinhos de cada classe
+        usa várias threads (ou um índice aproximado por buckets), as distâncias e a
+        interpolação são feitas em float32 quando X já é compacto e as amostras
+        sintéticas são escritas em blocos direto na matriz de saída, pré-alocada,
+        em vez de concatenadas ao final.
+
+        Args:
+            X: Features
+            y: Target
+            random_state: Seed para reprodutibilidade
+
+        Returns:
+            Tuple com X e y balanceados
+        """
+        if self.categorical_features or not isinstance(X, pd.DataFrame):
+            self.logger.info("SMOTE rápido indisponível para colunas categóricas ou matrizes esparsas; usando SMOTE padrão")
+            return SmoteBalancing(self.categorical_features, self.sampling_strategy).apply(X, y, random_state)
+
+        self.logger.info(f"Aplicando SMOTE rápido (vizinhos: {self.neighbors}, k={self.k_neighbors})...")
+        self.log_class_distribution(y, "antes do SMOTE")
+
+        dtype = np.float32 if all(dtype.itemsize <= 4 for dtype in X.dtypes) else np.float64
+        values = X.to_numpy(dtype=dtype)
+        labels = np.asarray(y)
+        classes, counts = np.unique(labels, return_counts=True)
+        if self.sampling_strategy == 'auto':
+            n_new = counts.max() - counts
+        else:
+            n_new = np.array([max(self.sampling_strategy.get(c, n) - n, 0) for c, n in zip(classes, counts)])
+
+        balanced = np.empty((len(values) + n_new.sum(), values.shape[1]), dtype=dtype)
+        balanced[:len(values)] = values
+        balanced_labels = np.concatenate([labels] + [np.repeat(c, n) for c, n in zip(classes, n_new)])
+
+        rng = np.random.default_rng(random_state)
+        position = len(values)
+        for classe, n_samples in zip(classes, n_new):
+            if n_samples == 0:
+                continue
+            class_values = values[labels == classe]
+            self._generate(class_values, n_samples, balanced[position:position + n_samples], rng, random_state)
+            position += n_samples
+        del values
+
+        X_balanced = pd.DataFrame(balanced, columns=X.columns, copy=False)
+        X_balanced = restore_integer_dtypes(X_balanced, X.dtypes)
+        y_balanced = pd.Series(balanced_labels, name=y.name)
+
+        self.log_class_distribution(y_balanced, "após SMOTE")
+        return X_balanced, y_balanced
+
+    def _generate(self, class_values: np.ndarray, n_samples: int, out: np.ndarray, rng: np.random.Generator, random_state: int) -> None:
+        """Escreve em out as n_samples amostras interpoladas entre linhas da classe e seus vizinhos."""
+        k = min(self.k_neighbors, len(class_values) - 1)
+        if k < 1:
+            out[:] = class_values[0]
+            return
+
+        if self.neighbors == 'bucketed':
+            neighbors = bucketed_kneighbors(class_values, k, max(self.bucket_size, k + 1), self.n_jobs, random_state)
+        else:
+            neighbors = exact_kneighbors(class_values, k, self.n_jobs)
+
+        for start in range(0, n_samples, self.chunk_size):
+            stop = min(start + self.chunk_size, n_samples)
+            rows = rng.integers(0, len(class_values), stop - start)
+            neighbor_rows = neighbors[rows, rng.integers(0, k, stop - start)]
+            gaps = rng.random(stop - start, dtype=out.dtype)[:, np.newaxis]
+            base = class_values[rows]
+            out[start:stop] = base + gaps * (class_values[neighbor_rows] - base)
@@ -1,7 +1,16 @@
+from typing import Dict, Union
+
 from imblearn.over_sampling import RandomOverSampler
 from .data_balancing_strategy import DataBalancingStrategy
 
 class RandomOversamplingBalancing(DataBalancingStrategy):
+    def __init__(self, sampling_strategy: Union[str, Dict] = 'auto'):
+        """
+        Args:
+            sampling_strategy: Contagem final de cada classe ({classe: linhas}) ou 'auto'
+        """
+        self.sampling_strategy = sampling_strategy
+    
     def apply(self, X, y, random_state = 42):
         """
         Aplica Random Oversampling para balancear as classes.
@@ -17,7 +26,7 @@ class RandomOversamplingBalancing(DataBalancingStrategy):
         self.logger.info("Aplicando Random Oversampling...")
         self.log_class_distribution(y, "antes do oversampling")
         
-        oversample = RandomOverSampler(random_state=random_state)
+        oversample = RandomOverSampler(sampling_strategy=self.sampling_strategy, random_state=random_state)
         X_balanced, y_balanced = oversample.fit_resample(X, y)
         
         self.log_class_distribution(y_balanced, "após oversampling")
@@ -1,12 +1,21 @@
+from typing import Dict, Union
+
 from .data_balancing_strategy import DataBalancingStrategy
 from imblearn.under_sampling import RandomUnderSampler
 
 class RandomUndersamplingBalancing(DataBalancingStrategy):
+    def __init__(self, sampling_strategy: Union[str, Dict] = 'auto'):
+        """
+        Args:
+            sampling_strategy: Contagem final de cada classe ({classe: linhas}) ou 'auto'
+        """
+        self.sampling_strategy = sampling_strategy
+    
     def apply(self, X, y, random_state = 42):
         self.logger.info("Aplicando Random Undersampling...")
         self.log_class_distribution(y, "antes do undersampling")
         
-        undersample = RandomUnderSampler(random_state=random_state)
+        undersample = RandomUnderSampler(sampling_strategy=self.sampling_strategy, random_state=random_state)
         X_balanced, y_balanced = undersample.fit_resample(X, y)
         
         self.log_class_distribution(y_balanced, "após undersampling")
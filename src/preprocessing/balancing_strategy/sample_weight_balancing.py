@@ -0,0 +1,31 @@
+import numpy as np
+from sklearn.utils.class_weight import compute_sample_weight
+
+from .data_balancing_strategy import DataBalancingStrategy
+
+class SampleWeightBalancing(DataBalancingStrategy):
+    # Não reamostra: não há treino balanceado para guardar em cache
+    cacheable = False
+    
+    def apply(self, X, y, random_state = 42):
+        """
+        Balanceamento por pesos: mantém X e y como estão e calcula o peso de cada
+        amostra (n_amostras / (n_classes * n_amostras_da_classe), o mesmo de
+        class_weight='balanced'), passado ao fit dos modelos como sample_weight.
+        
+        Args:
+            X: Features
+            y: Target
+            random_state: Não utilizado (sem sorteio)
+            
+        Returns:
+            Tuple com X e y originais; os pesos ficam em sample_weight
+        """
+        self.logger.info("Aplicando balanceamento por pesos (sample_weight)...")
+        self.log_class_distribution(y, "sem reamostragem")
+        
+        self.sample_weight = compute_sample_weight('balanced', y)
+        
+        for classe, peso in sorted(dict(zip(np.asarray(y), self.sample_weight)).items()):
+            self.logger.info(f"- Peso da classe {classe}: {peso:.4f}")
+        return X, y
@@ -1,12 +1,34 @@
-from imblearn.over_sampling import SMOTE
+from typing import Dict, List, Optional, Union
 
+import pandas as pd
+from imblearn.over_sampling import SMOTE, SMOTENC
+
+from preprocessing.kernels import restore_integer_dtypes
 from .data_balancing_strategy import DataBalancingStrategy
 
 class SmoteBalancing(DataBalancingStrategy):
+    def __init__(
+        self,
+        categorical_features: Optional[List[str]] = None,
+        sampling_strategy: Union[str, Dict] = 'auto'
+    ):
+        """
+        Args:
+            categorical_features: Colunas de códigos categóricos. Com elas, usa SMOTENC,
+                que copia a categoria mais frequente entre os vizinhos em vez de interpolar
+            sampling_strategy: Contagem final de cada classe ({classe: linhas}) ou
+                'auto' (todas as classes igualadas à majoritária)
+        """
+        self.categorical_features = categorical_features
+        self.sampling_strategy = sampling_strategy
+    
     def apply(self, X, y, random_state = 42):
         """
         Aplica SMOTE para balancear as classes.
         
+        Colunas inteiras (matriz compacta: flags 0/1, códigos ordinais) são interpoladas
+        em float32 e arredondadas de volta ao tipo original, em vez de truncadas.
+        
         Args:
             X: Features
             y: Target
@@ -18,8 +40,22 @@ class SmoteBalancing(DataBalancingStrategy):
         self.logger.info("Aplicando SMOTE...")
         self.log_class_distribution(y, "antes do SMOTE")
         
-        smote = SMOTE(random_state=random_state)
+        integer_columns = []
+        if isinstance(X, pd.DataFrame):
+            original_dtypes = X.dtypes
+            integer_columns = X.select_dtypes(include='integer').columns
+            if len(integer_columns):
+                X = X.astype({col: 'float32' for col in integer_columns})
+        
+        if self.categorical_features:
+            smote = SMOTENC(categorical_features=self.categorical_features,
+                            sampling_strategy=self.sampling_strategy, random_state=random_state)
+        else:
+            smote = SMOTE(sampling_strategy=self.sampling_strategy, random_state=random_state)
         X_balanced, y_balanced = smote.fit_resample(X, y)
         
+        if len(integer_columns):
+            X_balanced = restore_integer_dtypes(X_balanced, original_dtypes)
+        
         self.log_class_distribution(y_balanced, "após SMOTE")
-        return X_balanced, y_balanced
\ No newline at end of file
+        return X_balanced, y_balanced
@@ -0,0 +1,148 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from config.config_project import PROJECT_ROOT, ConfigProject
+from config.inject_logger import inject_logger
+
+# Formato -> (extensão, função de escrita)
+FORMATS = {
+    'parquet': ('.parquet', lambda df, path: df.to_parquet(path, index=False)),
+    'csv': ('.csv', lambda df, path: df.to_csv(path, index=False))
+}
+
+# Formato -> função de leitura
+READERS = {
+    'parquet': pd.read_parquet,
+    'csv': pd.read_csv
+}
+
+
+@inject_logger
+class CheckpointWriter:
+    """
+    Grava checkpoints intermediários do pré-processamento (ex.: dataset após o
+    feature engineering).
+
+    Por padrão os arquivos são gravados em Parquet em uma thread de fundo, e o
+    pipeline segue executando enquanto o arquivo é escrito; flush() aguarda as
+    gravações pendentes. O DataFrame recebido não deve ser alterado no lugar
+    enquanto a gravação estiver pendente (as etapas do pipeline sempre devolvem
+    novos DataFrames).
+
+    As opções padrão vêm da seção 'checkpoints' do config.yaml.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        file_format: Optional[str] = None,
+        background: Optional[bool] = None,
+        output_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            enabled: Grava os checkpoints (False desativa a escrita por completo)
+            file_format: Formato dos arquivos ('parquet' ou 'csv')
+            background: Grava em uma thread de fundo em vez de bloquear a etapa
+            output_dir: Pasta de destino, relativa à raiz do projeto (padrão: paths.output_files)
+        """
+        config = ConfigProject()
+
+        self.enabled = bool(config.get("checkpoints.enabled", True) if enabled is None else enabled)
+        self.file_format = file_format or config.get("checkpoints.format", "parquet")
+        self.background = bool(config.get("checkpoints.background", True) if background is None else background)
+
+        if self.file_format not in FORMATS:
+            raise ValueError(f"Formato de checkpoint inválido: {self.file_format}. "
+                             f"Use um dos seguintes: {list(FORMATS)}")
+
+        if output_dir is None:
+            output_dir = config.get("paths.output_files")
+            if not output_dir:
+                self.logger.warning("Caminho de output não encontrado no config.yaml. Usando caminho padrão 'files/processed'")
+                output_dir = "files/processed"
+        self.output_dir = PROJECT_ROOT / output_dir
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[Path, Future]] = []
+
+    def __getstate__(self) -> dict:
+        # A thread de gravação e as gravações pendentes ficam no processo de origem
+        return {**self.__dict__, '_executor': None, '_pending': []}
+
+    def __repr__(self) -> str:
+        # Representação estável: entra na chave do cache de etapas via get_params
+        return (f"CheckpointWriter(enabled={self.enabled}, file_format='{self.file_format}', "
+                f"background={self.background})")
+
+    def write(self, df: pd.DataFrame, name: str) -> Optional[Path]:
+        """
+        Grava o DataFrame como checkpoint.
+
+        Args:
+            df: DataFrame a ser gravado
+            name: Nome do arquivo, sem extensão
+
+        Returns:
+            Caminho do arquivo (a gravação pode ainda estar em andamento) ou None se desativado
+        """
+        if not self.enabled:
+            return None
+
+        path = self.path(name)
+        if not self.background:
+            self._write(df, path)
+            return path
+
+        if self._executor is None:
+            # Uma única thread mantém as gravações em ordem
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._pending.append((path, self._executor.submit(self._write, df, path)))
+        self.logger.info(f"Gravação do checkpoint iniciada em segundo plano: {path}")
+        return path
+
+    def path(self, name: str) -> Path:
+        """Caminho do checkpoint no formato configurado."""
+        extension, _ = FORMATS[self.file_format]
+        return self.output_dir / f"{name}{extension}"
+
+    def read(self, name: str) -> pd.DataFrame:
+        """
+        Lê um checkpoint gravado no formato configurado (aguarda as gravações pendentes).
+
+        Args:
+            name: Nome do arquivo, sem extensão
+        """
+        self.flush()
+        return READERS[self.file_format](self.path(name))
+
+    def flush(self) -> List[Path]:
+        """
+        Aguarda as gravações pendentes.
+
+        Returns:
+            Caminhos dos checkpoints gravados com sucesso
+        """
+        written = []
+        for path, future in self._pending:
+            try:
+                future.result()
+                written.append(path)
+            except Exception as e:
+                self.logger.error(f"Erro ao gravar o checkpoint {path}: {str(e)}")
+        self._pending = []
+        return written
+
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Grava em um arquivo temporário e renomeia, para que um checkpoint
+        # incompleto nunca seja lido
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        _, write = FORMATS[self.file_format]
+        write(df, tmp_path)
+        tmp_path.replace(path)
+        self.logger.info(f"Dataset processado salvo em: {path}")
@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from config.config_project import ConfigProject
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def column_workers(workers: Optional[int] = None) -> int:
+    """Número de threads para laços por coluna (padrão: column_parallel.workers do config.yaml)."""
+    if workers is None:
+        workers = ConfigProject().get("column_parallel.workers", 1)
+    return max(1, int(workers or 1))
+
+
+def map_columns(function: Callable[[T], R], items: Sequence[T], workers: int = 1) -> List[R]:
+    """
+    Aplica function a cada item (normalmente uma coluna) em um pool de threads.
+
+    Os resultados voltam na ordem dos itens, independentemente da ordem de conclusão,
+    então quem monta o DataFrame a partir deles obtém sempre a mesma ordem de colunas.
+    O ganho vem das partes que liberam o GIL (operações numpy/pandas vetorizadas);
+    código Python puro continua serializado.
+
+    Args:
+        function: Função aplicada a cada item
+        items: Itens independentes entre si
+        workers: Número de threads (1 executa no laço comum, sem pool)
+    """
+    if workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items)), thread_name_prefix="column") as pool:
+        return list(pool.map(function, items))
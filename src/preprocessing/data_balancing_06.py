@@ -1,24 +1,41 @@
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from typing import Any, List, Optional, Tuple
 from config.inject_logger import inject_logger
-from preprocessing.balancing_strategy import DataBalancingStrategy, SmoteBalancing, RandomOversamplingBalancing, RandomUndersamplingBalancing, CombinedSamplingBalancing
+from preprocessing.balancing_strategy import DataBalancingStrategy, SmoteBalancing, RandomOversamplingBalancing, RandomUndersamplingBalancing, CombinedSamplingBalancing, SampleWeightBalancing, FastSmoteBalancing, BudgetedBalancing
 
 
-VALID_STRATEGIES = ['smote', 'random_over', 'random_under', 'combined']
+VALID_STRATEGIES = ['smote', 'fast_smote', 'random_over', 'random_under', 'combined', 'sample_weight', 'budgeted']
 
 @inject_logger
 class DataBalance:
     """
     Classe responsável pelo aplicação do balanceamento dos dados do dataset de acidentes.
-    Implementa diferentes estratégias de balanceamento (oversampling e undersampling).
+    Implementa diferentes estratégias de balanceamento (oversampling, undersampling e
+    pesos por amostra).
     """
+    
+    # Pesos por amostra do último balance_data (estratégia 'sample_weight'), alinhados a y
+    sample_weight: Optional[np.ndarray] = None
+    
+    def __init__(self, cache: Optional[Any] = None):
+        """
+        Args:
+            cache: Cache dos treinos balanceados (ex.: pipelines.balance_cache.BalanceCache).
+                Com ele, X e y balanceados são reaproveitados para o mesmo treino,
+                estratégia, parâmetros e random_state
+        """
+        self.cache = cache
+        # Último balance_data veio do cache
+        self.cache_hit = False
+    
     def balance_data(
         self,
         X: pd.DataFrame,
         y: pd.Series,
         strategy: str = 'smote',
-        random_state: int = 42
+        random_state: int = 42,
+        categorical_features: Optional[List[str]] = None
     ) -> Tuple[pd.DataFrame, pd.Series]:
         """
         Método principal para balanceamento dos dados.
@@ -26,8 +43,15 @@ class DataBalance:
         Args:
             X: Features
             y: Target
-            strategy: Estratégia de balanceamento ('smote', 'random_over', 'random_under', 'combined')
+            strategy: Estratégia de balanceamento ('smote', 'fast_smote', 'random_over', 'random_under',
+                'combined', 'sample_weight', 'budgeted'). 'fast_smote' é o SMOTE com busca de
+                vizinhos em paralelo ou aproximada (ver FastSmoteBalancing); 'budgeted' combina
+                undersampling e oversampling dentro do orçamento de balancing.budget
+                (ver BudgetedBalancing). Com 'sample_weight' X e y não mudam; os pesos ficam em
+                self.sample_weight para o fit dos modelos
             random_state: Seed para reprodutibilidade
+            categorical_features: Colunas de códigos categóricos (modo nativo), que o SMOTE
+                não interpola (SMOTENC)
             
         Returns:
             Tuple com X e y balanceados
@@ -40,16 +64,36 @@ class DataBalance:
         balancing_strategy: DataBalancingStrategy = None
         
         if strategy == 'smote':
-            balancing_strategy = SmoteBalancing()
+            balancing_strategy = SmoteBalancing(categorical_features)
+        elif strategy == 'fast_smote':
+            balancing_strategy = FastSmoteBalancing(categorical_features)
         elif strategy == 'random_over':
             balancing_strategy = RandomOversamplingBalancing()
         elif strategy == 'random_under':
-            balancing_strategy = RandomUndersamplingBalancing
+            balancing_strategy = RandomUndersamplingBalancing()
         elif strategy == "combined":  # combined
-            balancing_strategy = CombinedSamplingBalancing()
+            balancing_strategy = CombinedSamplingBalancing(categorical_features)
+        elif strategy == 'sample_weight':
+            balancing_strategy = SampleWeightBalancing()
+        elif strategy == 'budgeted':
+            balancing_strategy = BudgetedBalancing(categorical_features)
         else:
             raise ValueError(
                 f"Estratégia {strategy} inválida. Use uma das seguintes: {VALID_STRATEGIES}"
             )
         
-        return balancing_strategy.apply(X=X, y=y, random_state=random_state)
\ No newline at end of file
+        key = None
+        self.cache_hit = False
+        if self.cache is not None and balancing_strategy.cacheable and isinstance(X, pd.DataFrame):
+            key = self.cache.balance_key(X, y, strategy, balancing_strategy, random_state)
+            if self.cache.lookup(key, strategy):
+                self.sample_weight = None
+                self.cache_hit = True
+                return self.cache.load_balanced(key)
+        
+        X_balanced, y_balanced = balancing_strategy.apply(X=X, y=y, random_state=random_state)
+        self.sample_weight = balancing_strategy.sample_weight
+        
+        if key is not None:
+            self.cache.save_balanced(key, X_balanced, y_balanced)
+        return X_balanced, y_balanced
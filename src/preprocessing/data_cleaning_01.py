@@ -1,6 +1,10 @@
+from typing import Optional
+
 import pandas as pd
 import numpy as np
+from config.config_project import PROJECT_ROOT, ConfigProject
 from config.inject_logger import inject_logger
+from preprocessing.kernels import FingerprintIndex, compute_row_fingerprints
 
 COLUMNS_TO_DROP = ['id', 'unnamed: 0', 'uf', 'tracado_via', 'feridos','fase_dia']
 
@@ -11,9 +15,39 @@ class DataCleaning:
     Classe responsável pela limpeza e preparação do dataset de acidentes.
     """
     
-    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+    def __init__(self, fingerprint_index_path: Optional[str] = None):
+        """
+        Args:
+            fingerprint_index_path: Caminho do índice persistido de fingerprints. Quando
+                informado (ou definido em cleaning.fingerprint_index no config.yaml), linhas
+                já vistas em execuções anteriores são descartadas (carga incremental).
+                As linhas novas só entram no índice gravado com commit_fingerprints, ao
+                final de uma execução bem-sucedida.
+        """
+        if fingerprint_index_path is None:
+            fingerprint_index_path = ConfigProject().get("cleaning.fingerprint_index")
+        
+        self.fingerprint_index = None
+        if fingerprint_index_path:
+            self.fingerprint_index = FingerprintIndex(PROJECT_ROOT / fingerprint_index_path)
+        
+        # Linhas novas da execução em andamento, ainda não gravadas no índice
+        self.pending_fingerprints = FingerprintIndex()
+    
+    def apply(
+        self,
+        df: pd.DataFrame,
+        seen: Optional[FingerprintIndex] = None,
+        persist: bool = True
+    ) -> pd.DataFrame:
         """
         Aplica todas as etapas de limpeza no dataset na ordem correta.
+        
+        Args:
+            df: DataFrame (ou bloco de linhas) a ser limpo
+            seen: Fingerprints das linhas mantidas em blocos anteriores (ver remove_duplicates)
+            persist: Registra as linhas novas para o índice de fingerprints configurado
+                (ver commit_fingerprints)
         """
         self.logger.info(f"Iniciando processo de limpeza do dataset... Shape: {df.shape}")
         
@@ -24,44 +58,104 @@ class DataCleaning:
         df = self.handle_missing_values(df)
         
         # Remover duplicatas
-        df = self.remove_duplicates(df)
+        df = self.remove_duplicates(df, seen=seen, persist=persist)
         
         self.logger.info("Processo de limpeza concluído com sucesso!")
         return df
     
     # Colunas para remover
 
-    def remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove registros duplicados do dataset."""
+    def remove_duplicates(
+        self,
+        df: pd.DataFrame,
+        seen: Optional[FingerprintIndex] = None,
+        persist: bool = True
+    ) -> pd.DataFrame:
+        """
+        Remove registros duplicados do dataset.
+        
+        A comparação é feita sobre um fingerprint de 64 bits por linha em vez de
+        todas as colunas. Se houver índice de fingerprints configurado, também
+        remove as linhas já processadas em cargas anteriores; as linhas mantidas ficam
+        pendentes até commit_fingerprints.
+        
+        Args:
+            df: DataFrame (ou bloco de linhas)
+            seen: Índice em memória com as linhas mantidas em blocos anteriores da mesma
+                execução; essas linhas também são removidas e o índice é atualizado
+            persist: Registra as linhas novas para o índice de fingerprints configurado
+                (ver commit_fingerprints)
+        """
         initial_count = len(df)
-        df = df.drop_duplicates()
-        duplicates_removed = initial_count - len(df)
+        fingerprints = compute_row_fingerprints(df)
+        
+        keep = ~fingerprints.duplicated().to_numpy()
+        if seen is not None:
+            keep &= ~seen.contains(fingerprints)
+        duplicates_removed = initial_count - int(keep.sum())
         self.logger.info(f"Removidos {duplicates_removed} registros duplicados.")
-        return df
+        
+        if self.fingerprint_index is not None:
+            already_seen = self.fingerprint_index.contains(fingerprints) & keep
+            keep &= ~already_seen
+            self.logger.info(f"Removidos {int(already_seen.sum())} registros já processados em cargas anteriores.")
+            
+            if persist:
+                self.pending_fingerprints.update(fingerprints[keep])
+        
+        if seen is not None:
+            seen.update(fingerprints[keep])
+        
+        return df[keep]
+
+    def commit_fingerprints(self) -> None:
+        """
+        Grava no índice de fingerprints as linhas pendentes da execução.
+
+        Deve ser chamado só após a execução inteira terminar com sucesso: se uma etapa
+        posterior falhar, as linhas não ficam marcadas como processadas e voltam na
+        próxima carga (ver rollback_fingerprints).
+        """
+        if self.fingerprint_index is not None and len(self.pending_fingerprints):
+            self.fingerprint_index.update(self.pending_fingerprints.fingerprints)
+            self.fingerprint_index.save()
+        self.pending_fingerprints = FingerprintIndex()
+
+    def rollback_fingerprints(self) -> None:
+        """Descarta as linhas pendentes de uma execução que não terminou."""
+        self.pending_fingerprints = FingerprintIndex()
 
     def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Remove linhas que contêm valores nulos, vazios ou variações de null do dataframe.
         """
         self.logger.info(f"QUANTIDADE DE LINHAS: {df.shape}")
-        df_clean = df.copy()
-        
-        null_values = ['null', '(null)', 'NULL', '(NULL)', 'NaN', 'nan', 'NAN', 
-                    'undefined', '', ' ', None]
-        
-        linhas_inicial = len(df_clean)
         
-        df_clean = df_clean.replace(null_values, np.nan)
+        null_values = {'null', '(null)', 'NULL', '(NULL)', 'NaN', 'nan', 'NAN', 
+                    'undefined', '', ' '}
         
-        def contem_apenas_espacos(x):
-            return isinstance(x, str) and x.isspace()
+        linhas_inicial = len(df)
         
-        mascara_espacos = pd.DataFrame(False, index=df_clean.index, columns=['remove'])
-        for coluna in df_clean.select_dtypes(include=['object']).columns:
-            mascara_espacos['remove'] |= df_clean[coluna].apply(contem_apenas_espacos)
+        # Monta uma única máscara de remoção, sem copiar o DataFrame a cada etapa.
+        # Para colunas texto, a verificação é feita sobre os valores distintos.
+        remover = np.zeros(linhas_inicial, dtype=bool)
+        for coluna in df.columns:
+            valores = df[coluna]
+            if valores.dtype == object:
+                codes, uniques = pd.factorize(valores)
+                if len(uniques) == 0:
+                    # Coluna inteiramente nula: todas as linhas são removidas
+                    remover[:] = True
+                    continue
+                invalidos = np.array(
+                    [v in null_values or (isinstance(v, str) and v.isspace()) for v in uniques],
+                    dtype=bool
+                )
+                remover |= (codes < 0) | invalidos[np.maximum(codes, 0)]
+            else:
+                remover |= valores.isna().to_numpy()
         
-        df_clean = df_clean.dropna()
-        df_clean = df_clean[~mascara_espacos['remove']]
+        df_clean = df[~remover]
         
         linhas_removidas = linhas_inicial - len(df_clean)
         percentual_removido = (linhas_removidas / linhas_inicial) * 100
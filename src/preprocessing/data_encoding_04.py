@@ -1,10 +1,18 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import LabelEncoder, OneHotEncoder, TargetEncoder
+from sklearn.preprocessing import LabelEncoder, OneHotEncoder
 
+from config.config_project import ConfigProject
 from config.inject_logger import inject_logger
+from preprocessing.column_parallel import column_workers, map_columns
+from preprocessing.data_split_05 import DataSplit
+from preprocessing.kernels import hash_buckets, hashed_indicators
+from preprocessing.sparse_features import SparseEncodedFrame
+from preprocessing.target_encoding import BatchedTargetEncoder
 
 
 @inject_logger
@@ -14,7 +22,22 @@ class DataEncoding:
     Estratégias:
     - OneHot: Para colunas com poucas categorias
     - Label: Para colunas com ordem implícita
-    - Target: Para colunas com muitas categorias
+    - Target: Para colunas com muitas categorias (uma coluna por classe do target)
+    - Hashing: Para as colunas escolhidas em encoding.hashing.columns (número fixo de
+      colunas indicadoras por coluna, sem vocabulário ajustado)
+    
+    O Target Encoding de todas as colunas é ajustado em uma única passada
+    (BatchedTargetEncoder). No fit_transform, as linhas do próprio conjunto de ajuste
+    recebem codificações cruzadas (cross-fitting); no transform, as estatísticas
+    ajustadas são consultadas de forma vetorizada. O Label/Target Encoding de cada
+    coluna no transform é independente e pode ser executado em um pool de threads (workers).
+    
+    Em modo esparso (sparse_onehot), as colunas OneHot não voltam para o DataFrame:
+    o transform devolve um SparseEncodedFrame com elas em uma matriz CSR.
+    
+    Em modo nativo (native_categorical), para modelos com suporte próprio a variáveis
+    categóricas (CatBoost), não há OneHot, Target Encoding nem Hashing: cada coluna
+    categórica é mantida como uma única coluna de códigos inteiros (native_features).
     """
     
     # Colunas que possuem ordem implícita para Label Encoding
@@ -50,11 +73,55 @@ class DataEncoding:
         'ilesos'
     ]
     
-    def __init__(self):
-        """Inicializa os encoders e lista de colunas a serem removidas."""
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        sparse_onehot: bool = False,
+        hashing_columns: Optional[Dict[str, int]] = None,
+        native_categorical: bool = False,
+        target_smooth: Optional[Union[str, float]] = None,
+        target_cv: Optional[int] = None,
+        random_state: int = 42
+    ):
+        """
+        Inicializa os encoders e lista de colunas a serem removidas.
+        
+        Args:
+            workers: Threads para os laços por coluna (padrão: column_parallel.workers do config.yaml)
+            sparse_onehot: Mantém as colunas OneHot (e de hashing) em uma matriz CSR (float32)
+                em vez de colunas densas no DataFrame
+            hashing_columns: Colunas codificadas por feature hashing e o número de buckets de
+                cada uma (padrão: encoding.hashing.columns do config.yaml)
+            native_categorical: Mantém as colunas categóricas como códigos inteiros, sem
+                OneHot, Target Encoding ou Hashing (ver native_features)
+            target_smooth: Suavização do Target Encoding, "auto" ou o peso m da média global
+                (padrão: encoding.target_encoding.smooth do config.yaml)
+            target_cv: Dobras do cross-fitting do Target Encoding
+                (padrão: encoding.target_encoding.cv do config.yaml)
+            random_state: Seed da divisão em dobras do cross-fitting do Target Encoding
+        
+        Raises:
+            ValueError: Se sparse_onehot e native_categorical forem usados juntos
+        """
+        if sparse_onehot and native_categorical:
+            raise ValueError("sparse_onehot e native_categorical são incompatíveis: o modo nativo não gera colunas OneHot")
+        
+        self.workers = column_workers(workers)
+        self.sparse_onehot = sparse_onehot
+        if hashing_columns is None:
+            hashing_columns = ConfigProject().get("encoding.hashing.columns", {}) or {}
+        self.hashing_columns = {col: int(n_buckets) for col, n_buckets in hashing_columns.items()}
+        self.hashing_features = []
+        self.native_categorical = native_categorical
+        self.native_features = []
+        self.categories: Dict[str, pd.Index] = {}
         self.label_encoders = {}
         self.onehot_encoder = None
-        self.target_encoders = {}
+        config = ConfigProject()
+        self.target_smooth = target_smooth if target_smooth is not None else config.get("encoding.target_encoding.smooth", "auto")
+        self.target_cv = target_cv if target_cv is not None else config.get("encoding.target_encoding.cv", 5)
+        self.random_state = random_state
+        self.target_encoder = self._create_target_encoder()
         self.onehot_features = None
         self.target_features = None
         self.columns_to_remove = self._COLUMNS_TO_REMOVE.copy()
@@ -83,11 +150,11 @@ class DataEncoding:
         Returns:
             DataFrame sem as colunas removidas
         """
-        df_cleaned = df.copy()
-        columns_present = [col for col in self.columns_to_remove if col in df_cleaned.columns]
+        columns_present = [col for col in self.columns_to_remove if col in df.columns]
         
+        # drop sempre retorna um novo DataFrame, então o original nunca é alterado
+        df_cleaned = df.drop(columns=columns_present)
         if columns_present:
-            df_cleaned = df_cleaned.drop(columns=columns_present)
             self.logger.info(f"Removidas as colunas: {columns_present}")
         
         return df_cleaned
@@ -109,8 +176,10 @@ class DataEncoding:
         target_columns = []
         
         for col in df.select_dtypes(include=['object', 'category']).columns:
-            # Pula a coluna target e colunas ordinais
-            if col == target_column or col in self.ORDINAL_COLUMNS:
+            # Pula a coluna target, colunas ordinais, colunas com hashing e colunas descartadas
+            # no split (o Target Encoding gera uma coluna por classe, que o split não reconheceria)
+            if (col == target_column or col in self.ORDINAL_COLUMNS or col in self.hashing_columns
+                    or col in DataSplit.COLUMNS_TO_DROP):
                 continue
                 
             n_unique = df[col].nunique()
@@ -138,10 +207,39 @@ class DataEncoding:
         df_cleaned = self._remove_columns(df)
         
         # Identificar colunas categóricas e estratégias
+        self._fit(df_cleaned, target_column, max_categories_onehot)
+        self.target_encoder.fit(df_cleaned, self.target_features, df_cleaned[target_column])
+
+    def _fit(self, df_cleaned: pd.DataFrame, target_column: str, max_categories_onehot: int) -> None:
+        """Ajusta a escolha de estratégias e os encoders Label e OneHot."""
         self.onehot_features, self.target_features = self._identify_categorical_columns(
             df_cleaned, target_column, max_categories_onehot
         )
         
+        hashing_features = [
+            col for col in self.hashing_columns if col in df_cleaned.columns and col != target_column
+        ]
+        if self.native_categorical:
+            # Todas as colunas categóricas viram códigos do vocabulário visto no ajuste
+            self.native_features = self.onehot_features + self.target_features + hashing_features
+            self.onehot_features, self.target_features = [], []
+            self.categories = {
+                col: pd.Index(df_cleaned[col].dropna().unique()).sort_values()
+                for col in self.native_features
+            }
+            self.logger.info(f"Colunas categóricas nativas (códigos inteiros): {self.native_features}")
+        else:
+            self.hashing_features = hashing_features
+        
+        # Feature Hashing não ajusta nada; só registra a ocupação dos buckets (colisões)
+        for col in self.hashing_features:
+            uniques = pd.Series(df_cleaned[col].unique())
+            occupied = len(np.unique(hash_buckets(uniques, self.hashing_columns[col])))
+            self.logger.info(
+                f"Feature Hashing em {col}: {len(uniques)} valores distintos em "
+                f"{self.hashing_columns[col]} buckets ({occupied} ocupados)"
+            )
+        
         # Ajustar Label Encoders para colunas ordinais
         for col in self.ORDINAL_COLUMNS:
             if col in df_cleaned.columns:
@@ -155,20 +253,40 @@ class DataEncoding:
         if self.onehot_features:
             self.onehot_encoder = ColumnTransformer(
                 transformers=[
-                    ('onehot', OneHotEncoder(drop='first', sparse_output=False), self.onehot_features)
+                    ('onehot', self._create_onehot_encoder(), self.onehot_features)
                 ],
-                remainder='passthrough'
+                remainder='passthrough',
+                # Em modo esparso a saída é sempre esparsa, qualquer que seja a densidade
+                sparse_threshold=1.0 if self.sparse_onehot else 0.3
             )
             self.onehot_encoder.fit(df_cleaned[self.onehot_features])
             self.logger.info(f"OneHot Encoder ajustado para {self.onehot_features}")
-        
-        # Ajustar Target Encoders
-        for col in self.target_features:
-            self.target_encoders[col] = TargetEncoder()
-            self.target_encoders[col].fit(df_cleaned[[col]], df_cleaned[target_column])
-            self.logger.info(f"Target Encoder ajustado para {col}")
 
-    def transform(self, df: pd.DataFrame, target_column: str) -> pd.DataFrame:
+    def _create_target_encoder(self) -> BatchedTargetEncoder:
+        return BatchedTargetEncoder(smooth=self.target_smooth, cv=self.target_cv, random_state=self.random_state)
+
+    def _create_onehot_encoder(self) -> OneHotEncoder:
+        if self.sparse_onehot:
+            return OneHotEncoder(drop='first', sparse_output=True, dtype=np.float32)
+        return OneHotEncoder(drop='first', sparse_output=False)
+    
+    def onehot_feature_names(self) -> List[str]:
+        """Nomes das colunas geradas pelo OneHot, na ordem da matriz codificada."""
+        feature_names = []
+        for i, feature in enumerate(self.onehot_features or []):
+            categories = self.onehot_encoder.named_transformers_['onehot'].categories_[i][1:]
+            feature_names.extend([f"{feature}_{cat}" for cat in categories])
+        return feature_names
+    
+    def hashing_feature_names(self) -> List[str]:
+        """Nomes das colunas indicadoras do Feature Hashing, na ordem da matriz codificada."""
+        return [
+            f"{col}_hash_{bucket}"
+            for col in self.hashing_features
+            for bucket in range(self.hashing_columns[col])
+        ]
+    
+    def transform(self, df: pd.DataFrame, target_column: str) -> Union[pd.DataFrame, SparseEncodedFrame]:
         """
         Aplica as transformações no DataFrame.
         
@@ -177,49 +295,112 @@ class DataEncoding:
             target_column: Nome da coluna target que não deve ser encodada
             
         Returns:
-            DataFrame com encodings aplicados
+            DataFrame com encodings aplicados (SparseEncodedFrame em modo esparso)
+        """
+        return self._transform(df, target_column)
+    
+    def _transform(
+        self,
+        df: pd.DataFrame,
+        target_column: str,
+        target_values: Optional[Dict[str, np.ndarray]] = None
+    ) -> Union[pd.DataFrame, SparseEncodedFrame]:
+        """
+        Args:
+            target_values: Codificações já calculadas por coluna (cross-fitting do fit_transform)
         """
         # Remover colunas especificadas
         df_transformed = self._remove_columns(df)
         
         # Aplicar Label Encoding para colunas ordinais
-        for col, encoder in self.label_encoders.items():
-            if col in df_transformed.columns:
-                df_transformed[col] = encoder.transform(df_transformed[col].astype(str))
-                self.logger.info(f"Label Encoding aplicado em {col}")
+        def label_encode(col: str):
+            values = self.label_encoders[col].transform(df_transformed[col].astype(str))
+            self.logger.info(f"Label Encoding aplicado em {col}")
+            return values
+        
+        label_columns = [col for col in self.label_encoders if col in df_transformed.columns]
+        for col, values in zip(label_columns, map_columns(label_encode, label_columns, self.workers)):
+            df_transformed[col] = values
+        
+        # Modo nativo: códigos inteiros do vocabulário ajustado (-1 para categorias não vistas)
+        def category_codes(col: str) -> np.ndarray:
+            return self.categories[col].get_indexer(df_transformed[col]).astype(np.int32)
+        
+        native_columns = [col for col in self.native_features if col in df_transformed.columns]
+        if native_columns:
+            codes = map_columns(category_codes, native_columns, self.workers)
+            df_transformed = df_transformed.assign(**dict(zip(native_columns, codes)))
+            self.logger.info(f"Códigos categóricos aplicados em {native_columns}")
+        
+        # Aplicar Target Encoding: cada coluna é substituída por uma coluna por classe
+        # (antes do OneHot, para que as colunas OneHot fiquem no final nos dois modos)
+        def target_encode(col: str) -> np.ndarray:
+            if target_values is not None:
+                return target_values[col]
+            return self.target_encoder.transform_column(df_transformed[col], col)
+        
+        target_columns = [col for col in self.target_encoder.columns if col in df_transformed.columns]
+        if target_columns:
+            encoded = map_columns(target_encode, target_columns, self.workers)
+            target_df = pd.DataFrame(
+                np.hstack(encoded),
+                columns=[name for col in target_columns for name in self.target_encoder.output_names(col)],
+                index=df_transformed.index
+            )
+            df_transformed = pd.concat([df_transformed.drop(columns=target_columns), target_df], axis=1)
+            self.logger.info(f"Target Encoding aplicado em {target_columns}")
         
         # Aplicar OneHot Encoding
+        onehot_matrix = None
         if self.onehot_features:
             onehot_array = self.onehot_encoder.transform(df_transformed[self.onehot_features])
             
-            # Criar nomes para as novas colunas
-            feature_names = []
-            for i, feature in enumerate(self.onehot_features):
-                categories = self.onehot_encoder.named_transformers_['onehot'].categories_[i][1:]
-                feature_names.extend([f"{feature}_{cat}" for cat in categories])
-            
             # Substituir colunas originais pelas codificadas
             df_transformed = df_transformed.drop(columns=self.onehot_features)
-            onehot_df = pd.DataFrame(onehot_array, columns=feature_names, index=df_transformed.index)
-            df_transformed = pd.concat([df_transformed, onehot_df], axis=1)
+            if self.sparse_onehot:
+                onehot_matrix = onehot_array.tocsr()
+            else:
+                onehot_df = pd.DataFrame(onehot_array, columns=self.onehot_feature_names(), index=df_transformed.index)
+                df_transformed = pd.concat([df_transformed, onehot_df], axis=1)
             self.logger.info(f"OneHot Encoding aplicado em {self.onehot_features}")
         
-        # Aplicar Target Encoding
-        for col, encoder in self.target_encoders.items():
-            if col in df_transformed.columns:
-                transformed_values = encoder.transform(df_transformed[[col]])
-                if transformed_values.ndim > 1:
-                    transformed_values = transformed_values.mean(axis=1)
-                df_transformed[col] = transformed_values
-                self.logger.info(f"Target Encoding aplicado em {col}")
+        # Aplicar Feature Hashing: um bloco de colunas indicadoras por coluna, de tamanho fixo
+        hashed_matrix = None
+        hashing_columns = [col for col in self.hashing_features if col in df_transformed.columns]
+        if hashing_columns:
+            def hash_encode(col: str) -> sparse.csr_matrix:
+                n_buckets = self.hashing_columns[col]
+                dtype = np.float32 if self.sparse_onehot else np.uint8
+                return hashed_indicators(hash_buckets(df_transformed[col], n_buckets), n_buckets, dtype=dtype)
+            
+            hashed_matrix = sparse.hstack(map_columns(hash_encode, hashing_columns, self.workers), format='csr')
+            df_transformed = df_transformed.drop(columns=hashing_columns)
+            if not self.sparse_onehot:
+                hashed_df = pd.DataFrame(
+                    hashed_matrix.toarray(), columns=self.hashing_feature_names(), index=df_transformed.index
+                )
+                df_transformed = pd.concat([df_transformed, hashed_df], axis=1)
+            self.logger.info(f"Feature Hashing aplicado em {hashing_columns}")
         
+        if self.sparse_onehot:
+            blocks = [matrix for matrix in (onehot_matrix, hashed_matrix) if matrix is not None]
+            indicators = (
+                sparse.hstack(blocks, format='csr') if blocks
+                else sparse.csr_matrix((len(df_transformed), 0), dtype=np.float32)
+            )
+            return SparseEncodedFrame(
+                df_transformed, indicators, self.onehot_feature_names() + self.hashing_feature_names()
+            )
         return df_transformed
 
     def fit_transform(self, df: pd.DataFrame, target_column: str, 
-                     max_categories_onehot: int = 5) -> pd.DataFrame:
+                     max_categories_onehot: int = 5) -> Union[pd.DataFrame, SparseEncodedFrame]:
         """
         Ajusta os encoders e aplica as transformações.
         
+        O Target Encoding das linhas de df usa codificações cruzadas: cada linha é
+        codificada com as estatísticas das demais dobras.
+        
         Args:
             df: DataFrame original
             target_column: Nome da coluna target que não deve ser encodada
@@ -228,8 +409,11 @@ class DataEncoding:
         Returns:
             DataFrame com encodings aplicados
         """
-        self.fit(df, target_column, max_categories_onehot)
-        return self.transform(df, target_column)
+        self.logger.info("Iniciando fit dos encoders...")
+        df_cleaned = self._remove_columns(df)
+        self._fit(df_cleaned, target_column, max_categories_onehot)
+        target_values = self.target_encoder.fit_transform(df_cleaned, self.target_features, df_cleaned[target_column])
+        return self._transform(df, target_column, target_values)
 
     def get_feature_names(self) -> Dict[str, List[str]]:
         """
@@ -241,7 +425,9 @@ class DataEncoding:
         feature_names = {
             'ordinal_encoded': list(self.label_encoders.keys()),
             'onehot_encoded': self.onehot_features if self.onehot_features else [],
-            'target_encoded': list(self.target_encoders.keys()),
+            'target_encoded': self.target_encoder.columns,
+            'hashed': self.hashing_features,
+            'native_categorical': self.native_features,
             'removed_columns': self.columns_to_remove
         }
         return feature_names
\ No newline at end of file
@@ -1,8 +1,11 @@
 import pandas as pd
 import numpy as np
+from scipy import sparse
 from sklearn.model_selection import train_test_split
-from typing import Tuple
+from typing import List, Optional, Tuple, Union
 from config.inject_logger import inject_logger
+from preprocessing.sparse_features import SparseEncodedFrame, sparse_memory_mb
+from preprocessing.split_indices import SplitIndexStore, SplitIndices, target_fingerprint
 
 
 @inject_logger
@@ -19,6 +22,16 @@ class DataSplit:
         'causa_acidente' # Usar causa acidente agrupado
     ]
     
+    def __init__(self, index_store: Optional[SplitIndexStore] = None):
+        """
+        Args:
+            index_store: Persiste as posições dos splits por fingerprint do target e
+                parâmetros (ver split_indices), reaproveitadas nas execuções seguintes
+        """
+        # Nomes das colunas das matrizes geradas no modo esparso (as matrizes CSR não têm colunas)
+        self.feature_names: Optional[List[str]] = None
+        self.index_store = index_store
+    
     def remove_unused_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Remove colunas que não serão utilizadas no modelo.
@@ -29,11 +42,10 @@ class DataSplit:
         Returns:
             DataFrame sem as colunas não utilizadas
         """
-        df = df.copy()
         columns_to_drop = [col for col in DataSplit.COLUMNS_TO_DROP if col in df.columns]
         
         if columns_to_drop:
-            df.drop(columns=columns_to_drop, inplace=True)
+            df = df.drop(columns=columns_to_drop)
             self.logger.info(f"Colunas removidas: {columns_to_drop}")
         
         return df
@@ -110,21 +122,178 @@ class DataSplit:
         
         return X_train, X_valid, X_test, y_train, y_valid, y_test
 
-    def prepare_data(
+    def split_indices(
+        self,
+        y: pd.Series,
+        test_size: float = 0.2,
+        valid_size: float = 0.2,
+        random_state: int = 42
+    ) -> SplitIndices:
+        """
+        Calcula as posições das linhas de treino, validação e teste.
+        
+        Os sorteios são os mesmos de split_data (dois train_test_split estratificados),
+        feitos sobre as posições das linhas em vez das features. Com index_store, as
+        posições são lidas do disco quando já foram calculadas para o mesmo target.
+        
+        Args:
+            y: Target
+            test_size: Proporção do conjunto de teste
+            valid_size: Proporção do conjunto de validação
+            random_state: Seed para reprodutibilidade
+        """
+        key = None
+        if self.index_store is not None:
+            fingerprint = target_fingerprint(y)
+            key = self.index_store.key(fingerprint, test_size, valid_size, random_state)
+            indices = self.index_store.load(key)
+            if indices is not None:
+                return indices
+        
+        positions = np.arange(len(y))
+        temp_positions, test_positions = train_test_split(
+            positions,
+            test_size=test_size,
+            random_state=random_state,
+            stratify=y
+        )
+        
+        valid_size_adjusted = valid_size / (1 - test_size)
+        train_positions, valid_positions = train_test_split(
+            temp_positions,
+            test_size=valid_size_adjusted,
+            random_state=random_state,
+            stratify=y.iloc[temp_positions]
+        )
+        indices = SplitIndices(train_positions, valid_positions, test_positions)
+        
+        if key is not None:
+            self.index_store.save(key, indices, fingerprint)
+        return indices
+
+    def split_by_index(
         self,
         df: pd.DataFrame,
         test_size: float = 0.2,
         valid_size: float = 0.2,
         random_state: int = 42
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, pd.Series]:
+        """
+        Separação dos dados a partir das posições dos splits (split_indices).
+        
+        As linhas são reordenadas uma única vez (treino | validação | teste) e cada
+        conjunto é uma fatia dessa cópia, sem cópia própria; as colunas não usadas e o
+        target são retirados da cópia sem copiar as demais. O resultado tem as mesmas
+        linhas, na mesma ordem e com o mesmo índice de split_data, mas o pico de memória
+        fica em torno de uma cópia do dataset em vez de três.
+        
+        Args:
+            df: DataFrame preparado (com as colunas não utilizadas)
+            test_size: Proporção do conjunto de teste
+            valid_size: Proporção do conjunto de validação
+            random_state: Seed para reprodutibilidade
+            
+        Returns:
+            Tuple contendo:
+            - X_train, X_valid, X_test: Fatias das features para treino, validação e teste
+            - y_train, y_valid, y_test: Target para treino, validação e teste
+        """
+        self.logger.info("Distribuição inicial das classes:")
+        self.check_target_distribution(df['gravidade_acidente'])
+        
+        indices = self.split_indices(df['gravidade_acidente'], test_size, valid_size, random_state)
+        
+        ordered = df.take(indices.order())
+        y = ordered.pop('gravidade_acidente')
+        columns_to_drop = [col for col in DataSplit.COLUMNS_TO_DROP if col in ordered.columns]
+        for col in columns_to_drop:
+            del ordered[col]
+        if columns_to_drop:
+            self.logger.info(f"Colunas removidas: {columns_to_drop}")
+        
+        train_end, valid_end = indices.bounds()
+        X_train, X_valid, X_test = ordered.iloc[:train_end], ordered.iloc[train_end:valid_end], ordered.iloc[valid_end:]
+        y_train, y_valid, y_test = y.iloc[:train_end], y.iloc[train_end:valid_end], y.iloc[valid_end:]
+        
+        self.logger.info("\nDimensões dos conjuntos:")
+        self.logger.info(f"- Treino: {X_train.shape}")
+        self.logger.info(f"- Validação: {X_valid.shape}")
+        self.logger.info(f"- Teste: {X_test.shape}")
+        
+        self.check_target_distribution(y_train, "Treino")
+        self.check_target_distribution(y_valid, "Validação")
+        self.check_target_distribution(y_test, "Teste")
+        
+        return X_train, X_valid, X_test, y_train, y_valid, y_test
+
+    def split_sparse(
+        self,
+        data: SparseEncodedFrame,
+        test_size: float = 0.2,
+        valid_size: float = 0.2,
+        random_state: int = 42
+    ) -> Tuple[sparse.csr_matrix, sparse.csr_matrix, sparse.csr_matrix, pd.Series, pd.Series, pd.Series]:
+        """
+        Separação dos dados no modo esparso (saída do DataEncoding com sparse_onehot).
+        
+        Os splits são feitos sobre as posições das linhas (split_indices), com os mesmos
+        sorteios de split_data, então as linhas de cada conjunto são as mesmas do modo denso. As
+        features são montadas uma única vez em CSR e cada conjunto é uma seleção de
+        linhas dessa matriz; os nomes das colunas ficam em self.feature_names.
+        
+        Args:
+            data: Saída do encoding em modo esparso
+            test_size: Proporção do conjunto de teste
+            valid_size: Proporção do conjunto de validação
+            random_state: Seed para reprodutibilidade
+            
+        Returns:
+            Tuple contendo:
+            - X_train, X_valid, X_test: Matrizes CSR de features para treino, validação e teste
+            - y_train, y_valid, y_test: Target para treino, validação e teste
+        """
+        y = data.frame['gravidade_acidente']
+        features = data.drop(['gravidade_acidente'])
+        
+        self.logger.info("Distribuição inicial das classes:")
+        self.check_target_distribution(y)
+        
+        indices = self.split_indices(y, test_size, valid_size, random_state)
+        y_train, y_valid, y_test = y.iloc[indices.train], y.iloc[indices.valid], y.iloc[indices.test]
+        
+        X = features.to_matrix()
+        self.feature_names = features.feature_names
+        X_train, X_valid, X_test = X[indices.train], X[indices.valid], X[indices.test]
+        
+        self.logger.info("\nDimensões dos conjuntos (CSR):")
+        self.logger.info(f"- Treino: {X_train.shape} ({sparse_memory_mb(X_train):.1f} MB)")
+        self.logger.info(f"- Validação: {X_valid.shape} ({sparse_memory_mb(X_valid):.1f} MB)")
+        self.logger.info(f"- Teste: {X_test.shape} ({sparse_memory_mb(X_test):.1f} MB)")
+        
+        self.check_target_distribution(y_train, "Treino")
+        self.check_target_distribution(y_valid, "Validação")
+        self.check_target_distribution(y_test, "Teste")
+        
+        return X_train, X_valid, X_test, y_train, y_valid, y_test
+
+    def prepare_data(
+        self,
+        df: Union[pd.DataFrame, SparseEncodedFrame],
+        test_size: float = 0.2,
+        valid_size: float = 0.2,
+        random_state: int = 42,
+        index_split: bool = False
     ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, pd.Series]:
         """
         Executa todo o pipeline de preparação dos dados.
         
         Args:
-            df: DataFrame original
+            df: DataFrame original ou saída do encoding em modo esparso (ver split_sparse)
             test_size: Proporção do conjunto de teste
             valid_size: Proporção do conjunto de validação
             random_state: Seed para reprodutibilidade
+            index_split: Separa o DataFrame pelas posições dos splits, com os conjuntos
+                como fatias de uma única cópia (ver split_by_index)
             
         Returns:
             Tuple contendo:
@@ -133,6 +302,18 @@ class DataSplit:
         """
         self.logger.info("Iniciando preparação dos dados...")
         
+        if isinstance(df, SparseEncodedFrame):
+            data = df.with_frame(self.remove_unused_columns(df.frame))
+            result = self.split_sparse(data, test_size=test_size, valid_size=valid_size, random_state=random_state)
+            self.logger.info("Preparação dos dados concluída!")
+            return result
+        
+        self.feature_names = None
+        if index_split:
+            result = self.split_by_index(df, test_size=test_size, valid_size=valid_size, random_state=random_state)
+            self.logger.info("Preparação dos dados concluída!")
+            return result
+        
         # Remover colunas não utilizadas
         df = self.remove_unused_columns(df)
         
@@ -0,0 +1,8 @@
+from .numeric_parsing import is_numeric_column, parse_br_count, parse_br_numeric
+from .row_fingerprint import FINGERPRINT_SCHEME_VERSION, FingerprintIndex, compute_frame_fingerprint, compute_row_fingerprints
+from .time_buckets import PERIODO_DIA_DTYPE, PERIODOS_DIA, bucket_hours, bucket_periodo_dia, extract_hour
+from .severity import GRAVIDADES, classify_severity
+from .category_mapping import CategoryRemap, remap_categories
+from .compact_dtypes import compact_dtype, compact_frames, restore_integer_dtypes
+from .feature_hashing import hash_buckets, hashed_indicators
+from .neighbors import bucketed_kneighbors, exact_kneighbors, zorder_keys
@@ -0,0 +1,99 @@
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+
+class CategoryRemap(NamedTuple):
+    """Resultado de um remapeamento de categorias."""
+    values: pd.Series                 # Coluna remapeada (categórica)
+    valores_originais: np.ndarray     # Valores únicos antes do mapeamento (como Series.unique())
+    valores_finais: np.ndarray        # Valores únicos após o mapeamento (como Series.unique())
+    valores_nao_mapeados: Set[Any]    # Valores originais ausentes do mapeamento
+    valores_raros: Set[Any]           # Valores com frequência abaixo do mínimo
+
+
+def _unique_in_order(codes: np.ndarray, categories: np.ndarray) -> np.ndarray:
+    """
+    Reconstrói o resultado de Series.unique() a partir dos códigos de fatorização:
+    valores em ordem de aparição, com NaN na posição da primeira ausência.
+    """
+    return np.array(
+        [categories[code] if code >= 0 else np.nan for code in pd.unique(codes)],
+        dtype=object
+    )
+
+
+def remap_categories(
+    series: pd.Series,
+    mapping: Dict[Any, Any],
+    default: Optional[Any] = None,
+    min_frequency: int = 0,
+    rare_value: Optional[Any] = None,
+    frequencies: Optional[Mapping[Any, int]] = None
+) -> CategoryRemap:
+    """
+    Aplica um mapeamento de valores sobre a lista de categorias, e não sobre as linhas.
+    
+    A coluna é fatorizada uma única vez; o mapeamento, o tratamento de valores não
+    mapeados e o agrupamento de valores raros são resolvidos por categoria, e o
+    resultado é propagado para as linhas por um único take sobre os códigos.
+    
+    Args:
+        series: Coluna a ser remapeada
+        mapping: Dicionário valor original -> valor final
+        default: Valor para originais não mapeados e ausentes. Se None, os valores
+            não mapeados são mantidos (como em Series.replace) e ausentes continuam NaN
+        min_frequency: Frequência mínima; categorias originais abaixo dela recebem rare_value
+        rare_value: Valor atribuído às categorias raras
+        frequencies: Contagens por valor original calculadas sobre o dataset inteiro.
+            Se informadas, substituem as contagens da própria série (ex.: execução em blocos)
+        
+    Returns:
+        CategoryRemap com a coluna categórica e os valores para registro em log
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = np.asarray(uniques, dtype=object)
+    
+    mapped = np.array(
+        [mapping.get(value, value if default is None else default) for value in uniques],
+        dtype=object
+    )
+    raros = set()
+    if min_frequency > 0:
+        if frequencies is not None:
+            counts = np.array([frequencies.get(value, 0) for value in uniques], dtype=np.int64)
+        else:
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        is_rare = counts < min_frequency
+        mapped[is_rare] = rare_value
+        raros = set(uniques[is_rare])
+    
+    unique_codes, categories = pd.factorize(mapped)
+    categories = np.asarray(categories, dtype=object)
+    
+    na_code = -1
+    if default is not None and (codes < 0).any():
+        matches = np.flatnonzero(categories == default)
+        if len(matches):
+            na_code = int(matches[0])
+        else:
+            categories = np.append(categories, default)
+            na_code = len(categories) - 1
+    
+    row_codes = np.where(codes >= 0, unique_codes[codes], na_code)
+    values = pd.Series(
+        pd.Categorical.from_codes(row_codes, categories=categories),
+        index=series.index,
+        name=series.name
+    )
+    
+    valores_originais = _unique_in_order(codes, uniques)
+    
+    return CategoryRemap(
+        values=values,
+        valores_originais=valores_originais,
+        valores_finais=_unique_in_order(row_codes, categories),
+        valores_nao_mapeados=set(valores_originais) - set(mapping.keys()),
+        valores_raros=raros
+    )
@@ -0,0 +1,77 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Tipos inteiros candidatos, do menor para o maior
+INTEGER_DTYPES = [np.uint8, np.int8, np.uint16, np.int16, np.int32, np.int64]
+
+
+def compact_dtype(columns: List[pd.Series]) -> np.dtype:
+    """
+    Escolhe o menor dtype que representa exatamente os valores numéricos de uma coluna.
+
+    Valores inteiros (flags 0/1 do OneHot, códigos ordinais, contagens) recebem o menor
+    tipo inteiro que comporta o intervalo; os demais, float32.
+
+    Args:
+        columns: A mesma coluna em cada conjunto (treino, validação, teste), para que
+            todos recebam o mesmo dtype
+
+    Returns:
+        dtype compacto da coluna
+    """
+    values = [np.asarray(column, dtype='float64') for column in columns]
+    integral = all(
+        np.isfinite(v).all() and np.array_equal(v, np.round(v))
+        for v in values
+    )
+    if not integral:
+        return np.dtype(np.float32)
+
+    non_empty = [v for v in values if len(v)]
+    if not non_empty:
+        return np.dtype(np.uint8)
+    low = min(v.min() for v in non_empty)
+    high = max(v.max() for v in non_empty)
+
+    for dtype in INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.float64)
+
+
+def compact_frames(*frames: pd.DataFrame) -> Tuple[pd.DataFrame, ...]:
+    """
+    Converte as colunas numéricas dos conjuntos para dtypes compactos.
+
+    Todos os conjuntos recebem os mesmos dtypes, decididos a partir dos valores de
+    todos eles. Colunas não numéricas não são alteradas.
+
+    Returns:
+        Os DataFrames convertidos, na mesma ordem
+    """
+    numeric_columns = frames[0].select_dtypes(include='number').columns
+    dtypes: Dict[str, np.dtype] = {
+        col: compact_dtype([frame[col] for frame in frames])
+        for col in numeric_columns
+    }
+    return tuple(frame.astype(dtypes) for frame in frames)
+
+
+def restore_integer_dtypes(df: pd.DataFrame, dtypes: pd.Series) -> pd.DataFrame:
+    """
+    Devolve às colunas inteiras o dtype original após uma interpolação (ex.: SMOTE),
+    arredondando para o valor mais próximo e limitando ao intervalo do tipo.
+
+    Args:
+        df: DataFrame com as colunas inteiras em ponto flutuante
+        dtypes: dtypes originais (DataFrame.dtypes antes da interpolação)
+    """
+    restored = {}
+    for col, dtype in dtypes.items():
+        if pd.api.types.is_integer_dtype(dtype):
+            info = np.iinfo(dtype)
+            restored[col] = np.clip(np.rint(df[col].to_numpy()), info.min, info.max).astype(dtype)
+    return df.assign(**restored) if restored else df
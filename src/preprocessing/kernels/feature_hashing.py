@@ -0,0 +1,42 @@
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def _hash_key(value) -> str:
+    # 101, 101.0 e '101' caem no mesmo bucket (a coluna pode chegar como texto ou número)
+    if isinstance(value, Number) and not isinstance(value, bool) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def hash_buckets(series: pd.Series, n_buckets: int) -> np.ndarray:
+    """
+    Atribui cada valor a um de n_buckets por um hash determinístico (sem vocabulário).
+
+    O hash é calculado uma vez por valor distinto (pd.util.hash_array, estável entre
+    execuções e processos) e propagado para as linhas pelos códigos da fatorização.
+    Valores ausentes formam um valor próprio.
+
+    Args:
+        series: Coluna categórica (texto ou números)
+        n_buckets: Número de buckets
+
+    Returns:
+        Array int64 com o bucket de cada linha
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    keys = np.array([_hash_key(value) for value in uniques], dtype=object)
+    unique_buckets = (pd.util.hash_array(keys) % np.uint64(n_buckets)).astype(np.int64)
+    return unique_buckets[codes]
+
+
+def hashed_indicators(buckets: np.ndarray, n_buckets: int, dtype=np.float32) -> sparse.csr_matrix:
+    """Matriz CSR (linhas x n_buckets) com 1 no bucket de cada linha."""
+    n_rows = len(buckets)
+    return sparse.csr_matrix(
+        (np.ones(n_rows, dtype=dtype), buckets, np.arange(n_rows + 1)),
+        shape=(n_rows, n_buckets)
+    )
@@ -0,0 +1,84 @@
+from typing import Optional
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.neighbors import NearestNeighbors
+
+
+def exact_kneighbors(X: np.ndarray, k: int, n_jobs: Optional[int] = None) -> np.ndarray:
+    """
+    Índices dos k vizinhos mais próximos de cada linha de X (busca exata, sem a própria linha).
+
+    A consulta é dividida entre n_jobs threads (NearestNeighbors.kneighbors).
+
+    Returns:
+        Array (n_linhas, k) com as posições dos vizinhos
+    """
+    nn = NearestNeighbors(n_neighbors=k + 1, n_jobs=n_jobs).fit(X)
+    return nn.kneighbors(X, return_distance=False)[:, 1:]
+
+
+def zorder_keys(X: np.ndarray, n_components: int = 3, random_state: int = 0, sample_size: int = 10_000) -> np.ndarray:
+    """
+    Chave de Morton (Z-order) de cada linha em uma grade sobre as componentes principais.
+
+    As componentes são estimadas em uma amostra das linhas; cada projeção é quantizada
+    em 2^bits células e os bits das coordenadas são intercalados, de modo que linhas
+    próximas no espaço tendem a ficar próximas na ordenação pela chave.
+
+    Returns:
+        Array uint64 com a chave de cada linha
+    """
+    rng = np.random.default_rng(random_state)
+    sample = X[rng.choice(len(X), min(len(X), sample_size), replace=False)]
+    mean = sample.mean(axis=0)
+    _, _, vt = np.linalg.svd(sample - mean, full_matrices=False)
+    n_components = min(n_components, vt.shape[0])
+    projection = (X - mean) @ vt[:n_components].T
+
+    bits = 63 // n_components
+    low, high = projection.min(axis=0), projection.max(axis=0)
+    span = np.where(high > low, high - low, 1)
+    cells = ((projection - low) / span * (2 ** bits - 1)).astype(np.uint64)
+
+    keys = np.zeros(len(X), dtype=np.uint64)
+    for bit in range(bits):
+        for component in range(n_components):
+            keys |= ((cells[:, component] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(bit * n_components + component)
+    return keys
+
+
+def bucketed_kneighbors(
+    X: np.ndarray,
+    k: int,
+    bucket_size: int = 4096,
+    n_jobs: Optional[int] = None,
+    random_state: int = 0
+) -> np.ndarray:
+    """
+    Vizinhos aproximados: as linhas são ordenadas pela chave Z-order (zorder_keys),
+    divididas em buckets de ~bucket_size linhas consecutivas e os vizinhos são buscados
+    (exatamente) só dentro do bucket de cada linha, com os buckets em paralelo.
+
+    O custo passa de O(n²) para O(n * bucket_size); linhas na fronteira de um bucket
+    podem perder vizinhos do bucket ao lado.
+
+    Returns:
+        Array (n_linhas, k) com as posições dos vizinhos
+    """
+    if len(X) <= bucket_size:
+        return exact_kneighbors(X, k, n_jobs)
+
+    order = np.argsort(zorder_keys(X, random_state=random_state), kind='stable')
+    buckets = np.array_split(order, -(-len(X) // bucket_size))
+
+    def search(bucket: np.ndarray) -> np.ndarray:
+        nn = NearestNeighbors(n_neighbors=k + 1, algorithm='brute').fit(X[bucket])
+        return bucket[nn.kneighbors(X[bucket], return_distance=False)[:, 1:]]
+
+    results = Parallel(n_jobs=n_jobs, prefer='threads')(delayed(search)(bucket) for bucket in buckets)
+
+    neighbors = np.empty((len(X), k), dtype=np.intp)
+    for bucket, result in zip(buckets, results):
+        neighbors[bucket] = result
+    return neighbors
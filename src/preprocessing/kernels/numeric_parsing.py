@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+# Primeiro número presente no texto (ex.: "12 km" -> "12")
+NUMBER_PATTERN = r'(\d+\.?\d*)'
+
+# Maior float64 que cabe em int64 (contagens acima dele são limitadas a esse valor)
+MAX_COUNT = np.nextafter(2.0 ** 63, 0)
+
+# Inteiros com módulo abaixo de 2^53 são exatos em float64 e seu str() não usa
+# notação exponencial
+MAX_EXACT_INTEGER = 2.0 ** 53
+
+
+def is_numeric_column(series: pd.Series) -> bool:
+    """Indica se a coluna já possui dtype numérico (e não precisa ser interpretada)."""
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def parse_br_numeric(series: pd.Series, extract_number: bool = False) -> pd.Series:
+    """
+    Converte uma coluna em formato brasileiro (vírgula decimal) para numérico.
+    
+    Colunas que já possuem dtype numérico são retornadas sem alteração, evitando a
+    conversão de ida e volta para string. As demais passam por uma única conversão
+    vetorizada: strip, troca de vírgula por ponto e pd.to_numeric.
+    
+    Args:
+        series: Coluna a ser convertida
+        extract_number: Se True, valores que não puderem ser convertidos diretamente
+            (ex.: "12 km") têm o primeiro número do texto extraído via regex
+            
+    Returns:
+        Series numérica; valores inválidos viram NaN
+    """
+    if is_numeric_column(series):
+        return series
+    
+    text = series.astype(str).str.strip().str.replace(',', '.', regex=False)
+    parsed = pd.to_numeric(text, errors='coerce')
+    
+    if extract_number:
+        failed = parsed.isna().to_numpy() & series.notna().to_numpy()
+        if failed.any():
+            parsed = parsed.astype('float64')
+            parsed[failed] = pd.to_numeric(
+                text[failed].str.extract(NUMBER_PATTERN, expand=False), errors='coerce'
+            )
+    
+    return parsed
+
+
+def parse_br_count(series: pd.Series) -> pd.Series:
+    """
+    Converte uma coluna para inteiros não negativos (contagens, km).
+    
+    Mantém a semântica da padronização original: o primeiro número do texto é
+    usado, o sinal é descartado, a parte decimal é truncada e ausentes viram 0.
+    Textos sem dígitos (ex.: "inf", "nan") viram 0 e a notação exponencial não é
+    interpretada ("1e3" -> 1), como na extração por regex original.
+    
+    Colunas texto são interpretadas sobre os valores distintos. Em colunas numéricas,
+    os inteiros exatos (e os ausentes) são convertidos diretamente; os demais valores
+    (não inteiros, não finitos ou fora do intervalo exato, cujo texto pode usar notação
+    exponencial: 1e-05 -> 1, 1e+20 -> 1) seguem pela mesma extração do texto.
+    """
+    if not is_numeric_column(series):
+        return pd.Series(_extract_counts(series), index=series.index).astype(int)
+    
+    values = np.abs(series.to_numpy(dtype='float64', na_value=np.nan))
+    direct = np.isnan(values) | ((values == np.trunc(values)) & (values < MAX_EXACT_INTEGER))
+    counts = np.where(np.isnan(values), 0, values)
+    if not direct.all():
+        counts[~direct] = _extract_counts(series[~direct])
+    return pd.Series(counts, index=series.index).astype(int)
+
+
+def _extract_counts(series: pd.Series) -> np.ndarray:
+    """
+    Primeiro número do texto de cada valor (str(valor), como na padronização original),
+    sem sinal e limitado a MAX_COUNT, calculado sobre os valores distintos.
+    """
+    codes, uniques = pd.factorize(series)
+    text = pd.Series(np.asarray(uniques).astype(str)).str.replace(',', '.', regex=False)
+    parsed = pd.to_numeric(text.str.extract(NUMBER_PATTERN, expand=False), errors='coerce')
+    
+    # Código -1 (ausente) aponta para o 0 acrescentado ao final
+    counts = np.append(np.minimum(parsed.fillna(0).to_numpy(dtype='float64'), MAX_COUNT), 0)
+    return counts[codes]
@@ -0,0 +1,141 @@
+import hashlib
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from config.inject_logger import inject_logger
+
+# Versão do esquema de hash de compute_row_fingerprints, gravada no FingerprintIndex.
+# Deve ser incrementada a cada mudança nos valores gerados: índices de outra versão
+# são descartados ao carregar, pois seus fingerprints não correspondem mais às linhas.
+FINGERPRINT_SCHEME_VERSION = 1
+
+
+def compute_row_fingerprints(df: pd.DataFrame) -> pd.Series:
+    """
+    Calcula um hash de 64 bits por linha, de forma vetorizada.
+
+    A linha é normalizada antes do hash: as colunas são ordenadas pelo nome
+    (a ordem das colunas não altera o fingerprint) e as colunas numéricas são
+    convertidas para float64, de modo que 1, 1.0 e Int64(1) geram o mesmo valor.
+    Os hashes das colunas são combinados como em pd.util.hash_pandas_object sobre
+    o DataFrame normalizado (FINGERPRINT_SCHEME_VERSION 1).
+
+    Args:
+        df: DataFrame cujas linhas serão identificadas
+
+    Returns:
+        Series uint64 com o fingerprint de cada linha, alinhada ao índice de df
+    """
+    combined = np.full(len(df), 0x345678, dtype=np.uint64)
+    multiplier = np.uint64(1000003)
+    
+    # Combina o hash de cada coluna sem materializar uma cópia normalizada do DataFrame
+    with np.errstate(over='ignore'):
+        for i, col in enumerate(sorted(df.columns, key=str)):
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                series = pd.Series(series.to_numpy(dtype='float64', na_value=np.nan))
+            
+            combined ^= pd.util.hash_pandas_object(series, index=False).to_numpy()
+            combined *= multiplier
+            multiplier += np.uint64(82520 + 2 * (len(df.columns) - i))
+        combined += np.uint64(97531)
+    
+    return pd.Series(combined, index=df.index)
+
+
+def compute_frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Calcula um identificador de conteúdo (sha256) para o DataFrame inteiro.
+
+    Considera os valores de todas as linhas, a ordem e os dtypes das colunas e o índice.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    digest.update(compute_row_fingerprints(df).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@inject_logger
+class FingerprintIndex:
+    """
+    Conjunto persistido de fingerprints de linhas já processadas.
+
+    Permite que cargas incrementais descartem registros já vistos em execuções
+    anteriores sem comparar com todo o histórico: os fingerprints ficam em um
+    array uint64 ordenado, salvo em formato .npz junto com a versão do esquema de
+    hash (FINGERPRINT_SCHEME_VERSION). Sem path, o índice existe só em memória
+    (ex.: linhas já vistas em blocos anteriores da mesma execução).
+
+    Um índice gravado com outra versão do esquema é descartado ao carregar (o índice
+    recomeça vazio e é reconstruído pela carga seguinte). Arquivos .npy sem versão,
+    anteriores ao versionamento, usam o esquema 1.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path is not None else None
+        self.fingerprints = self._load()
+
+    def _load(self) -> np.ndarray:
+        empty = np.empty(0, dtype=np.uint64)
+        if self.path is None or not self.path.exists():
+            return empty
+
+        data = np.load(self.path)
+        if isinstance(data, np.ndarray):
+            scheme, fingerprints = 1, data
+        else:
+            with data:
+                scheme, fingerprints = int(data['scheme']), data['fingerprints']
+
+        if scheme != FINGERPRINT_SCHEME_VERSION:
+            self.logger.warning(
+                f"Índice de fingerprints em {self.path} usa o esquema de hash {scheme} "
+                f"(atual: {FINGERPRINT_SCHEME_VERSION}); o índice será reconstruído"
+            )
+            return empty
+
+        self.logger.info(f"Índice de fingerprints carregado de {self.path}: {len(fingerprints)} registros")
+        return fingerprints
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def contains(self, fingerprints: Union[pd.Series, np.ndarray]) -> np.ndarray:
+        """
+        Retorna uma máscara booleana indicando quais fingerprints já estão no índice.
+        """
+        values = np.asarray(fingerprints, dtype=np.uint64)
+        if len(self.fingerprints) == 0:
+            return np.zeros(len(values), dtype=bool)
+
+        positions = np.searchsorted(self.fingerprints, values)
+        positions[positions == len(self.fingerprints)] = 0
+        return self.fingerprints[positions] == values
+
+    def update(self, fingerprints: Union[pd.Series, np.ndarray]) -> None:
+        """Adiciona novos fingerprints ao índice, mantendo-o ordenado e sem repetições."""
+        values = np.unique(np.asarray(fingerprints, dtype=np.uint64))
+        values = values[~self.contains(values)]
+        if len(values) == 0:
+            return
+        
+        # Intercala dois arrays já ordenados: a ordenação estável (timsort) sobre a
+        # concatenação é linear, sem reordenar todo o índice a cada atualização
+        merged = np.concatenate([self.fingerprints, values])
+        merged.sort(kind='stable')
+        self.fingerprints = merged
+
+    def save(self) -> None:
+        """Persiste o índice em disco."""
+        if self.path is None:
+            raise ValueError("Índice de fingerprints sem caminho definido não pode ser salvo")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'wb') as f:
+            np.savez(f, fingerprints=self.fingerprints, scheme=np.int64(FINGERPRINT_SCHEME_VERSION))
+        self.logger.info(f"Índice de fingerprints salvo em {self.path}: {len(self.fingerprints)} registros")
+
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+# Classes de gravidade, da mais para a menos grave
+GRAVIDADES = ['fatal', 'grave', 'moderado', 'leve']
+
+
+def classify_severity(df: pd.DataFrame) -> pd.Series:
+    """
+    Classifica a gravidade de cada acidente a partir das colunas de vítimas.
+    
+    Regras (avaliadas em ordem, a primeira verdadeira vence):
+    - fatal: mortos > 0
+    - grave: feridos_graves > 1 ou feridos_leves >= 3
+    - moderado: feridos_leves > 0 ou feridos_graves == 1
+    - leve: demais casos
+    
+    Args:
+        df: DataFrame com as colunas inteiras 'mortos', 'feridos_graves' e 'feridos_leves'
+        
+    Returns:
+        Series (object) com a gravidade de cada linha
+    """
+    mortos = df['mortos'].to_numpy()
+    feridos_graves = df['feridos_graves'].to_numpy()
+    feridos_leves = df['feridos_leves'].to_numpy()
+    
+    conditions = [
+        mortos > 0,
+        (feridos_graves > 1) | (feridos_leves >= 3),
+        (feridos_leves > 0) | (feridos_graves == 1),
+    ]
+    gravidade = np.select(conditions, GRAVIDADES[:3], default=GRAVIDADES[3])
+    return pd.Series(gravidade.astype(object), index=df.index)
@@ -0,0 +1,102 @@
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Períodos do dia em ordem cronológica
+PERIODOS_DIA = ['madrugada', 'manha', 'tarde', 'noite']
+
+# Hora inicial de cada período (a última borda fecha o intervalo da noite)
+PERIODO_DIA_EDGES = [0, 6, 12, 18, 24]
+
+PERIODO_DIA_DTYPE = pd.CategoricalDtype(PERIODOS_DIA, ordered=True)
+
+
+def extract_hour(horario: pd.Series) -> pd.Series:
+    """
+    Extrai a hora de uma coluna de horários ("HH:MM" ou "HH:MM:SS").
+    
+    A interpretação é feita apenas sobre os valores distintos (no máximo 86400
+    horários possíveis) e propagada para as linhas pelos códigos de fatorização,
+    de modo que o custo não depende do número de linhas.
+    
+    Args:
+        horario: Coluna de horários em texto, datetime ou time
+        
+    Returns:
+        Series float com a hora de cada linha; valores inválidos viram NaN
+    """
+    if pd.api.types.is_datetime64_any_dtype(horario):
+        return horario.dt.hour.astype('float64')
+    
+    codes, uniques = pd.factorize(horario)
+    uniques = pd.Series(uniques, dtype=object)
+    
+    is_text = uniques.map(type).eq(str).to_numpy()
+    hour_text = uniques.where(is_text).str.split(':', n=1).str[0].str.strip()
+    hours = pd.to_numeric(hour_text, errors='coerce').to_numpy(dtype='float64')
+    
+    # Mantém apenas horas inteiras (ex.: "7.5" é inválido)
+    hours[hours != np.floor(hours)] = np.nan
+    
+    row_hours = np.where(codes >= 0, hours[codes], np.nan)
+    return pd.Series(row_hours, index=horario.index)
+
+
+def bucket_hours(
+    horario: pd.Series,
+    edges: List[int],
+    labels: List[str],
+    out_of_range: Optional[str] = None
+) -> pd.Series:
+    """
+    Classifica cada horário em faixas de hora [edges[i], edges[i+1]).
+    
+    As faixas são resolvidas por uma tabela de consulta com as 24 horas do dia,
+    sem laço em Python por linha.
+    
+    Args:
+        horario: Coluna de horários
+        edges: Bordas das faixas, em horas (len(labels) + 1 valores crescentes)
+        labels: Rótulo de cada faixa, em ordem
+        out_of_range: Rótulo para horas válidas fora das faixas (None -> NaN)
+        
+    Returns:
+        Series categórica ordenada com categorias labels; horários inválidos viram NaN
+    """
+    if len(edges) != len(labels) + 1:
+        raise ValueError(f"Esperadas {len(labels) + 1} bordas para {len(labels)} rótulos, recebidas {len(edges)}")
+    
+    out_of_range_code = labels.index(out_of_range) if out_of_range is not None else -1
+    
+    # Código da faixa para cada hora do dia (0-23)
+    lookup = np.searchsorted(edges, np.arange(24), side='right') - 1
+    lookup[(np.arange(24) < edges[0]) | (np.arange(24) >= edges[-1])] = out_of_range_code
+    
+    hours = extract_hour(horario).to_numpy()
+    valid = ~np.isnan(hours)
+    
+    codes = np.full(len(hours), -1, dtype=np.int16)
+    in_day = valid & (hours >= 0) & (hours < 24)
+    codes[in_day] = lookup[hours[in_day].astype(int)]
+    codes[valid & ~in_day] = out_of_range_code
+    
+    bucket = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(labels, ordered=True))
+    return pd.Series(bucket, index=horario.index)
+
+
+def bucket_periodo_dia(horario: pd.Series) -> pd.Series:
+    """
+    Classifica cada horário em um período do dia.
+    
+    Períodos:
+    - Madrugada: 00:00 - 05:59
+    - Manhã: 06:00 - 11:59
+    - Tarde: 12:00 - 17:59
+    - Noite: 18:00 - 23:59 (e qualquer hora fora do intervalo 0-23)
+    
+    Returns:
+        Series categórica ordenada com as categorias de PERIODOS_DIA;
+        horários inválidos viram NaN
+    """
+    return bucket_hours(horario, PERIODO_DIA_EDGES, PERIODOS_DIA, out_of_range='noite')
@@ -0,0 +1,262 @@
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import pandas as pd
+import yaml
+
+from config.config_project import PROJECT_ROOT
+from config.inject_logger import inject_logger
+from preprocessing.column_parallel import column_workers, map_columns
+from preprocessing.kernels import bucket_hours, classify_severity, parse_br_count, remap_categories
+
+RULES_FILE = "standardization_rules.yaml"
+
+# Funções disponíveis para regras do tipo 'derived': nome -> (função, colunas de entrada)
+DERIVED_FUNCTIONS = {
+    'severity': (classify_severity, ['mortos', 'feridos_graves', 'feridos_leves'])
+}
+
+
+class CompiledRule(NamedTuple):
+    """Operação vetorizada compilada a partir de uma regra do arquivo YAML."""
+    name: str
+    sources: List[str]                  # Colunas necessárias (a regra é ignorada se faltar alguma)
+    drops: List[str]                    # Colunas removidas ao final da passada
+    skip_if_present: Optional[str]      # Ignora a regra se esta coluna já existir
+    apply: Callable[[Callable[[str], pd.Series]], Dict[str, pd.Series]]
+
+
+@inject_logger
+class RuleEngine:
+    """
+    Motor de regras declarativas de padronização e feature engineering.
+
+    As regras do arquivo standardization_rules.yaml são compiladas em operações
+    vetorizadas sobre colunas. Cada etapa é executada em uma única passada: as
+    operações leem as colunas originais (ou as já produzidas por regras anteriores)
+    e o DataFrame final é montado uma única vez, sem cópias intermediárias por regra.
+
+    As operações compiladas de uma mesma regra (ex.: uma por coluna numérica) são
+    independentes entre si e podem ser executadas em um pool de threads.
+    """
+
+    def __init__(self, rules_path: Optional[str] = None, workers: Optional[int] = None):
+        """
+        Args:
+            rules_path: Caminho do arquivo de regras (padrão: standardization_rules.yaml na raiz)
+            workers: Threads para as operações de uma mesma regra (padrão: column_parallel.workers)
+        """
+        self.workers = column_workers(workers)
+
+        if rules_path is None:
+            rules_path = PROJECT_ROOT / RULES_FILE
+
+        with open(rules_path, "r", encoding="utf-8") as file:
+            self.spec: Dict[str, List[Dict]] = yaml.safe_load(file)
+
+        self._compile_stages()
+
+    def _compile_stages(self) -> None:
+        # Operações agrupadas por regra do arquivo; as de um mesmo grupo são independentes
+        self.stages: Dict[str, List[List[CompiledRule]]] = {
+            stage: [self._compile(rule) for rule in rules]
+            for stage, rules in self.spec.items()
+        }
+
+    def __getstate__(self) -> Dict:
+        # As operações compiladas são closures (não serializáveis): o motor é enviado a
+        # outros processos (ex.: método 'spawn') só com as regras e recompilado no destino
+        return {'workers': self.workers, 'spec': self.spec}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._compile_stages()
+
+    def run(
+        self,
+        df: pd.DataFrame,
+        stage: str,
+        names: Optional[List[str]] = None,
+        overrides: Optional[Dict[str, Dict]] = None
+    ) -> pd.DataFrame:
+        """
+        Executa as regras de uma etapa em uma única passada sobre o DataFrame.
+
+        Args:
+            df: DataFrame de entrada (não é modificado)
+            stage: Etapa do arquivo de regras ('standardize', 'feature_engineering')
+            names: Se informado, executa apenas as regras com esses nomes
+            overrides: Parâmetros que substituem os do arquivo, por nome de regra
+
+        Returns:
+            Novo DataFrame com as colunas produzidas e sem as colunas removidas
+        """
+        if stage not in self.spec:
+            raise ValueError(f"Etapa '{stage}' não definida em {RULES_FILE}")
+
+        if overrides:
+            groups = [self._compile({**rule, **overrides.get(rule['name'], {})}) for rule in self.spec[stage]]
+        else:
+            groups = self.stages[stage]
+
+        if names is not None:
+            groups = [[rule for rule in group if rule.name in names] for group in groups]
+
+        produced: Dict[str, pd.Series] = {}
+        dropped: List[str] = []
+
+        def get(column: str) -> pd.Series:
+            return produced[column] if column in produced else df[column]
+
+        def available(column: str) -> bool:
+            return (column in produced or column in df.columns) and column not in dropped
+
+        def runnable(rule: CompiledRule) -> bool:
+            if rule.skip_if_present and available(rule.skip_if_present):
+                return False
+            return all(available(col) for col in rule.sources)
+
+        for group in groups:
+            rules = [rule for rule in group if runnable(rule)]
+            results = map_columns(lambda rule: rule.apply(get), rules, self.workers)
+
+            # Resultados aplicados na ordem das regras, independentemente da ordem de conclusão
+            for rule, result in zip(rules, results):
+                produced.update(result)
+                dropped.extend(col for col in rule.drops if available(col))
+
+        if dropped:
+            self.logger.info(f"Colunas removidas: {dropped}")
+
+        # Monta o resultado uma única vez: drop devolve um novo DataFrame (sem copiar os
+        # buffers quando copy-on-write está ativo) e as colunas produzidas são atribuídas
+        # no lugar das originais ou ao final
+        result = df.drop(columns=dropped)
+        for col, values in produced.items():
+            if col not in dropped:
+                result[col] = values
+
+        return result
+
+    def frequency_rules(self, stage: str) -> Dict[str, str]:
+        """
+        Regras da etapa que dependem da frequência dos valores no dataset inteiro
+        (mapeamentos com min_frequency).
+        
+        Returns:
+            Dicionário nome da regra -> coluna de origem
+        """
+        return {
+            rule['name']: rule['source']
+            for rule in self.spec.get(stage, [])
+            if rule.get('type') == 'mapping' and rule.get('min_frequency', 0) > 0
+        }
+
+    def _compile(self, rule: Dict) -> List[CompiledRule]:
+        """Compila uma regra do YAML em uma ou mais operações vetorizadas."""
+        compilers = {
+            'numeric': self._compile_numeric,
+            'datetime': self._compile_datetime,
+            'hour_bucket': self._compile_hour_bucket,
+            'mapping': self._compile_mapping,
+            'derived': self._compile_derived,
+            'drop': self._compile_drop
+        }
+
+        if rule.get('type') not in compilers:
+            raise ValueError(f"Tipo de regra inválido em '{rule.get('name')}': {rule.get('type')}. "
+                             f"Use um dos seguintes: {list(compilers)}")
+        return compilers[rule['type']](rule)
+
+    def _compile_numeric(self, rule: Dict) -> List[CompiledRule]:
+        kind = rule.get('kind', 'count')
+
+        def build(col: str) -> Callable:
+            def apply_count(get):
+                values = parse_br_count(get(col))
+                self.logger.info(f"Coluna {col} padronizada. Range: [{values.min()}, {values.max()}]")
+                return {col: values}
+
+            def apply_fill_int(get):
+                return {col: get(col).fillna(0).astype(int)}
+
+            return apply_count if kind == 'count' else apply_fill_int
+
+        return [CompiledRule(rule['name'], [col], [], None, build(col)) for col in rule['columns']]
+
+    def _compile_datetime(self, rule: Dict) -> List[CompiledRule]:
+        source, target, year = rule['source'], rule['target'], rule.get('year')
+
+        def apply(get):
+            data = pd.to_datetime(get(source))
+            result = {target: data}
+            if year:
+                result[year] = data.dt.year
+            self.logger.info(f"Coluna {source} convertida para datetime e renomeada para '{target}'")
+            return result
+
+        drops = [source] if rule.get('drop_source') else []
+        return [CompiledRule(rule['name'], [source], drops, None, apply)]
+
+    def _compile_hour_bucket(self, rule: Dict) -> List[CompiledRule]:
+        source, target = rule['source'], rule['target']
+
+        def apply(get):
+            values = bucket_hours(get(source), rule['edges'], rule['labels'], rule.get('out_of_range'))
+
+            counts = values.value_counts()
+            self.logger.info(f"Distribuição de {target}:")
+            for label, count in counts[counts > 0].items():
+                self.logger.info(f"- {label}: {count}")
+            return {target: values}
+
+        skip = target if rule.get('skip_if_present') else None
+        return [CompiledRule(rule['name'], [source], [], skip, apply)]
+
+    def _compile_mapping(self, rule: Dict) -> List[CompiledRule]:
+        source = rule['source']
+        target = rule.get('target', source)
+
+        def apply(get):
+            remap = remap_categories(
+                get(source),
+                rule['mapping'],
+                default=rule.get('default'),
+                min_frequency=rule.get('min_frequency', 0),
+                rare_value=rule.get('rare_value'),
+                frequencies=rule.get('frequencies')
+            )
+
+            if rule.get('log') == 'distribution':
+                self.logger.info(f"Distribuição final de {target}:")
+                for value, count in remap.values.value_counts().items():
+                    self.logger.info(f"- {value}: {count} registros")
+            else:
+                self.logger.info(f"Valores únicos originais em {source}: {remap.valores_originais}")
+                self.logger.info(f"Valores únicos após padronização em {target}: {remap.valores_finais}")
+                if remap.valores_nao_mapeados:
+                    self.logger.warning(f"Valores não mapeados em {source}: {remap.valores_nao_mapeados}")
+
+            return {target: remap.values}
+
+        return [CompiledRule(rule['name'], [source], [], None, apply)]
+
+    def _compile_derived(self, rule: Dict) -> List[CompiledRule]:
+        if rule['function'] not in DERIVED_FUNCTIONS:
+            raise ValueError(f"Função derivada inválida: {rule['function']}. "
+                             f"Use uma das seguintes: {list(DERIVED_FUNCTIONS)}")
+
+        function, sources = DERIVED_FUNCTIONS[rule['function']]
+        target = rule['target']
+
+        def apply(get):
+            values = function(pd.DataFrame({col: get(col) for col in sources}))
+
+            self.logger.info(f"Distribuição de {target}:")
+            for value, count in values.value_counts().items():
+                self.logger.info(f"- {value}: {count} registros")
+            return {target: values}
+
+        return [CompiledRule(rule['name'], sources, [], None, apply)]
+
+    def _compile_drop(self, rule: Dict) -> List[CompiledRule]:
+        return [CompiledRule(rule['name'], [], list(rule['columns']), None, lambda get: {})]
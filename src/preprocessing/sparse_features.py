@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+@dataclass
+class SparseEncodedFrame:
+    """
+    Saída do DataEncoding em modo esparso.
+
+    As colunas indicadoras (OneHot e Feature Hashing) ficam em uma matriz CSR (a
+    maior parte dos valores é zero) e as demais colunas (numéricas, ordinais, target
+    encoded e o target) continuam em um DataFrame. Os nomes das colunas indicadoras
+    são mantidos à parte, na ordem das colunas da matriz.
+    """
+    frame: pd.DataFrame
+    onehot: sparse.csr_matrix
+    onehot_names: List[str]
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.frame), self.frame.shape[1] + self.onehot.shape[1]
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Nomes das colunas da matriz gerada por to_matrix (densas primeiro, depois as indicadoras)."""
+        return list(self.frame.columns) + list(self.onehot_names)
+
+    def with_frame(self, frame: pd.DataFrame) -> 'SparseEncodedFrame':
+        """Substitui a parte densa (mesmas linhas, colunas possivelmente diferentes)."""
+        return SparseEncodedFrame(frame, self.onehot, self.onehot_names)
+
+    def drop(self, columns: Iterable[str]) -> 'SparseEncodedFrame':
+        """Remove colunas da parte densa."""
+        return self.with_frame(self.frame.drop(columns=list(columns)))
+
+    def to_matrix(self, dtype=np.float32) -> sparse.csr_matrix:
+        """
+        Monta a matriz de features em CSR: colunas densas seguidas das colunas indicadoras.
+
+        As árvores do scikit-learn convertem a entrada para float32, então esse é o
+        dtype padrão, evitando uma cópia no fit.
+        """
+        dense = sparse.csr_matrix(self.frame.to_numpy(dtype=dtype))
+        return sparse.hstack([dense, self.onehot.astype(dtype, copy=False)], format='csr')
+
+    def memory_mb(self) -> float:
+        """Memória da parte densa e da matriz OneHot, em MB."""
+        return self.frame.memory_usage(deep=True).sum() / 1024 ** 2 + sparse_memory_mb(self.onehot)
+
+
+def sparse_memory_mb(matrix: sparse.csr_matrix) -> float:
+    """Memória de uma matriz CSR (valores + índices), em MB."""
+    return (matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes) / 1024 ** 2
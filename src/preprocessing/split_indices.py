@@ -0,0 +1,83 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config.inject_logger import inject_logger
+from preprocessing.kernels import compute_row_fingerprints
+
+
+@dataclass
+class SplitIndices:
+    """Posições (iloc) das linhas de treino, validação e teste."""
+    train: np.ndarray
+    valid: np.ndarray
+    test: np.ndarray
+
+    def order(self) -> np.ndarray:
+        """Posições de todas as linhas na ordem treino | validação | teste."""
+        return np.concatenate([self.train, self.valid, self.test])
+
+    def bounds(self) -> Tuple[int, int]:
+        """Fim do treino e fim da validação nas linhas reordenadas por order."""
+        return len(self.train), len(self.train) + len(self.valid)
+
+
+def target_fingerprint(y: pd.Series) -> str:
+    """
+    Identificador de conteúdo (sha256) da sequência de classes do target.
+
+    Os splits estratificados dependem só da sequência de classes (e dos parâmetros),
+    então esse é o fingerprint do dataset usado para guardar as posições. O índice
+    da Series não entra no cálculo.
+    """
+    digest = hashlib.sha256()
+    digest.update(compute_row_fingerprints(y.to_frame()).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@inject_logger
+class SplitIndexStore:
+    """
+    Posições dos splits persistidas em disco (.npz), por fingerprint do dataset e parâmetros.
+
+    Cada arquivo guarda as posições de treino, validação e teste e o fingerprint do
+    target de onde vieram; execuções seguintes sobre os mesmos dados reaproveitam as
+    posições em vez de refazer os sorteios.
+    """
+
+    def __init__(self, index_dir: Union[str, Path]):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(fingerprint: str, test_size: float, valid_size: float, random_state: int) -> str:
+        payload = repr((fingerprint, float(test_size), float(valid_size), random_state))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.index_dir / f"{key}.npz"
+
+    def load(self, key: str) -> Optional[SplitIndices]:
+        """Carrega as posições salvas (None se não houver)."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            indices = SplitIndices(data['train'], data['valid'], data['test'])
+        self.logger.info(f"Posições dos splits carregadas de {path}")
+        return indices
+
+    def save(self, key: str, indices: SplitIndices, fingerprint: str) -> Path:
+        """Grava as posições (arquivo temporário renomeado ao final)."""
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, train=indices.train, valid=indices.valid, test=indices.test, fingerprint=fingerprint)
+        os.replace(tmp_path, path)
+        self.logger.info(f"Posições dos splits salvas em {path}")
+        return path
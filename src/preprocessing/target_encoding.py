@@ -0,0 +1,194 @@
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import StratifiedKFold
+
+from config.inject_logger import inject_logger
+
+
+def _smoothed_encodings(counts: np.ndarray, prior: np.ndarray, smooth: Union[str, float]) -> np.ndarray:
+    """
+    Calcula as codificações suavizadas a partir das contagens por categoria e classe.
+
+    Cada classe é tratada como um alvo binário (um contra todos), como no TargetEncoder
+    do scikit-learn. Com smooth='auto' o peso da média da categoria é
+    n * var_y / (n * var_y + var_c) (empirical Bayes); com um número m, a
+    codificação é (soma + m * prior) / (n + m).
+
+    Args:
+        counts: Contagens (..., categorias, classes)
+        prior: Frequência de cada classe (..., classes)
+        smooth: 'auto' ou o peso m da média global
+
+    Returns:
+        Array com o mesmo formato de counts, com a codificação de cada categoria por classe
+    """
+    n = counts.sum(axis=-1, keepdims=True)
+    prior = np.expand_dims(prior, axis=-2)
+
+    if smooth == 'auto':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(n > 0, counts / n, prior)
+        var_category = mean * (1 - mean)
+        var_target = prior * (1 - prior)
+        denominator = n * var_target + var_category
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = np.where(denominator > 0, n * var_target / denominator, 0.0)
+        return weight * mean + (1 - weight) * prior
+
+    return (counts + smooth * prior) / (n + smooth)
+
+
+@inject_logger
+class BatchedTargetEncoder:
+    """
+    Target Encoding de várias colunas de uma vez, com uma codificação por classe.
+
+    O ajuste conta, em uma única passada agrupada (np.bincount sobre os códigos de
+    todas as colunas), quantas linhas de cada classe há em cada categoria. As
+    codificações suavizadas ficam em encodings_ (uma tabela categoria x classe por
+    coluna), e o transform é uma busca vetorizada nessas tabelas; categorias não
+    vistas no ajuste recebem a frequência global das classes (prior_).
+
+    Para o próprio conjunto de ajuste, fit_transform devolve codificações cruzadas
+    (cross-fitting): cada linha é codificada com as estatísticas das outras dobras,
+    o que evita que o modelo veja o próprio alvo da linha na feature.
+    """
+
+    def __init__(self, smooth: Union[str, float] = 'auto', cv: int = 5, random_state: int = 42):
+        """
+        Args:
+            smooth: 'auto' (empirical Bayes, como no TargetEncoder do scikit-learn) ou o peso m da média global
+            cv: Número de dobras do cross-fitting
+            random_state: Seed da divisão em dobras
+        """
+        self.smooth = smooth
+        self.cv = cv
+        self.random_state = random_state
+        self.classes_: np.ndarray = np.empty(0, dtype=object)
+        self.prior_: np.ndarray = np.empty(0)
+        self.encodings_: Dict[str, pd.DataFrame] = {}
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.encodings_)
+
+    def output_names(self, column: str) -> List[str]:
+        """Nomes das colunas geradas para column: uma por classe (uma só em alvos binários)."""
+        if len(self.classes_) == 2:
+            return [column]
+        return [f"{column}_{classe}" for classe in self.classes_]
+
+    def _count(self, df: pd.DataFrame, columns: List[str], y_codes: np.ndarray,
+               groups: np.ndarray, n_groups: int) -> Tuple[List[pd.Index], List[np.ndarray], np.ndarray]:
+        """
+        Conta as linhas por grupo (dobra), categoria e classe de todas as colunas em um único bincount.
+
+        Returns:
+            Categorias e códigos de cada coluna e as contagens (grupos, categorias de todas as colunas, classes)
+        """
+        n_classes = len(self.classes_)
+        categories, codes = [], []
+        offsets = [0]
+        for column in columns:
+            column_codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+            categories.append(pd.Index(uniques))
+            codes.append(column_codes)
+            offsets.append(offsets[-1] + len(uniques))
+
+        n_categories = offsets[-1]
+        keys = np.concatenate([
+            (groups * n_categories + column_codes + offset) * n_classes + y_codes
+            for column_codes, offset in zip(codes, offsets)
+        ]) if columns else np.empty(0, dtype=np.int64)
+        counts = np.bincount(keys, minlength=n_groups * n_categories * n_classes)
+        counts = counts.reshape(n_groups, n_categories, n_classes)
+
+        codes = [column_codes + offset for column_codes, offset in zip(codes, offsets)]
+        return categories, codes, counts
+
+    def _prepare_target(self, y: pd.Series) -> np.ndarray:
+        y_codes, self.classes_ = pd.factorize(y, sort=True)
+        self.classes_ = np.asarray(self.classes_, dtype=object)
+        return y_codes
+
+    def _store(self, columns: List[str], categories: List[pd.Index], counts: np.ndarray, prior: np.ndarray) -> None:
+        encodings = _smoothed_encodings(counts, prior, self.smooth)
+        start = 0
+        self.encodings_ = {}
+        for column, column_categories in zip(columns, categories):
+            stop = start + len(column_categories)
+            self.encodings_[column] = pd.DataFrame(
+                encodings[start:stop], index=column_categories, columns=self.classes_
+            )
+            start = stop
+        self.prior_ = prior
+
+    def fit(self, df: pd.DataFrame, columns: List[str], y: pd.Series) -> 'BatchedTargetEncoder':
+        """
+        Ajusta as codificações de todas as colunas.
+
+        Args:
+            df: DataFrame com as colunas a codificar
+            columns: Colunas a codificar
+            y: Alvo (multiclasse)
+        """
+        y_codes = self._prepare_target(y)
+        n_rows = len(y_codes)
+        categories, _, counts = self._count(df, columns, y_codes, np.zeros(n_rows, dtype=np.int64), 1)
+        prior = np.bincount(y_codes, minlength=len(self.classes_)) / max(n_rows, 1)
+        self._store(columns, categories, counts[0], prior)
+        self.logger.info(f"Target Encoding ajustado para {columns} ({len(self.classes_)} classes)")
+        return self
+
+    def fit_transform(self, df: pd.DataFrame, columns: List[str], y: pd.Series) -> Dict[str, np.ndarray]:
+        """
+        Ajusta as codificações e devolve as codificações cruzadas das linhas de df.
+
+        As estatísticas de cada dobra são as contagens totais menos as da própria
+        dobra, calculadas no mesmo bincount do ajuste.
+
+        Returns:
+            {coluna: array (linhas, colunas de saída)}
+        """
+        y_codes = self._prepare_target(y)
+        n_rows, n_classes = len(y_codes), len(self.classes_)
+
+        folds = np.zeros(n_rows, dtype=np.int64)
+        splitter = StratifiedKFold(n_splits=self.cv, shuffle=True, random_state=self.random_state)
+        for fold, (_, fold_rows) in enumerate(splitter.split(np.zeros(n_rows), y_codes)):
+            folds[fold_rows] = fold
+
+        categories, codes, counts = self._count(df, columns, y_codes, folds, self.cv)
+        total = counts.sum(axis=0)
+        class_counts = np.bincount(y_codes, minlength=n_classes)
+        self._store(columns, categories, total, class_counts / max(n_rows, 1))
+
+        # Estatísticas fora da dobra: total menos a dobra
+        fold_class_counts = np.stack([np.bincount(y_codes[folds == f], minlength=n_classes) for f in range(self.cv)])
+        out_of_fold_prior = (class_counts - fold_class_counts) / (n_rows - fold_class_counts.sum(axis=1, keepdims=True))
+        out_of_fold = _smoothed_encodings(total - counts, out_of_fold_prior, self.smooth)
+
+        self.logger.info(f"Target Encoding ajustado para {columns} ({n_classes} classes, {self.cv} dobras)")
+        return {
+            column: self._select_outputs(out_of_fold[folds, column_codes])
+            for column, column_codes in zip(columns, codes)
+        }
+
+    def _select_outputs(self, values: np.ndarray) -> np.ndarray:
+        # Em alvos binários, a codificação da classe positiva basta
+        return values[:, 1:] if len(self.classes_) == 2 else values
+
+    def transform_column(self, values: pd.Series, column: str) -> np.ndarray:
+        """
+        Codifica uma coluna com as estatísticas do ajuste (busca vetorizada).
+
+        Returns:
+            Array (linhas, colunas de saída)
+        """
+        encodings = self.encodings_[column]
+        codes = encodings.index.get_indexer(values)
+        # Última linha da tabela: prior, usado para categorias não vistas (código -1)
+        table = np.vstack([encodings.to_numpy(), self.prior_])
+        return self._select_outputs(table[codes])
@@ -10,6 +10,11 @@ class DataCleaningTransformer(BaseEstimator, TransformerMixin):
     def __init__(self):
         self.cleaner = DataCleaning()
     
+    @property
+    def cacheable(self) -> bool:
+        # Com índice de fingerprints a saída depende das cargas anteriores
+        return self.cleaner.fingerprint_index is None
+    
     def fit(self, X, y=None):
         return self
     
@@ -8,6 +8,9 @@ import pandas as pd
 @inject_logger
 class DataCollectionTransformer(BaseEstimator, TransformerMixin):
     """Transformador para etapa de coleta de dados"""
+    # Depende de fontes externas, não pode ser cacheado
+    cacheable = False
+    
     def __init__(self, collector: CollectData = None):
         self.collector = collector or CollectDataDetran()
     
@@ -1,4 +1,3 @@
-
 from sklearn.base import BaseEstimator, TransformerMixin
 
 from preprocessing.data_encoding_04 import DataEncoding
@@ -7,17 +6,48 @@ from config.inject_logger import inject_logger
 @inject_logger
 class DataEncodingTransformer(BaseEstimator, TransformerMixin):
     """Transformador para etapa de codificação de dados"""
-    def __init__(self):
-        self.encoder = DataEncoding()
+    # O cache de etapas guarda os encoders ajustados junto com a saída
+    cache_state = True
+    
+    def __init__(self, sparse_onehot: bool = False, max_categories_onehot: int = 5, hashing_columns=None,
+                 native_categorical: bool = False, target_smooth=None, target_cv=None, random_state: int = 42):
+        self.sparse_onehot = sparse_onehot
+        self.max_categories_onehot = max_categories_onehot
+        self.hashing_columns = hashing_columns
+        self.native_categorical = native_categorical
+        self.target_smooth = target_smooth
+        self.target_cv = target_cv
+        self.random_state = random_state
+        self.encoder = DataEncoding(
+            sparse_onehot=sparse_onehot,
+            hashing_columns=hashing_columns,
+            native_categorical=native_categorical,
+            target_smooth=target_smooth,
+            target_cv=target_cv,
+            random_state=random_state
+        )
         self.fitted = False
     
+    @property
+    def cacheable(self) -> bool:
+        # O cache grava as saídas em Parquet; a matriz OneHot esparsa não é servida por ele
+        return not self.sparse_onehot
+    
     def fit(self, X, y=None):
         if not self.fitted:
             self.logger.info("Ajustando codificador de dados...")
-            self.encoder.fit(X, 'gravidade_acidente')
+            self.encoder.fit(X, 'gravidade_acidente', self.max_categories_onehot)
             self.fitted = True
         return self
     
+    def fit_transform(self, X, y=None):
+        if self.fitted:
+            return self.transform(X)
+        # Ajuste e transformação juntos: o Target Encoding das linhas de X é cruzado
+        self.logger.info("Ajustando e aplicando codificador de dados...")
+        self.fitted = True
+        return self.encoder.fit_transform(X, 'gravidade_acidente', self.max_categories_onehot)
+    
     def transform(self, X):
         self.logger.info("Iniciando codificação de dados...")
-        return self.encoder.transform(X, 'gravidade_acidente')
\ No newline at end of file
+        return self.encoder.transform(X, 'gravidade_acidente')
@@ -8,6 +8,9 @@ from data_collection.merge_datasets import DatasetMerger
 @inject_logger
 class DatasetMergerTransformer(BaseEstimator, TransformerMixin):
     """Transformador para etapa de união dos datasets"""
+    # Lê os arquivos baixados, não pode ser cacheado
+    cacheable = False
+    
     def __init__(self, merger: DatasetMerger = None, dataset_type: Literal['base', 'complete'] = 'base'):
         """
         Inicializa o transformador de união de datasets.
@@ -1,6 +1,8 @@
+from typing import Dict, Optional
 
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from preprocessing.checkpoint_writer import CheckpointWriter
 from preprocessing.feature_engineering_03 import FeatureEngineering
 from config.inject_logger import inject_logger
 
@@ -8,12 +10,44 @@ from config.inject_logger import inject_logger
 @inject_logger
 class FeatureEngineeringTransformer(BaseEstimator, TransformerMixin):
     """Transformador para etapa de engenharia de features"""
-    def __init__(self):
-        self.feature_engineer = FeatureEngineering()
+    # O cache de etapas guarda as frequências ajustadas junto com a saída
+    cache_state = True
+    
+    def __init__(self, checkpoint_writer: Optional[CheckpointWriter] = None):
+        self.checkpoint_writer = checkpoint_writer
+        self.feature_engineer = FeatureEngineering(checkpoint_writer=checkpoint_writer)
+        # Frequências das regras com frequência mínima (causas raras), ajustadas no fit
+        self.statistics: Optional[Dict[str, Dict]] = None
+    
+    @property
+    def writes_checkpoint(self) -> bool:
+        # Com checkpoints ativos, a saída servida pelo cache também é gravada (ver write_checkpoint)
+        return self.feature_engineer.checkpoint_writer.enabled
+    
+    def write_checkpoint(self, X):
+        """Grava o checkpoint do feature engineering a partir de uma saída lida do cache."""
+        self.feature_engineer.salvar_dataset(X, FeatureEngineering.CHECKPOINT_NAME)
+    
+    def set_params(self, **params):
+        super().set_params(**params)
+        if 'checkpoint_writer' in params:
+            self.feature_engineer.checkpoint_writer = self.checkpoint_writer or CheckpointWriter()
+        return self
+    
+    def __getstate__(self):
+        # As regras compiladas (funções locais) não são serializáveis; só o estado ajustado é
+        # gravado, e o FeatureEngineering é recriado na leitura
+        return {'statistics': self.statistics}
+    
+    def __setstate__(self, state):
+        # Etapas restauradas (cache ou artefato) não gravam checkpoints
+        self.__init__(checkpoint_writer=CheckpointWriter(enabled=False))
+        self.statistics = state['statistics']
     
     def fit(self, X, y=None):
+        self.statistics = self.feature_engineer.frequency_statistics(X)
         return self
     
     def transform(self, X):
         self.logger.info("Iniciando engenharia de features...")
-        return self.feature_engineer.criar_todas_features(X)
\ No newline at end of file
+        return self.feature_engineer.criar_todas_features(X, statistics=self.statistics)
@@ -9,7 +9,7 @@ import pandas as pd
 
 from eda.exploratory_analysis import AnaliseExploratoria
 from lab.hiperparameter_optimization import ModelOptimizer
-from pipelines.model_pipeline import ModelingPipeline, create_tree_based_models
+from pipelines.model_pipeline import ModelingPipeline, create_categorical_models, create_tree_based_models
 from pipelines.preprocessing_pipeline import PreprocessingPipeline
 
 def parse_args():
@@ -25,8 +25,10 @@ def parse_args():
     parser.add_argument('--valid-size', type=float, default=0.2,
                        help='Proporção do conjunto de validação')
     parser.add_argument('--balance', type=str, default='smote',
-                       choices=['smote', 'none'],
-                       help='Estratégia de balanceamento')
+                       choices=['smote', 'fast_smote', 'sample_weight', 'budgeted', 'none'],
+                       help='Estratégia de balanceamento (fast_smote: SMOTE com vizinhos em paralelo/aproximados; '
+                            'sample_weight: pesos por amostra no fit, sem novas linhas; '
+                            'budgeted: under/oversampling dentro do orçamento de balancing.budget)')
     parser.add_argument('--dataset-type', type=str, default='base',
                        help='Tipo de dataset a ser usado')
     parser.add_argument('--collect-new-data', action='store_true',
@@ -37,6 +39,27 @@ def parse_args():
                        help='Execute exploratory data analysis')
     parser.add_argument('--optimization-trials', type=int, default=100,
                        help='Number of trials for hyperparameter optimization')
+    parser.add_argument('--copy-free', action='store_true',
+                       help='Executa o pré-processamento com copy-on-write (sem cópias completas por etapa)')
+    parser.add_argument('--track-memory', action='store_true',
+                       help='Registra o pico de memória (RSS) de cada etapa do pré-processamento')
+    parser.add_argument('--no-checkpoints', action='store_true',
+                       help='Não grava os checkpoints intermediários do pré-processamento')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                       help='Executa limpeza, padronização e feature engineering em blocos de N linhas')
+    parser.add_argument('--n-jobs', type=int, default=None,
+                       help='Executa limpeza, padronização e feature engineering em N processos')
+    parser.add_argument('--compact-dtypes', action='store_true',
+                       help='Gera as matrizes de treino/validação/teste com dtypes compactos (uint8/int16/float32)')
+    parser.add_argument('--sparse-onehot', action='store_true',
+                       help='Mantém as colunas OneHot em matrizes esparsas (CSR) até os modelos')
+    parser.add_argument('--native-categorical', action='store_true',
+                       help='Sem OneHot/Target Encoding: colunas categóricas como códigos, só modelos com categorias nativas (CatBoost)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Grava o perfil de cada etapa do pré-processamento (tempo, CPU, memória, linhas/colunas) '
+                            'em preprocessing_profile.json no diretório de resultados')
+    parser.add_argument('--save-artifact', nargs='?', const='', default=None, metavar='CAMINHO',
+                       help='Salva o pré-processamento ajustado para scoring (padrão: artifact.path do config.yaml)')
     return parser.parse_args()
 
 def main():
@@ -66,13 +89,28 @@ def main():
         test_size=args.test_size,
         valid_size=args.valid_size,
         balance_strategy=args.balance,
-        random_state=args.random_state
+        random_state=args.random_state,
+        copy_free=args.copy_free,
+        track_memory=args.track_memory,
+        checkpoints=False if args.no_checkpoints else None,
+        chunk_size=args.chunk_size,
+        n_jobs=args.n_jobs,
+        compact_dtypes=args.compact_dtypes,
+        sparse_onehot=args.sparse_onehot,
+        native_categorical=args.native_categorical,
+        profile=args.profile
     )
     
     # Process data
     logger.info("Iniciando processamento dos dados...")
     X_train, X_valid, X_test, y_train, y_valid, y_test = preprocessing.process_data()
     
+    if args.profile:
+        preprocessing.save_profile(os.path.join(args.output_dir, 'preprocessing_profile.json'))
+    
+    if args.save_artifact is not None:
+        preprocessing.save_artifact(args.save_artifact or None)
+    
     if args.exploratory_analysis:
         logger.info("Executando análise exploratória...")
         
@@ -96,8 +134,19 @@ def main():
         
         optimizer = ModelOptimizer(output_dir=os.path.join(args.output_dir, 'otimizacao'))
         best_params = optimizer.optimize_all_models(X_train, y_train,
-                                                  n_trials=args.optimization_trials)
-        
+                                                  n_trials=args.optimization_trials,
+                                                  cat_features=preprocessing.categorical_features,
+                                                  sample_weight=preprocessing.sample_weight)
+    else:
+        best_params = {}
+    
+    if args.native_categorical:
+        tree_models = create_categorical_models(
+            random_state=args.random_state,
+            n_estimators=args.n_estimators,
+            cb_params=best_params.get('CatBoost')
+        )
+    elif args.optimize_hyperparameters:
         tree_models = create_tree_based_models(
             random_state=args.random_state,
             n_estimators=args.n_estimators,
@@ -113,13 +162,16 @@ def main():
     
     all_models = tree_models
     
-    modeling_pipeline = ModelingPipeline(all_models, output_dir=args.output_dir)
+    modeling_pipeline = ModelingPipeline(all_models, output_dir=args.output_dir,
+                                         cat_features=preprocessing.categorical_features,
+                                         sample_weight=preprocessing.sample_weight)
     
     logger.info("Executando pipeline de modelagem...")
     results, comparison_df = modeling_pipeline.run_pipeline(
         X_train, X_valid, X_test,
         y_train, y_valid, y_test,
-        classes=sorted(y_train.unique())
+        classes=sorted(y_train.unique()),
+        feature_names=preprocessing.feature_names
     )
     
     logger.info("\nComparação final dos modelos:")
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Os módulos do projeto são importados a partir de src/ (ex.: preprocessing.kernels)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from preprocessing.balancing_strategy import BudgetedBalancing
+from preprocessing.balancing_strategy.budgeted_balancing import bytes_per_row, water_fill
+
+_MB = 1024 * 1024
+
+
+def dados_desbalanceados():
+    rng = np.random.default_rng(0)
+    y = pd.Series(['a'] * 1000 + ['b'] * 100 + ['c'] * 50, name='gravidade')
+    X = pd.DataFrame(rng.normal(size=(len(y), 4)), columns=['x1', 'x2', 'x3', 'x4'])
+    return X, y
+
+
+def test_water_fill_abaixo_do_orcamento_nao_altera():
+    targets = {'a': 100, 'b': 100, 'c': 50}
+
+    assert water_fill(targets, 250) == targets
+    assert water_fill(targets, 1000) == targets
+
+
+def test_water_fill_limita_a_majoritaria_ao_teto():
+    # Teto: (600 - 50 - 100) = 450 para a única classe acima dele
+    assert water_fill({'a': 1000, 'b': 100, 'c': 50}, 600) == {'a': 450, 'b': 100, 'c': 50}
+
+
+def test_plan_usa_class_targets():
+    X, y = dados_desbalanceados()
+
+    plan = BudgetedBalancing(class_targets={'c': 300}, oversampler='random_over').plan(X, y)
+
+    assert plan['targets'] == {'a': 1000, 'b': 1000, 'c': 300}
+    assert plan['budget_rows'] is None
+    assert plan['expected_rows'] == 2300
+
+
+def test_plan_converte_max_memory_mb_em_linhas():
+    X, y = dados_desbalanceados()
+    max_memory_mb = 0.05
+
+    plan = BudgetedBalancing(max_memory_mb=max_memory_mb, oversampler='random_over').plan(X, y)
+
+    assert plan['bytes_per_row'] == bytes_per_row(X)
+    assert plan['budget_rows'] == int(max_memory_mb * _MB // bytes_per_row(X))
+    assert plan['expected_rows'] <= plan['budget_rows']
+    assert plan['expected_mb'] <= max_memory_mb
+
+
+@pytest.mark.parametrize('oversampler', ['random_over', 'smote', 'fast_smote'])
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'max_rows': 600, 'class_targets': {'b': 100, 'c': 50}},
+    {'max_rows': 900},
+    {'max_memory_mb': 0.05, 'class_targets': {'c': 300}}
+])
+def test_apply_produz_as_linhas_previstas_pelo_plan(oversampler, kwargs):
+    X, y = dados_desbalanceados()
+    strategy = BudgetedBalancing(oversampler=oversampler, **kwargs)
+
+    plan = strategy.plan(X, y)
+    X_balanced, y_balanced = strategy.apply(X, y, random_state=42)
+
+    assert len(y_balanced) == len(X_balanced) == plan['expected_rows']
+    assert pd.Series(y_balanced).value_counts().to_dict() == plan['targets']
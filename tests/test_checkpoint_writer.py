@@ -0,0 +1,15 @@
+import pandas as pd
+import pytest
+
+from preprocessing.checkpoint_writer import CheckpointWriter
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'csv'])
+def test_read_le_o_checkpoint_no_formato_configurado(tmp_path, file_format):
+    df = pd.DataFrame({'municipio': ['A', 'B'], 'mortos': [0, 1]})
+    writer = CheckpointWriter(enabled=True, file_format=file_format, background=True, output_dir=str(tmp_path))
+
+    path = writer.write(df, 'checkpoint')
+
+    assert path.suffix == f".{file_format}"
+    pd.testing.assert_frame_equal(writer.read('checkpoint'), df)
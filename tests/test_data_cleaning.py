@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from preprocessing.data_cleaning_01 import DataCleaning
+
+
+def test_handle_missing_values_coluna_object_inteiramente_nula():
+    df = pd.DataFrame({
+        'municipio': ['A', 'B', 'C'],
+        'regional': pd.Series([None, np.nan, None], dtype=object)
+    })
+
+    resultado = DataCleaning(fingerprint_index_path="").handle_missing_values(df)
+
+    assert resultado.empty
+    assert list(resultado.columns) == ['municipio', 'regional']
+
+
+def test_handle_missing_values_remove_variacoes_de_null():
+    df = pd.DataFrame({'municipio': ['A', 'NULL', ' ', None, 'B'], 'mortos': [0, 1, 2, 3, np.nan]})
+
+    resultado = DataCleaning(fingerprint_index_path="").handle_missing_values(df)
+
+    assert resultado['municipio'].tolist() == ['A']
+
+
+def test_indice_de_fingerprints_gravado_so_no_commit(tmp_path):
+    path = tmp_path / "index.npy"
+    df = pd.DataFrame({'municipio': ['A', 'B', 'A'], 'mortos': [0, 1, 0]})
+
+    cleaner = DataCleaning(fingerprint_index_path=str(path))
+    assert len(cleaner.apply(df)) == 2
+    assert not path.exists()
+
+    cleaner.commit_fingerprints()
+    assert len(DataCleaning(fingerprint_index_path=str(path)).apply(df)) == 0
+
+
+def test_rollback_descarta_linhas_pendentes(tmp_path):
+    path = tmp_path / "index.npy"
+    df = pd.DataFrame({'municipio': ['A', 'B'], 'mortos': [0, 1]})
+
+    cleaner = DataCleaning(fingerprint_index_path=str(path))
+    cleaner.apply(df)
+    cleaner.rollback_fingerprints()
+    cleaner.commit_fingerprints()
+
+    assert not path.exists()
+    assert len(cleaner.apply(df)) == 2
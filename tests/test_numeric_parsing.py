@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from preprocessing.kernels import parse_br_count
+
+
+def test_parse_br_count_inf_vira_zero():
+    assert parse_br_count(pd.Series(["inf", "-inf", "2"], dtype=object)).tolist() == [0, 0, 2]
+    assert parse_br_count(pd.Series([np.inf, -np.inf, np.nan, -2.7])).tolist() == [0, 0, 0, 2]
+
+
+def test_parse_br_count_nao_interpreta_notacao_exponencial():
+    assert parse_br_count(pd.Series(["1e3", "2E5"], dtype=object)).tolist() == [1, 2]
+
+
+def test_parse_br_count_mantem_semantica_da_extracao_por_regex():
+    series = pd.Series([" 12 km", "1,7", ".5", "-3", None, "NULL"], dtype=object)
+
+    assert parse_br_count(series).tolist() == [12, 1, 5, 3, 0, 0]
+
+
+def test_parse_br_count_coluna_numerica_segue_a_extracao_do_texto():
+    # str(1e-05) e str(1e+20) usam notação exponencial: a extração original lê só a mantissa
+    assert parse_br_count(pd.Series([1e-05, 1e20])).tolist() == [1, 1]
+    assert parse_br_count(pd.Series([1e-05, 1e20]).astype(str)).tolist() == [1, 1]
+    assert parse_br_count(pd.Series([2.5, -3.0, 7, np.nan])).tolist() == [2, 3, 7, 0]
+
+
+def test_parse_br_count_limita_ao_intervalo_de_int64():
+    resultado = parse_br_count(pd.Series(["99999999999999999999"], dtype=object))
+
+    assert resultado.tolist() == [int(np.nextafter(2.0 ** 63, 0))]
@@ -0,0 +1,57 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from lab.synthetic_data import gerar_datatran
+from pipelines.parallel_execution import ParallelPreprocessor
+from preprocessing.checkpoint_writer import CheckpointWriter
+from preprocessing.data_cleaning_01 import DataCleaning
+from preprocessing.feature_engineering_03 import FeatureEngineering
+from preprocessing.rules_engine import RuleEngine
+
+
+def preprocessor(**kwargs) -> ParallelPreprocessor:
+    return ParallelPreprocessor(
+        cleaner=DataCleaning(fingerprint_index_path=""),
+        feature_engineer=FeatureEngineering(checkpoint_writer=CheckpointWriter(enabled=False)),
+        **kwargs
+    )
+
+
+def test_rule_engine_serializavel_recompila_as_regras():
+    engine = RuleEngine()
+    restored = pickle.loads(pickle.dumps(engine))
+
+    assert restored.spec == engine.spec
+    assert [len(group) for group in restored.stages['standardize']] == \
+        [len(group) for group in engine.stages['standardize']]
+
+
+def test_spawn_reproduz_execucao_no_proprio_processo():
+    df = gerar_datatran(2_000)
+
+    esperado = preprocessor(n_jobs=1, partition_size=500).run(df)
+    obtido = preprocessor(n_jobs=2, partition_size=500, start_method='spawn').run(df)
+
+    pd.testing.assert_frame_equal(obtido, esperado)
+
+
+def test_start_method_invalido():
+    with pytest.raises(ValueError):
+        preprocessor(start_method='thread')
+
+
+def test_indice_de_fingerprints_gravado_so_apos_a_execucao_completa(tmp_path):
+    path = tmp_path / "index.npy"
+    df = gerar_datatran(500)
+    processor = preprocessor(n_jobs=1)
+    processor.cleaner = DataCleaning(fingerprint_index_path=str(path))
+
+    processor.run(df, commit=False)
+    assert not path.exists()
+
+    processor.cleaner.commit_fingerprints()
+    processor = preprocessor(n_jobs=1)
+    processor.cleaner = DataCleaning(fingerprint_index_path=str(path))
+    assert len(processor.run(df)) == 0
@@ -0,0 +1,63 @@
+import pytest
+
+from lab.synthetic_data import gerar_datatran
+from pipelines.preprocessing_pipeline import PreprocessingPipeline
+from pipelines.stage_cache import StageCache
+from preprocessing.data_cleaning_01 import DataCleaning
+
+
+def pipeline_com_indice(path) -> PreprocessingPipeline:
+    pipeline = PreprocessingPipeline(collect_new_data=False, use_cache=False, checkpoints=False, index_split=False)
+    pipeline.pipeline.named_steps['cleaning'].cleaner = DataCleaning(fingerprint_index_path=str(path))
+    return pipeline
+
+
+def test_indice_de_fingerprints_nao_gravado_se_a_execucao_falha(tmp_path, monkeypatch):
+    path = tmp_path / "index.npy"
+    pipeline = pipeline_com_indice(path)
+
+    def falha(*args, **kwargs):
+        raise RuntimeError("falha no split")
+
+    monkeypatch.setattr(pipeline.data_splitter, 'prepare_data', falha)
+    with pytest.raises(RuntimeError):
+        pipeline.process_data(gerar_datatran(1_000))
+
+    assert not path.exists()
+    assert len(pipeline.pipeline.named_steps['cleaning'].cleaner.pending_fingerprints) == 0
+
+
+def test_indice_de_fingerprints_gravado_apos_a_execucao_completa(tmp_path):
+    path = tmp_path / "index.npy"
+    pipeline_com_indice(path).process_data(gerar_datatran(1_000))
+
+    assert path.exists()
+    assert len(DataCleaning(fingerprint_index_path=str(path)).fingerprint_index) > 0
+
+
+def pipeline_com_cache(tmp_path) -> PreprocessingPipeline:
+    # Configuração padrão (checkpoints ativos), com cache e checkpoints em tmp_path
+    pipeline = PreprocessingPipeline(collect_new_data=False, use_cache=True, index_split=False)
+    pipeline.stage_cache = StageCache(tmp_path / "cache")
+    pipeline.checkpoint_writer.output_dir = tmp_path / "processed"
+    return pipeline
+
+
+def test_segunda_execucao_serve_todas_as_etapas_do_cache(tmp_path):
+    df = gerar_datatran(1_000)
+    checkpoint = tmp_path / "processed" / "datatran_ma_processado.parquet"
+    primeira = pipeline_com_cache(tmp_path).process_data(df)
+    assert checkpoint.exists()
+    checkpoint.unlink()
+
+    pipeline = pipeline_com_cache(tmp_path)
+    for _ in range(2):
+        pipeline.stage_cache.stats.update(hits=0, misses=0)
+        segunda = pipeline.process_data(df)
+
+        assert pipeline.stage_cache.stats['misses'] == 0
+        assert pipeline.stage_cache.stats['hits'] == 4
+        # Com a saída do feature engineering vinda do cache, o checkpoint é gravado de novo
+        assert checkpoint.exists()
+        for esperado, obtido in zip(primeira, segunda):
+            assert esperado.equals(obtido)
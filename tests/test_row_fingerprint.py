@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from preprocessing.kernels import FINGERPRINT_SCHEME_VERSION, FingerprintIndex, compute_row_fingerprints
+
+
+def test_fingerprints_iguais_ao_hash_do_dataframe_normalizado():
+    df = pd.DataFrame({'b': ['x', None, 'y'], 'a': pd.array([1, 2, None], dtype='Int64')})
+    normalized = pd.DataFrame({'a': [1.0, 2.0, np.nan], 'b': ['x', None, 'y']})
+
+    np.testing.assert_array_equal(
+        compute_row_fingerprints(df).to_numpy(),
+        pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+    )
+
+
+def test_indice_salvo_com_a_versao_do_esquema(tmp_path):
+    index = FingerprintIndex(tmp_path / "index.npy")
+    index.update(np.array([3, 1, 2], dtype=np.uint64))
+    index.save()
+
+    with np.load(tmp_path / "index.npy") as data:
+        assert int(data['scheme']) == FINGERPRINT_SCHEME_VERSION
+    np.testing.assert_array_equal(FingerprintIndex(tmp_path / "index.npy").fingerprints, [1, 2, 3])
+
+
+def test_indice_de_outro_esquema_e_reconstruido(tmp_path):
+    path = tmp_path / "index.npy"
+    with open(path, 'wb') as f:
+        np.savez(f, fingerprints=np.array([1, 2], dtype=np.uint64), scheme=np.int64(FINGERPRINT_SCHEME_VERSION + 1))
+
+    assert len(FingerprintIndex(path)) == 0
+
+
+def test_indice_npy_sem_versao_usa_o_esquema_1(tmp_path):
+    path = tmp_path / "index.npy"
+    np.save(path, np.array([1, 2], dtype=np.uint64))
+
+    assert len(FingerprintIndex(path)) == (2 if FINGERPRINT_SCHEME_VERSION == 1 else 0)
@@ -0,0 +1,42 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from preprocessing.kernels import classify_severity
+
+
+def classificar_gravidade_linha(row) -> str:
+    """Regra original (linha a linha) usada como referência."""
+    if row['mortos'] > 0:
+        return 'fatal'
+    elif row['feridos_graves'] > 1 or row['feridos_leves']>= 3:
+        return 'grave'
+    elif row['feridos_leves'] > 0 or row['feridos_graves'] == 1:
+        return 'moderado'
+    else:
+        return 'leve'
+
+
+def test_classify_severity_igual_a_regra_original_nas_fronteiras():
+    # Todas as combinações em torno das fronteiras das regras (mortos > 0,
+    # feridos_graves == 1 / > 1, feridos_leves > 0 / >= 3)
+    grade = pd.DataFrame(
+        list(itertools.product(range(3), range(4), range(5))),
+        columns=['mortos', 'feridos_graves', 'feridos_leves']
+    )
+
+    esperado = grade.apply(classificar_gravidade_linha, axis=1)
+    pd.testing.assert_series_equal(classify_severity(grade), esperado, check_names=False)
+
+
+def test_classify_severity_igual_a_regra_original_em_amostra_aleatoria():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'feridos_leves': rng.choice([0, 0, 0, 1, 1, 2, 3, 4], 5_000),
+        'feridos_graves': rng.choice([0, 0, 0, 0, 1, 2], 5_000),
+        'mortos': rng.choice([0] * 9 + [1, 2], 5_000)
+    }, index=rng.permutation(5_000))
+
+    esperado = df.apply(classificar_gravidade_linha, axis=1)
+    pd.testing.assert_series_equal(classify_severity(df), esperado, check_names=False)
@@ -0,0 +1,40 @@
+from sklearn.base import clone
+
+from pipelines.preprocessing_pipeline import PreprocessingPipeline
+from pipelines.stage_cache import StageCache
+from preprocessing.transformers import DataEncodingTransformer
+
+
+def test_stage_key_inclui_configuracao_do_target_encoding(tmp_path):
+    cache = StageCache(tmp_path)
+    padrao = DataEncodingTransformer(hashing_columns={}, target_smooth="auto", target_cv=5)
+    suavizado = DataEncodingTransformer(hashing_columns={}, target_smooth=100, target_cv=5)
+    outras_dobras = DataEncodingTransformer(hashing_columns={}, target_smooth="auto", target_cv=3)
+    outra_seed = DataEncodingTransformer(hashing_columns={}, target_smooth="auto", target_cv=5, random_state=7)
+
+    chaves = {
+        cache.stage_key("entrada", "encoding", step)
+        for step in (padrao, suavizado, outras_dobras, outra_seed)
+    }
+
+    assert len(chaves) == 4
+    assert suavizado.encoder.target_encoder.smooth == 100
+    assert outras_dobras.encoder.target_encoder.cv == 3
+    assert outra_seed.encoder.target_encoder.random_state == 7
+
+
+def test_encoding_transformer_clonavel_com_target_encoding():
+    step = DataEncodingTransformer(hashing_columns={}, target_smooth=100, target_cv=3)
+
+    clonado = clone(step)
+
+    assert clonado.get_params()['target_smooth'] == 100
+    assert clonado.encoder.target_cv == 3
+
+
+def test_pipeline_repassa_random_state_ao_target_encoding():
+    pipeline = PreprocessingPipeline(collect_new_data=False, use_cache=False, checkpoints=False, random_state=7)
+    step = pipeline.pipeline.named_steps['encoding']
+
+    assert step.get_params()['random_state'] == 7
+    assert step.encoder.target_encoder.random_state == 7